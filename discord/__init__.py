@@ -48,6 +48,7 @@ from .reaction import *
 from . import (
     utils as utils,
     opus as opus,
+    pcm as pcm,
     abc as abc,
     ui as ui,
     app_commands as app_commands,
@@ -57,6 +58,7 @@ from .embeds import *
 from .mentions import *
 from .shard import *
 from .player import *
+from .sinks import *
 from .webhook import *
 from .voice_client import *
 from .audit_logs import *
@@ -73,6 +75,7 @@ from .poll import *
 from .soundboard import *
 from .subscription import *
 from .presences import *
+from .metrics import *
 
 
 class VersionInfo(NamedTuple):
@@ -28,11 +28,13 @@ import copy
 import time
 import secrets
 import asyncio
+import weakref
 from datetime import datetime
 from typing import (
     Any,
     AsyncIterator,
     Callable,
+    ClassVar,
     Dict,
     Iterable,
     List,
@@ -330,17 +332,31 @@ class PrivateChannel:
 
 
 class _Overwrites:
-    __slots__ = ('id', 'allow', 'deny', 'type')
+    __slots__ = ('id', 'allow', 'deny', 'type', '__weakref__')
 
     ROLE = 0
     MEMBER = 1
 
+    # Identical overwrites, e.g. a muted role denying send messages, tend to be
+    # repeated on most channels of a guild. These are never mutated after creation
+    # so every channel shares a single instance.
+    _cache: ClassVar[weakref.WeakValueDictionary[Tuple[int, int, int, int], _Overwrites]] = weakref.WeakValueDictionary()
+
     def __init__(self, data: PermissionOverwritePayload) -> None:
         self.id: int = int(data['id'])
-        self.allow: int = int(data.get('allow', 0))
-        self.deny: int = int(data.get('deny', 0))
+        self.allow: int = utils._intern_int(int(data.get('allow', 0)))
+        self.deny: int = utils._intern_int(int(data.get('deny', 0)))
         self.type: OverwriteType = data['type']
 
+    @classmethod
+    def _from_data(cls, data: PermissionOverwritePayload) -> _Overwrites:
+        key = (int(data['id']), int(data.get('allow', 0)), int(data.get('deny', 0)), data['type'])
+        try:
+            return cls._cache[key]
+        except KeyError:
+            overwrite = cls._cache[key] = cls(data)
+            return overwrite
+
     def _asdict(self) -> PermissionOverwritePayload:
         return {
             'id': self.id,
@@ -544,7 +560,7 @@ class GuildChannel:
         everyone_id = self.guild.id
 
         for index, overridden in enumerate(data.get('permission_overwrites', [])):
-            overwrite = _Overwrites(overridden)
+            overwrite = _Overwrites._from_data(overridden)
             self._overwrites.append(overwrite)
 
             if overwrite.type == _Overwrites.MEMBER:
@@ -56,7 +56,7 @@ from .widget import Widget
 from .guild import Guild, GuildPreview
 from .emoji import Emoji
 from .channel import _threaded_channel_factory, PartialMessageable
-from .enums import ChannelType, EntitlementOwnerType
+from .enums import ChannelType, EntitlementOwnerType, GuildCacheLevel
 from .mentions import AllowedMentions
 from .errors import *
 from .enums import Status
@@ -69,6 +69,7 @@ from .state import ConnectionState
 from . import utils
 from .utils import MISSING, time_snowflake
 from .object import Object
+from .metrics import CacheStats
 from .backoff import ExponentialBackoff
 from .webhook import Webhook
 from .appinfo import AppInfo
@@ -120,6 +121,7 @@ if TYPE_CHECKING:
     from .audit_logs import AuditLogEntry
     from .poll import PollAnswer
     from .subscription import Subscription
+    from .metrics import GatewayMetrics
 
 
 # fmt: off
@@ -196,6 +198,22 @@ class Client:
         currently selected intents.
 
         .. versionadded:: 1.5
+    cache_flags: :class:`CacheFlags`
+        Allows for finer control over which guild entities, such as channels, threads,
+        roles, emojis or voice states, the library caches. If not given, defaults to
+        caching everything.
+
+        .. versionadded:: 2.6
+    guild_cache_policy: Optional[Callable[[:class:`int`, :class:`dict`], :class:`GuildCacheLevel`]]
+        A callable that decides how much state to cache for each guild, called with the
+        guild ID and raw payload of every ``GUILD_CREATE``. Guilds that it returns
+        :attr:`GuildCacheLevel.minimal` for are only kept as a skeleton with their
+        ID, name, owner and member count, which cuts memory usage for bots that only
+        need full state for a subset of their guilds. Defaults to caching every guild fully.
+
+        See also :meth:`set_guild_cache_level`.
+
+        .. versionadded:: 2.6
     chunk_guilds_at_startup: :class:`bool`
         Indicates if :func:`.on_ready` should be delayed to chunk all guilds
         at start-up if necessary. This operation is incredibly slow for large
@@ -265,6 +283,13 @@ class Client:
         behavior, such as setting a dns resolver or sslcontext.
 
         .. versionadded:: 2.5
+    audio_scheduler: Optional[:class:`AudioScheduler`]
+        A shared audio scheduler that drives playback for every :class:`VoiceClient`
+        of this client, rather than starting a dedicated thread per player.
+        Useful when hosting many simultaneous voice connections.
+        Defaults to ``None``.
+
+        .. versionadded:: 2.6
 
     Attributes
     -----------
@@ -353,6 +378,43 @@ class Client:
         ws = self.ws
         return float('nan') if not ws else ws.latency
 
+    @property
+    def gateway_metrics(self) -> Optional[GatewayMetrics]:
+        """Optional[:class:`.GatewayMetrics`]: Traffic statistics for the gateway connection.
+
+        ``None`` if the client has not connected yet. When using :class:`AutoShardedClient`
+        use :attr:`ShardInfo.metrics` to retrieve the metrics of each shard instead.
+
+        .. versionadded:: 2.6
+        """
+        return self._connection._gateway_metrics.get(self.shard_id)
+
+    def cache_stats(self, *, estimate_size: bool = True) -> CacheStats:
+        """Returns a snapshot of what the internal cache currently holds.
+
+        This reports the number of cached guilds, members, users, channels, threads,
+        roles, emojis, messages and views along with an approximation of how many
+        bytes each of them use.
+
+        .. note::
+
+            Estimating sizes walks every cached object and can take a while
+            for large bots. Pass ``estimate_size=False`` if you only need the counts.
+
+        .. versionadded:: 2.6
+
+        Parameters
+        -----------
+        estimate_size: :class:`bool`
+            Whether to estimate the size of the cached objects. Defaults to ``True``.
+
+        Returns
+        --------
+        :class:`.CacheStats`
+            The cache snapshot.
+        """
+        return CacheStats._from_state(self._connection, estimate_size=estimate_size)
+
     def is_ws_ratelimited(self) -> bool:
         """:class:`bool`: Whether the websocket is currently rate limited.
 
@@ -1073,6 +1135,47 @@ class Client:
         """
         return self._connection._get_guild(id)
 
+    async def set_guild_cache_level(self, guild: Snowflake, level: GuildCacheLevel, /) -> Guild:
+        """|coro|
+
+        Changes how much state is cached for a guild at runtime.
+
+        Demoting a guild to :attr:`GuildCacheLevel.minimal` drops its channels, threads,
+        roles other than @everyone, emojis, stickers, voice states and members immediately.
+
+        Promoting a guild to :attr:`GuildCacheLevel.full` re-fetches its state over HTTP,
+        since the gateway does not resend guild data on demand. Members are then chunked
+        if the client would normally chunk the guild. Voice states and stage instances
+        are only filled in again as their gateway events arrive.
+
+        .. versionadded:: 2.6
+
+        Parameters
+        -----------
+        guild: :class:`~discord.abc.Snowflake`
+            The guild to change the cache level of.
+        level: :class:`GuildCacheLevel`
+            The new cache level.
+
+        Raises
+        -------
+        ClientException
+            The guild is not in the cache.
+        HTTPException
+            Fetching the guild's state failed.
+
+        Returns
+        --------
+        :class:`.Guild`
+            The cached guild.
+        """
+        cached = self._connection._get_guild(guild.id)
+        if cached is None:
+            raise ClientException(f'Guild ID {guild.id} is not in the cache')
+
+        await self._connection.set_guild_cache_level(cached, level)
+        return cached
+
     def get_user(self, id: int, /) -> Optional[User]:
         """Returns a user with the given ID.
 
@@ -77,6 +77,7 @@ __all__ = (
     'VoiceChannelEffectAnimationType',
     'SubscriptionStatus',
     'MessageReferenceType',
+    'GuildCacheLevel',
 )
 
 
@@ -863,6 +864,11 @@ class SubscriptionStatus(Enum):
     inactive = 2
 
 
+class GuildCacheLevel(Enum):
+    minimal = 0
+    full = 1
+
+
 def create_unknown_value(cls: Type[E], val: Any) -> E:
     value_cls = cls._enum_value_cls_  # type: ignore # This is narrowed below
     name = f'unknown_{val}'
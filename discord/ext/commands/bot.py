@@ -32,6 +32,7 @@ import inspect
 import importlib.util
 import sys
 import logging
+import time
 import types
 from typing import (
     Any,
@@ -43,6 +44,7 @@ from typing import (
     Optional,
     Sequence,
     TypeVar,
+    Tuple,
     Type,
     Union,
     Iterable,
@@ -55,8 +57,8 @@ from discord import app_commands
 from discord.app_commands.tree import _retrieve_guild_ids
 from discord.utils import MISSING, _is_submodule
 
-from .core import GroupMixin
-from .view import StringView
+from .core import GroupMixin, _run_checks_concurrently
+from .view import StringView, _PrefixTrie
 from .context import Context
 from . import errors
 from .help import HelpCommand, DefaultHelpCommand
@@ -71,6 +73,7 @@ if TYPE_CHECKING:
     from discord.message import Message
     from discord.interactions import Interaction
     from discord.abc import User, Snowflake
+    from .cooldowns import CooldownBackend
     from ._types import (
         _Bot,
         BotT,
@@ -91,6 +94,7 @@ __all__ = (
     'when_mentioned_or',
     'Bot',
     'AutoShardedBot',
+    'ExtensionProfile',
 )
 
 T = TypeVar('T')
@@ -99,6 +103,46 @@ CFT = TypeVar('CFT', bound='CoroFunc')
 _log = logging.getLogger(__name__)
 
 
+class ExtensionProfile:
+    """How long loading an extension took.
+
+    These are kept for every extension that is loaded, see :attr:`.Bot.extension_profiles`.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    -----------
+    name: :class:`str`
+        The name of the extension.
+    import_time: :class:`float`
+        The time in seconds spent importing the extension's module.
+    setup_time: :class:`float`
+        The time in seconds spent in the extension's ``setup`` function,
+        including adding its cogs and commands.
+    lazy: :class:`bool`
+        Whether the extension was loaded lazily, on the first invocation of one of its commands.
+    """
+
+    __slots__ = ('name', 'import_time', 'setup_time', 'lazy')
+
+    def __init__(self, name: str, *, import_time: float, setup_time: float, lazy: bool = False) -> None:
+        self.name: str = name
+        self.import_time: float = import_time
+        self.setup_time: float = setup_time
+        self.lazy: bool = lazy
+
+    def __repr__(self) -> str:
+        return (
+            f'<ExtensionProfile name={self.name!r} import_time={self.import_time:.3f} '
+            f'setup_time={self.setup_time:.3f} lazy={self.lazy}>'
+        )
+
+    @property
+    def total_time(self) -> float:
+        """:class:`float`: The time in seconds it took to load the extension."""
+        return self.import_time + self.setup_time
+
+
 def when_mentioned(bot: _Bot, msg: Message, /) -> List[str]:
     """A callable that implements a command prefix equivalent to being mentioned.
 
@@ -183,6 +227,12 @@ class BotBase(GroupMixin[None]):
 
         self.__cogs: Dict[str, Cog] = {}
         self.__extensions: Dict[str, types.ModuleType] = {}
+        self.__extension_profiles: Dict[str, ExtensionProfile] = {}
+        # command name -> lazy extension providing it, and lazy extension -> its command names
+        self.__lazy_commands: Dict[str, str] = {}
+        self.__lazy_extensions: Dict[str, Tuple[str, ...]] = {}
+        # The result is False if the invocation loading the extension was cancelled, the waiters then load it again
+        self.__lazy_loading: Dict[str, asyncio.Future[bool]] = {}
         self._checks: List[UserCheck] = []
         self._check_once: List[UserCheck] = []
         self._before_invoke: Optional[CoroFunc] = None
@@ -192,6 +242,12 @@ class BotBase(GroupMixin[None]):
         self.owner_id: Optional[int] = options.get('owner_id')
         self.owner_ids: Optional[Collection[int]] = options.get('owner_ids', set())
         self.strip_after_prefix: bool = options.get('strip_after_prefix', False)
+        self.cooldown_backend: Optional[CooldownBackend] = options.get('cooldown_backend')
+        self.cache_prefixes: bool = options.get('cache_prefixes', False)
+        self.concurrent_checks: bool = options.get('concurrent_checks', False)
+        # guild ID (None for direct messages) -> compiled prefixes of that guild
+        self._prefix_cache: Dict[Optional[int], _PrefixTrie] = {}
+        self._prefix_cache_source: PrefixType[BotT] = command_prefix
 
         if self.owner_id and self.owner_ids:
             raise TypeError('Both owner_id and owner_ids are set.')
@@ -487,6 +543,9 @@ class BotBase(GroupMixin[None]):
         if len(data) == 0:
             return True
 
+        if self.concurrent_checks and len(data) > 1:
+            return await _run_checks_concurrently(data, ctx)
+
         return await discord.utils.async_all(f(ctx) for f in data)  # type: ignore
 
     async def is_owner(self, user: User, /) -> bool:
@@ -943,8 +1002,8 @@ class BotBase(GroupMixin[None]):
                 if _is_submodule(name, module):
                     del sys.modules[module]
 
-    async def _load_from_module_spec(self, spec: importlib.machinery.ModuleSpec, key: str) -> None:
-        # precondition: key not in self.__extensions
+    def _import_extension(self, spec: importlib.machinery.ModuleSpec, key: str) -> types.ModuleType:
+        # This doesn't touch the bot, so that it can run outside of the event loop
         lib = importlib.util.module_from_spec(spec)
         sys.modules[key] = lib
         try:
@@ -953,14 +1012,24 @@ class BotBase(GroupMixin[None]):
             del sys.modules[key]
             raise errors.ExtensionFailed(key, e) from e
 
-        try:
-            setup = getattr(lib, 'setup')
-        except AttributeError:
+        if not hasattr(lib, 'setup'):
             del sys.modules[key]
             raise errors.NoEntryPointError(key)
+        return lib
+
+    async def _load_from_module_spec(
+        self, spec: importlib.machinery.ModuleSpec, key: str, *, in_thread: bool = False, lazy: bool = False
+    ) -> ExtensionProfile:
+        # precondition: key not in self.__extensions
+        start = time.perf_counter()
+        if in_thread:
+            lib = await asyncio.get_running_loop().run_in_executor(None, self._import_extension, spec, key)
+        else:
+            lib = self._import_extension(spec, key)
+        imported = time.perf_counter()
 
         try:
-            await setup(self)
+            await lib.setup(self)
         except Exception as e:
             del sys.modules[key]
             await self._remove_module_references(lib.__name__)
@@ -969,6 +1038,11 @@ class BotBase(GroupMixin[None]):
         else:
             self.__extensions[key] = lib
 
+        profile = ExtensionProfile(key, import_time=imported - start, setup_time=time.perf_counter() - imported, lazy=lazy)
+        self.__extension_profiles[key] = profile
+        _log.debug('Loaded extension %s in %.3fs.', key, profile.total_time)
+        return profile
+
     def _resolve_name(self, name: str, package: Optional[str]) -> str:
         try:
             return importlib.util.resolve_name(name, package)
@@ -1026,8 +1100,174 @@ class BotBase(GroupMixin[None]):
         if spec is None:
             raise errors.ExtensionNotFound(name)
 
+        self._remove_lazy_extension(name)
         await self._load_from_module_spec(spec, name)
 
+    async def load_extensions(
+        self, names: Iterable[str], /, *, package: Optional[str] = None, import_in_threads: bool = True
+    ) -> List[ExtensionProfile]:
+        """|coro|
+
+        Loads several extensions at once.
+
+        This is equivalent to calling :meth:`load_extension` for each extension,
+        except that their modules are imported in parallel in worker threads and
+        their ``setup`` functions run concurrently. This can shorten the startup
+        of bots with many extensions considerably.
+
+        If an extension fails to load, the others are still loaded and the error
+        of the first one that failed, in the order given, is raised once every
+        extension is done.
+
+        .. versionadded:: 2.6
+
+        Parameters
+        ------------
+        names: Iterable[:class:`str`]
+            The names of the extensions to load, like in :meth:`load_extension`.
+        package: Optional[:class:`str`]
+            The package name to resolve relative imports with.
+        import_in_threads: :class:`bool`
+            Whether to import the modules in worker threads. Pass ``False`` if
+            any of them use the event loop while being imported. Their ``setup``
+            functions always run in the event loop. Defaults to ``True``.
+
+        Raises
+        --------
+        ExtensionNotFound
+            An extension could not be imported, or its name could not be resolved.
+        ExtensionAlreadyLoaded
+            An extension is already loaded.
+        NoEntryPointError
+            An extension does not have a setup function.
+        ExtensionFailed
+            An extension or its setup function had an execution error.
+
+        Returns
+        --------
+        List[:class:`ExtensionProfile`]
+            How long each extension that loaded took, in the order given.
+        """
+
+        # Every name is checked before anything gets imported
+        specs: Dict[str, importlib.machinery.ModuleSpec] = {}
+        for name in names:
+            name = self._resolve_name(name, package)
+            if name in self.__extensions or name in specs:
+                raise errors.ExtensionAlreadyLoaded(name)
+
+            spec = importlib.util.find_spec(name)
+            if spec is None:
+                raise errors.ExtensionNotFound(name)
+            specs[name] = spec
+
+        for name in specs:
+            self._remove_lazy_extension(name)
+
+        results = await asyncio.gather(
+            *(self._load_from_module_spec(spec, name, in_thread=import_in_threads) for name, spec in specs.items()),
+            return_exceptions=True,
+        )
+
+        profiles = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            profiles.append(result)
+        return profiles
+
+    def add_lazy_extension(self, name: str, /, *, commands: Iterable[str], package: Optional[str] = None) -> None:
+        """Registers an extension to be loaded on the first invocation of one of its commands.
+
+        Until then the extension's module isn't imported, which keeps it off the
+        bot's startup. Since the bot can't know which commands an extension
+        provides without importing it, they have to be listed, aliases included.
+
+        Only text commands trigger loading. Application commands, listeners and
+        help entries of the extension only exist once it's loaded.
+
+        .. versionadded:: 2.6
+
+        Parameters
+        ------------
+        name: :class:`str`
+            The name of the extension, like in :meth:`load_extension`.
+        commands: Iterable[:class:`str`]
+            The names of the top level commands the extension adds.
+        package: Optional[:class:`str`]
+            The package name to resolve relative imports with.
+
+        Raises
+        --------
+        ExtensionNotFound
+            The name of the extension could not be resolved.
+        ExtensionAlreadyLoaded
+            The extension is already loaded.
+        """
+
+        name = self._resolve_name(name, package)
+        if name in self.__extensions:
+            raise errors.ExtensionAlreadyLoaded(name)
+
+        self._remove_lazy_extension(name)
+        command_names = tuple(commands)
+        self.__lazy_extensions[name] = command_names
+        for command_name in command_names:
+            self.__lazy_commands[command_name] = name
+
+    def _remove_lazy_extension(self, name: str) -> bool:
+        command_names = self.__lazy_extensions.pop(name, None)
+        if command_names is None:
+            return False
+
+        for command_name in command_names:
+            if self.__lazy_commands.get(command_name) == name:
+                del self.__lazy_commands[command_name]
+        return True
+
+    async def _load_lazy_extension(self, name: str) -> None:
+        # Several messages can invoke the extension's commands before it's done loading
+        future = self.__lazy_loading.get(name)
+        while future is not None:
+            if await asyncio.shield(future):
+                return
+            future = self.__lazy_loading.get(name)
+
+        if name in self.__extensions:
+            return
+
+        future = self.__lazy_loading[name] = asyncio.get_running_loop().create_future()
+        try:
+            spec = importlib.util.find_spec(name)
+            if spec is None:
+                raise errors.ExtensionNotFound(name)
+
+            await self._load_from_module_spec(spec, name, in_thread=True, lazy=True)
+        except asyncio.CancelledError:
+            # Only this invocation was cancelled, hand the load over to whoever else waits on it
+            future.set_result(False)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Consumed by whoever is waiting, if anyone
+            future.exception()
+            raise
+        else:
+            # Only dropped once loaded, a load that didn't go through is tried again on the next invocation
+            self._remove_lazy_extension(name)
+            future.set_result(True)
+        finally:
+            del self.__lazy_loading[name]
+
+    async def _resolve_lazy_command(self, ctx: Context[BotT]) -> None:
+        name = self.__lazy_commands.get(ctx.invoked_with)  # type: ignore
+        if name is None:
+            return
+
+        _log.debug('Loading lazy extension %s for command %s.', name, ctx.invoked_with)
+        await self._load_lazy_extension(name)
+        ctx.command = self.all_commands.get(ctx.invoked_with)  # type: ignore
+
     async def unload_extension(self, name: str, *, package: Optional[str] = None) -> None:
         """|coro|
 
@@ -1070,10 +1310,13 @@ class BotBase(GroupMixin[None]):
         name = self._resolve_name(name, package)
         lib = self.__extensions.get(name)
         if lib is None:
+            if self._remove_lazy_extension(name):
+                return
             raise errors.ExtensionNotLoaded(name)
 
         await self._remove_module_references(lib.__name__)
         await self._call_module_finalizers(lib, name)
+        self.__extension_profiles.pop(name, None)
 
     async def reload_extension(self, name: str, *, package: Optional[str] = None) -> None:
         """|coro|
@@ -1147,6 +1390,24 @@ class BotBase(GroupMixin[None]):
         """Mapping[:class:`str`, :class:`py:types.ModuleType`]: A read-only mapping of extension name to extension."""
         return types.MappingProxyType(self.__extensions)
 
+    @property
+    def lazy_extensions(self) -> Mapping[str, Tuple[str, ...]]:
+        """Mapping[:class:`str`, Tuple[:class:`str`, ...]]: A read-only mapping of the name of each lazy
+        extension that isn't loaded yet to the names of its commands.
+
+        .. versionadded:: 2.6
+        """
+        return types.MappingProxyType(self.__lazy_extensions)
+
+    @property
+    def extension_profiles(self) -> Mapping[str, ExtensionProfile]:
+        """Mapping[:class:`str`, :class:`ExtensionProfile`]: A read-only mapping of extension name
+        to how long loading it took, for every loaded extension.
+
+        .. versionadded:: 2.6
+        """
+        return types.MappingProxyType(self.__extension_profiles)
+
     # help command stuff
 
     @property
@@ -1227,6 +1488,80 @@ class BotBase(GroupMixin[None]):
 
         return ret
 
+    def invalidate_prefix(self, guild: Optional[Snowflake], /) -> None:
+        """Removes the cached prefixes of a guild.
+
+        When :attr:`cache_prefixes` is enabled this must be called whenever
+        the prefixes that :meth:`get_prefix` returns for a guild change,
+        e.g. after a prefix command writes the new ones to a database.
+
+        .. versionadded:: 2.6
+
+        Parameters
+        -----------
+        guild: Optional[:class:`~discord.abc.Snowflake`]
+            The guild to remove the prefixes of, or ``None`` for the prefixes
+            used in direct messages.
+        """
+        self._prefix_cache.pop(None if guild is None else guild.id, None)
+
+    def clear_prefix_cache(self) -> None:
+        """Removes the cached prefixes of every guild.
+
+        Assigning a new :attr:`command_prefix` does this automatically.
+
+        .. versionadded:: 2.6
+        """
+        self._prefix_cache.clear()
+        self._prefix_cache_source = self.command_prefix
+
+    def _prefix_tuple(self, prefix: Union[List[str], str]) -> Tuple[str, ...]:
+        if isinstance(prefix, str):
+            return (prefix,)
+
+        try:
+            return tuple(prefix)
+        except TypeError:
+            raise TypeError(
+                "get_prefix must return either a string or a list of string, " f"not {prefix.__class__.__name__}"
+            ) from None
+
+    def _check_prefix(self, prefixes: Tuple[str, ...]) -> None:
+        # It's possible a bad command_prefix got us here.
+        for value in prefixes:
+            if not isinstance(value, str):
+                raise TypeError(
+                    "Iterable command_prefix or list returned from get_prefix must "
+                    f"contain only strings, not {value.__class__.__name__}"
+                )
+
+    async def _match_prefix(self, message: Message, /) -> Optional[str]:
+        # Returns the prefix the message was invoked with without building a context
+        content = message.content
+        if not self.cache_prefixes:
+            prefixes = self._prefix_tuple(await self.get_prefix(message))
+            try:
+                if not content.startswith(prefixes):
+                    return None
+            except TypeError:
+                self._check_prefix(prefixes)
+                # Getting here shouldn't happen
+                raise
+            return discord.utils.find(content.startswith, prefixes)
+
+        if self._prefix_cache_source is not self.command_prefix:
+            self.clear_prefix_cache()
+
+        guild_id = message.guild.id if message.guild is not None else None
+        try:
+            trie = self._prefix_cache[guild_id]
+        except KeyError:
+            prefixes = self._prefix_tuple(await self.get_prefix(message))
+            self._check_prefix(prefixes)
+            trie = self._prefix_cache[guild_id] = _PrefixTrie(prefixes)
+
+        return trie.match(content)
+
     @overload
     async def get_context(
         self,
@@ -1296,51 +1631,31 @@ class BotBase(GroupMixin[None]):
         if isinstance(origin, discord.Interaction):
             return await cls.from_interaction(origin)
 
-        view = StringView(origin.content)
-        ctx = cls(prefix=None, view=view, bot=self, message=origin)
-
-        if origin.author.id == self.user.id:  # type: ignore
-            return ctx
-
-        prefix = await self.get_prefix(origin)
-        invoked_prefix = prefix
+        invoked_prefix = None
+        if origin.author.id != self.user.id:  # type: ignore
+            invoked_prefix = await self._match_prefix(origin)
 
-        if isinstance(prefix, str):
-            if not view.skip_string(prefix):
-                return ctx
-        else:
-            try:
-                # if the context class' __init__ consumes something from the view this
-                # will be wrong.  That seems unreasonable though.
-                if origin.content.startswith(tuple(prefix)):
-                    invoked_prefix = discord.utils.find(view.skip_string, prefix)
-                else:
-                    return ctx
+        ctx = self._build_context(origin, invoked_prefix, cls)
+        if ctx.command is None and self.__lazy_commands and ctx.invoked_with:
+            await self._resolve_lazy_command(ctx)
+        return ctx
 
-            except TypeError:
-                if not isinstance(prefix, list):
-                    raise TypeError(
-                        "get_prefix must return either a string or a list of string, " f"not {prefix.__class__.__name__}"
-                    )
-
-                # It's possible a bad command_prefix got us here.
-                for value in prefix:
-                    if not isinstance(value, str):
-                        raise TypeError(
-                            "Iterable command_prefix or list returned from get_prefix must "
-                            f"contain only strings, not {value.__class__.__name__}"
-                        )
+    def _build_context(self, message: Message, invoked_prefix: Optional[str], cls: Type[ContextT]) -> ContextT:
+        view = StringView(message.content)
+        ctx = cls(prefix=None, view=view, bot=self, message=message)
+        if invoked_prefix is None:
+            return ctx
 
-                # Getting here shouldn't happen
-                raise
+        # if the context class' __init__ consumes something from the view this
+        # will be wrong.  That seems unreasonable though.
+        view.skip_string(invoked_prefix)
 
         if self.strip_after_prefix:
             view.skip_ws()
 
         invoker = view.get_word()
         ctx.invoked_with = invoker
-        # type-checker fails to narrow invoked_prefix type.
-        ctx.prefix = invoked_prefix  # type: ignore
+        ctx.prefix = invoked_prefix
         ctx.command = self.all_commands.get(invoker)
         return ctx
 
@@ -1391,6 +1706,11 @@ class BotBase(GroupMixin[None]):
         This also checks if the message's author is a bot and doesn't
         call :meth:`~.Bot.get_context` or :meth:`~.Bot.invoke` if so.
 
+        .. versionchanged:: 2.6
+
+            Unless :meth:`~.Bot.get_context` is overridden, messages that don't
+            start with a prefix are dropped before any context is created.
+
         .. versionchanged:: 2.0
 
             ``message`` parameter is now positional-only.
@@ -1403,7 +1723,17 @@ class BotBase(GroupMixin[None]):
         if message.author.bot:
             return
 
-        ctx = await self.get_context(message)
+        if type(self).get_context is BotBase.get_context:
+            # Most messages aren't commands, find that out before allocating a context for them.
+            # Invoking a context without a prefix does nothing so skipping it changes nothing.
+            invoked_prefix = await self._match_prefix(message)
+            if invoked_prefix is None:
+                return
+            ctx = self._build_context(message, invoked_prefix, Context)
+            if ctx.command is None and self.__lazy_commands and ctx.invoked_with:
+                await self._resolve_lazy_command(ctx)
+        else:
+            ctx = await self.get_context(message)
         # the type of the invocation context's bot attribute will be correct
         await self.invoke(ctx)  # type: ignore
 
@@ -1491,6 +1821,29 @@ class Bot(BotBase, discord.Client):
         the ``command_prefix`` is set to ``!``. Defaults to ``False``.
 
         .. versionadded:: 1.7
+    cooldown_backend: Optional[:class:`.CooldownBackend`]
+        Where to keep the state of command cooldowns and maximum concurrency.
+        Setting this to a shared backend such as :class:`.SharedMemoryCooldownBackend`
+        makes these limits apply across every process of the bot. Defaults to ``None``,
+        keeping them in each command.
+
+        .. versionadded:: 2.6
+    cache_prefixes: :class:`bool`
+        Whether to remember the prefixes :meth:`.get_prefix` returns for each guild
+        instead of calling it for every message. This only works if the prefixes
+        depend on nothing but the guild, :meth:`.invalidate_prefix` must be
+        called when they change. Defaults to ``False``.
+
+        .. versionadded:: 2.6
+    concurrent_checks: :class:`bool`
+        Whether to run the global checks of the bot, and the checks of a command,
+        concurrently instead of one after another. This speeds up checks that
+        wait on I/O, but every check runs even if an earlier one already failed,
+        so they shouldn't depend on each other. The help command also checks the
+        commands it lists concurrently, each with a shallow copy of the context.
+        Defaults to ``False``.
+
+        .. versionadded:: 2.6
     tree_cls: Type[:class:`~discord.app_commands.CommandTree`]
         The type of application command tree to use. Defaults to :class:`~discord.app_commands.CommandTree`.
 
@@ -213,6 +213,19 @@ class Context(discord.abc.Messageable, Generic[BotT]):
         self.current_argument: Optional[str] = current_argument
         self.interaction: Optional[Interaction[BotT]] = interaction
         self._state: ConnectionState = self.message._state
+        # user ID -> member (or None if not in the guild) fetched by converters during this invocation
+        self._resolved_members: Dict[int, Optional[Member]] = {}
+        # results of built-in checks, see core._memoize_check
+        self._check_results: Dict[Any, Any] = {}
+        self._check_results_message: Message = self.message
+
+    def _get_check_results(self) -> Dict[Any, Any]:
+        # Copies of this context share the results, unless they were made to invoke
+        # a command for another message, e.g. on behalf of someone else.
+        if self._check_results_message is not self.message:
+            self._check_results = {}
+            self._check_results_message = self.message
+        return self._check_results
 
     @classmethod
     async def from_interaction(cls, interaction: Interaction[BotT], /) -> Self:
@@ -26,9 +26,14 @@ from __future__ import annotations
 
 import inspect
 import re
+import time
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    ClassVar,
+    Coroutine,
     Dict,
     Generic,
     Iterable,
@@ -105,6 +110,47 @@ T_co = TypeVar('T_co', covariant=True)
 CT = TypeVar('CT', bound=discord.abc.GuildChannel)
 TT = TypeVar('TT', bound=discord.Thread)
 
+# User mentions and bare IDs in a message, but not IDs that are part of other mentions, emojis or links
+_USER_ID_REGEX = re.compile(r'<@!?([0-9]{15,20})>|(?<!\S)([0-9]{15,20})(?!\S)')
+
+
+class _NegativeCache:
+    # Remembers lookups that found nothing for a short while, so that
+    # repeating a bad argument doesn't go to the gateway or API every time
+
+    __slots__ = ('max_size', '_entries')
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size: int = max_size
+        # key -> expiry, in expiry order as long as the ttl doesn't change
+        self._entries: OrderedDict[Any, float] = OrderedDict()
+
+    def __contains__(self, key: Any) -> bool:
+        expires = self._entries.get(key)
+        if expires is None:
+            return False
+        if expires < time.monotonic():
+            del self._entries[key]
+            return False
+        return True
+
+    def add(self, key: Any, ttl: float) -> None:
+        now = time.monotonic()
+        entries = self._entries
+        entries[key] = now + ttl
+        entries.move_to_end(key)
+        while entries:
+            oldest, expires = next(iter(entries.items()))
+            if expires >= now and len(entries) <= self.max_size:
+                break
+            del entries[oldest]
+
+    def discard(self, key: Any) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 @runtime_checkable
 class Converter(Protocol[T_co]):
@@ -204,11 +250,21 @@ class MemberConverter(IDConverter[discord.Member]):
         This converter now lazily fetches members from the gateway and HTTP APIs,
         optionally caching the result if :attr:`.MemberCacheFlags.joined` is enabled.
 
+    .. versionchanged:: 2.6
+        Members that aren't cached are fetched together with the other uncached user
+        mentions and IDs in the rest of the invocation's message, in a single request.
+        Lookups that found no member are remembered for :attr:`NOT_FOUND_TTL` seconds.
+
     .. deprecated:: 2.3
         Looking up users by discriminator will be removed in a future version due to
         the removal of discriminators in an API change.
     """
 
+    #: How long, in seconds, an argument that matched no member isn't looked up again.
+    NOT_FOUND_TTL: ClassVar[float] = 30.0
+
+    _not_found: ClassVar[_NegativeCache] = _NegativeCache()
+
     async def query_member_named(self, guild: discord.Guild, argument: str) -> Optional[discord.Member]:
         cache = guild._state.member_cache_flags.joined
         username, _, discriminator = argument.rpartition('#')
@@ -248,6 +304,53 @@ class MemberConverter(IDConverter[discord.Member]):
             return None
         return members[0]
 
+    def _pending_user_ids(self, ctx: Context[BotT], guild: discord.Guild, user_id: int) -> List[int]:
+        # The user ID being converted, followed by other IDs in the rest of the message
+        # that later arguments are likely to need, up to what one query can take
+        resolved = ctx._resolved_members
+        not_found = self._not_found
+        user_ids = [user_id]
+        view = ctx.view
+        for match in _USER_ID_REGEX.finditer(view.buffer, view.index):
+            other = int(match.group(1) or match.group(2))
+            if (
+                other in user_ids
+                or other in resolved
+                or guild.get_member(other) is not None
+                or (guild.id, other) in not_found
+            ):
+                continue
+            user_ids.append(other)
+            if len(user_ids) == 100:
+                break
+        return user_ids
+
+    async def _query_member_batched(
+        self, ctx: Context[BotT], guild: discord.Guild, user_id: int
+    ) -> Optional[discord.Member]:
+        resolved = ctx._resolved_members
+        if user_id in resolved:
+            return resolved[user_id]
+
+        bot = ctx.bot
+        user_ids = self._pending_user_ids(ctx, guild, user_id)
+        if len(user_ids) == 1 or bot._get_websocket(shard_id=guild.shard_id).is_ratelimited():
+            # Nothing to batch, or the HTTP API has to be used which fetches one member at a time
+            resolved[user_id] = member = await self.query_member_by_id(bot, guild, user_id)
+        else:
+            cache = guild._state.member_cache_flags.joined
+            members = await guild.query_members(limit=len(user_ids), user_ids=user_ids, cache=cache)
+            for found in members:
+                resolved[found.id] = found
+            for other in user_ids:
+                resolved.setdefault(other, None)
+            member = resolved[user_id]
+
+        for other in user_ids:
+            if other in resolved and resolved[other] is None:
+                self._not_found.add((guild.id, other), self.NOT_FOUND_TTL)
+        return member
+
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.Member:
         bot = ctx.bot
         match = self._get_id_match(argument) or re.match(r'<@!?([0-9]{15,20})>$', argument)
@@ -272,12 +375,17 @@ class MemberConverter(IDConverter[discord.Member]):
             if guild is None:
                 raise MemberNotFound(argument)
 
+            key = (guild.id, argument if user_id is None else user_id)
+            if key in self._not_found:
+                raise MemberNotFound(argument)
+
             if user_id is not None:
-                result = await self.query_member_by_id(bot, guild, user_id)
+                result = await self._query_member_batched(ctx, guild, user_id)
             else:
                 result = await self.query_member_named(guild, argument)
 
             if not result:
+                self._not_found.add(key, self.NOT_FOUND_TTL)
                 raise MemberNotFound(argument)
 
         return result
@@ -304,11 +412,19 @@ class UserConverter(IDConverter[discord.User]):
         This converter now lazily fetches users from the HTTP APIs if an ID is passed
         and it's not available in cache.
 
+    .. versionchanged:: 2.6
+        IDs that matched no user are remembered for :attr:`NOT_FOUND_TTL` seconds.
+
     .. deprecated:: 2.3
         Looking up users by discriminator will be removed in a future version due to
         the removal of discriminators in an API change.
     """
 
+    #: How long, in seconds, an ID that matched no user isn't fetched again.
+    NOT_FOUND_TTL: ClassVar[float] = 30.0
+
+    _not_found: ClassVar[_NegativeCache] = _NegativeCache()
+
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.User:
         match = self._get_id_match(argument) or re.match(r'<@!?([0-9]{15,20})>$', argument)
         result = None
@@ -318,8 +434,13 @@ class UserConverter(IDConverter[discord.User]):
             user_id = int(match.group(1))
             result = ctx.bot.get_user(user_id) or _utils_get(ctx.message.mentions, id=user_id)
             if result is None:
+                if user_id in self._not_found:
+                    raise UserNotFound(argument)
                 try:
                     result = await ctx.bot.fetch_user(user_id)
+                except discord.NotFound:
+                    self._not_found.add(user_id, self.NOT_FOUND_TTL)
+                    raise UserNotFound(argument) from None
                 except discord.HTTPException:
                     raise UserNotFound(argument) from None
 
@@ -1306,9 +1427,17 @@ CONVERTER_MAPPING: Dict[type, Any] = {
 }
 
 
-async def _actual_conversion(ctx: Context[BotT], converter: Any, argument: str, param: inspect.Parameter):
+_ConvertFunc = Callable[['Context[Any]', str, 'Parameter'], Coroutine[Any, Any, Any]]
+
+
+def _compile_actual_conversion(converter: Any) -> _ConvertFunc:
+    # Works out once which way to call the converter instead of on every conversion
     if converter is bool:
-        return _convert_to_bool(argument)
+
+        async def convert_bool(ctx: Context[BotT], argument: str, param: Parameter) -> Any:
+            return _convert_to_bool(argument)
+
+        return convert_bool
 
     try:
         module = converter.__module__
@@ -1318,109 +1447,95 @@ async def _actual_conversion(ctx: Context[BotT], converter: Any, argument: str,
         if module is not None and (module.startswith('discord.') and not module.endswith('converter')):
             converter = CONVERTER_MAPPING.get(converter, converter)
 
-    try:
-        if inspect.isclass(converter) and issubclass(converter, Converter):
-            if inspect.ismethod(converter.convert):
-                return await converter.convert(ctx, argument)
-            else:
-                return await converter().convert(ctx, argument)
-        elif isinstance(converter, Converter):
-            return await converter.convert(ctx, argument)
-    except CommandError:
-        raise
-    except Exception as exc:
-        raise ConversionError(converter, exc) from exc  # type: ignore
-
-    try:
-        return converter(argument)
-    except CommandError:
-        raise
-    except Exception as exc:
-        try:
-            name = converter.__name__
-        except AttributeError:
-            name = converter.__class__.__name__
-
-        raise BadArgument(f'Converting to "{name}" failed for parameter "{param.name}".') from exc
+    if inspect.isclass(converter) and issubclass(converter, Converter):
+        if inspect.ismethod(converter.convert):
+            method = converter.convert
 
+            async def convert_classmethod(ctx: Context[BotT], argument: str, param: Parameter) -> Any:
+                try:
+                    return await method(ctx, argument)
+                except CommandError:
+                    raise
+                except Exception as exc:
+                    raise ConversionError(converter, exc) from exc  # type: ignore
 
-@overload
-async def run_converters(
-    ctx: Context[BotT], converter: Union[Type[Converter[T]], Converter[T]], argument: str, param: Parameter
-) -> T:
-    ...
+            return convert_classmethod
 
+        async def convert_class(ctx: Context[BotT], argument: str, param: Parameter) -> Any:
+            try:
+                return await converter().convert(ctx, argument)
+            except CommandError:
+                raise
+            except Exception as exc:
+                raise ConversionError(converter, exc) from exc  # type: ignore
 
-@overload
-async def run_converters(ctx: Context[BotT], converter: Any, argument: str, param: Parameter) -> Any:
-    ...
+        return convert_class
 
+    if isinstance(converter, Converter):
 
-async def run_converters(ctx: Context[BotT], converter: Any, argument: str, param: Parameter) -> Any:
-    """|coro|
+        async def convert_instance(ctx: Context[BotT], argument: str, param: Parameter) -> Any:
+            try:
+                return await converter.convert(ctx, argument)
+            except CommandError:
+                raise
+            except Exception as exc:
+                raise ConversionError(converter, exc) from exc  # type: ignore
 
-    Runs converters for a given converter, argument, and parameter.
+        return convert_instance
 
-    This function does the same work that the library does under the hood.
+    try:
+        name = converter.__name__
+    except AttributeError:
+        name = converter.__class__.__name__
 
-    .. versionadded:: 2.0
+    async def convert_callable(ctx: Context[BotT], argument: str, param: Parameter) -> Any:
+        try:
+            return converter(argument)
+        except CommandError:
+            raise
+        except Exception as exc:
+            raise BadArgument(f'Converting to "{name}" failed for parameter "{param.name}".') from exc
 
-    Parameters
-    ------------
-    ctx: :class:`Context`
-        The invocation context to run the converters under.
-    converter: Any
-        The converter to run, this corresponds to the annotation in the function.
-    argument: :class:`str`
-        The argument to convert to.
-    param: :class:`Parameter`
-        The parameter being converted. This is mainly for error reporting.
+    return convert_callable
 
-    Raises
-    -------
-    CommandError
-        The converter failed to convert.
 
-    Returns
-    --------
-    Any
-        The resulting conversion.
-    """
-    origin = getattr(converter, '__origin__', None)
+def _compile_union(union_args: Tuple[Any, ...]) -> _ConvertFunc:
+    _NoneType = type(None)
+    compiled = [(conv is _NoneType, _compile_converter(conv)) for conv in union_args]
 
-    if origin is Union:
+    async def convert_union(ctx: Context[BotT], argument: str, param: Parameter) -> Any:
         errors = []
-        _NoneType = type(None)
-        union_args = converter.__args__
-        for conv in union_args:
+        for is_none, convert in compiled:
             # if we got to this part in the code, then the previous conversions have failed
             # so we should just undo the view, return the default, and allow parsing to continue
             # with the other parameters
-            if conv is _NoneType and param.kind != param.VAR_POSITIONAL:
+            if is_none and param.kind != param.VAR_POSITIONAL:
                 ctx.view.undo()
                 return None if param.required else await param.get_default(ctx)
 
             try:
-                value = await run_converters(ctx, conv, argument, param)
+                return await convert(ctx, argument, param)
             except CommandError as exc:
                 errors.append(exc)
-            else:
-                return value
 
         # if we're here, then we failed all the converters
         raise BadUnionArgument(param, union_args, errors)
 
-    if origin is Literal:
+    return convert_union
+
+
+def _compile_literal(literal_args: Tuple[Any, ...]) -> _ConvertFunc:
+    compiled = [(literal, type(literal), _compile_actual_conversion(type(literal))) for literal in literal_args]
+
+    async def convert_literal(ctx: Context[BotT], argument: str, param: Parameter) -> Any:
         errors = []
         conversions = {}
-        literal_args = converter.__args__
-        for literal in literal_args:
-            literal_type = type(literal)
+        for literal, literal_type, convert in compiled:
             try:
                 value = conversions[literal_type]
             except KeyError:
                 try:
-                    value = await _actual_conversion(ctx, literal_type, argument, param)
+                    value = await convert(ctx, argument, param)
                 except CommandError as exc:
                     errors.append(exc)
                     conversions[literal_type] = object()
@@ -1434,6 +1549,20 @@ async def run_converters(ctx: Context[BotT], converter: Any, argument: str, para
         # if we're here, then we failed to match all the literals
         raise BadLiteralArgument(param, literal_args, errors, argument)
 
+    return convert_literal
+
+
+def _compile_converter(converter: Any) -> _ConvertFunc:
+    # Returns the conversion run_converters does for a converter. Commands compile it once
+    # per parameter in their parameter plans, so nothing is cached here.
+    origin = getattr(converter, '__origin__', None)
+
+    if origin is Union:
+        return _compile_union(converter.__args__)
+
+    if origin is Literal:
+        return _compile_literal(converter.__args__)
+
     # This must be the last if-clause in the chain of origin checking
     # Nearly every type is a generic type within the typing library
     # So care must be taken to make sure a more specialised origin handle
@@ -1441,4 +1570,49 @@ async def run_converters(ctx: Context[BotT], converter: Any, argument: str, para
     if origin is not None and is_generic_type(converter):
         converter = origin
 
-    return await _actual_conversion(ctx, converter, argument, param)
+    return _compile_actual_conversion(converter)
+
+
+@overload
+async def run_converters(
+    ctx: Context[BotT], converter: Union[Type[Converter[T]], Converter[T]], argument: str, param: Parameter
+) -> T:
+    ...
+
+
+@overload
+async def run_converters(ctx: Context[BotT], converter: Any, argument: str, param: Parameter) -> Any:
+    ...
+
+
+async def run_converters(ctx: Context[BotT], converter: Any, argument: str, param: Parameter) -> Any:
+    """|coro|
+
+    Runs converters for a given converter, argument, and parameter.
+
+    This function does the same work that the library does under the hood.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ------------
+    ctx: :class:`Context`
+        The invocation context to run the converters under.
+    converter: Any
+        The converter to run, this corresponds to the annotation in the function.
+    argument: :class:`str`
+        The argument to convert to.
+    param: :class:`Parameter`
+        The parameter being converted. This is mainly for error reporting.
+
+    Raises
+    -------
+    CommandError
+        The converter failed to convert.
+
+    Returns
+    --------
+    Any
+        The resulting conversion.
+    """
+    return await _compile_converter(converter)(ctx, argument, param)
@@ -25,13 +25,24 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 
-from typing import Any, Callable, Deque, Dict, Optional, Union, Generic, TypeVar, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union, Generic, TypeVar, TYPE_CHECKING
 from discord.enums import Enum
 from discord.abc import PrivateChannel
 import time
 import asyncio
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import threading
 from collections import deque
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 from .errors import MaxConcurrencyReached
 from .context import Context
 from discord.app_commands import Cooldown as Cooldown
@@ -47,6 +58,9 @@ __all__ = (
     'CooldownMapping',
     'DynamicCooldownMapping',
     'MaxConcurrency',
+    'CooldownBackend',
+    'MemoryCooldownBackend',
+    'SharedMemoryCooldownBackend',
 )
 
 T_contra = TypeVar('T_contra', contravariant=True)
@@ -93,12 +107,18 @@ class CooldownMapping(Generic[T_contra]):
             raise TypeError('Cooldown type must be a BucketType or callable')
 
         self._cache: Dict[Any, Cooldown] = {}
+        # A min-heap of (deadline, insertion order, key) with one entry per cached bucket.
+        # Deadlines only move forward, so an entry may be stale but is never too late.
+        self._expiry: List[Tuple[float, int, Any]] = []
+        self._counter: int = 0
         self._cooldown: Optional[Cooldown] = original
         self._type: Callable[[T_contra], Any] = type
 
     def copy(self) -> CooldownMapping[T_contra]:
         ret = CooldownMapping(self._cooldown, self._type)
         ret._cache = self._cache.copy()
+        ret._expiry = self._expiry.copy()
+        ret._counter = self._counter
         return ret
 
     @property
@@ -121,14 +141,40 @@ class CooldownMapping(Generic[T_contra]):
         # in a cooldown window. e.g. if we have a  command that has a
         # cooldown of 60s and it has not been used in 60s then that key should be deleted
         current = current or time.time()
-        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
-        for k in dead_keys:
-            del self._cache[k]
+        expiry = self._expiry
+        cache = self._cache
+        # only the buckets whose last known deadline passed are looked at, the
+        # ones that were used since then are pushed back with their new deadline
+        while expiry and expiry[0][0] < current:
+            _, _, key = heapq.heappop(expiry)
+            bucket = cache.get(key)
+            if bucket is None:
+                continue
+
+            deadline = bucket._last + bucket.per
+            if current > deadline:
+                del cache[key]
+            else:
+                self._push_expiry(key, deadline)
+
+    def _push_expiry(self, key: Any, deadline: float) -> None:
+        self._counter += 1
+        heapq.heappush(self._expiry, (deadline, self._counter, key))
 
     def create_bucket(self, message: T_contra) -> Cooldown:
         return self._cooldown.copy()  # type: ignore
 
-    def get_bucket(self, message: T_contra, current: Optional[float] = None) -> Optional[Cooldown]:
+    def get_bucket(
+        self,
+        message: T_contra,
+        current: Optional[float] = None,
+        *,
+        backend: Optional[CooldownBackend] = None,
+        namespace: str = '',
+    ) -> Optional[Cooldown]:
+        if backend is not None:
+            return self._get_backend_bucket(message, backend, namespace)
+
         if self._type is BucketType.default:
             return self._cooldown
 
@@ -138,11 +184,20 @@ class CooldownMapping(Generic[T_contra]):
             bucket = self.create_bucket(message)
             if bucket is not None:
                 self._cache[key] = bucket
+                # It hasn't been used yet, but normally is right away, so it's due a window from now
+                self._push_expiry(key, (current or time.time()) + bucket.per)
         else:
             bucket = self._cache[key]
 
         return bucket
 
+    def _get_backend_bucket(self, message: T_contra, backend: CooldownBackend, namespace: str) -> Optional[Cooldown]:
+        # The backend owns the state, the bucket handed out is only a view of it
+        template = self._cooldown if self._type is BucketType.default else self.create_bucket(message)
+        if template is None:
+            return None
+        return _BackendCooldown(template.rate, template.per, backend, namespace, self._bucket_key(message))
+
     def update_rate_limit(self, message: T_contra, current: Optional[float] = None, tokens: int = 1) -> Optional[float]:
         bucket = self.get_bucket(message, current)
         if bucket is None:
@@ -162,6 +217,8 @@ class DynamicCooldownMapping(CooldownMapping[T_contra]):
     def copy(self) -> DynamicCooldownMapping[T_contra]:
         ret = DynamicCooldownMapping(self._factory, self._type)
         ret._cache = self._cache.copy()
+        ret._expiry = self._expiry.copy()
+        ret._counter = self._counter
         return ret
 
     @property
@@ -235,6 +292,9 @@ class _Semaphore:
 class MaxConcurrency:
     __slots__ = ('number', 'per', 'wait', '_mapping')
 
+    # How often a waiting invocation checks a backend for a free slot, in seconds
+    POLL_INTERVAL: float = 0.1
+
     def __init__(self, number: int, *, per: BucketType, wait: bool) -> None:
         self._mapping: Dict[Any, _Semaphore] = {}
         self.per: BucketType = per
@@ -256,9 +316,23 @@ class MaxConcurrency:
     def get_key(self, message: Union[Message, Context[Any]]) -> Any:
         return self.per.get_key(message)
 
-    async def acquire(self, message: Union[Message, Context[Any]]) -> None:
+    async def acquire(
+        self,
+        message: Union[Message, Context[Any]],
+        *,
+        backend: Optional[CooldownBackend] = None,
+        namespace: str = '',
+    ) -> None:
         key = self.get_key(message)
 
+        if backend is not None:
+            # Other processes can't wake us up, so waiting has to poll
+            while not backend.acquire(namespace, key, self.number):
+                if not self.wait:
+                    raise MaxConcurrencyReached(self.number, self.per)
+                await asyncio.sleep(self.POLL_INTERVAL)
+            return
+
         try:
             sem = self._mapping[key]
         except KeyError:
@@ -268,11 +342,21 @@ class MaxConcurrency:
         if not acquired:
             raise MaxConcurrencyReached(self.number, self.per)
 
-    async def release(self, message: Union[Message, Context[Any]]) -> None:
+    async def release(
+        self,
+        message: Union[Message, Context[Any]],
+        *,
+        backend: Optional[CooldownBackend] = None,
+        namespace: str = '',
+    ) -> None:
         # Technically there's no reason for this function to be async
         # But it might be more useful in the future
         key = self.get_key(message)
 
+        if backend is not None:
+            backend.release(namespace, key)
+            return
+
         try:
             sem = self._mapping[key]
         except KeyError:
@@ -283,3 +367,480 @@ class MaxConcurrency:
 
         if sem.value >= self.number and not sem.is_active():
             del self._mapping[key]
+
+
+def _update_tokens(
+    window: float, tokens: int, rate: int, per: float, current: float, cost: int
+) -> Tuple[float, int, Optional[float]]:
+    # The same token bucket as Cooldown.update_rate_limit, over plain values
+    tokens = max(tokens, 0)
+    if current > window + per:
+        tokens = rate
+
+    # first token used means that we start a new rate limit window
+    if tokens == rate:
+        window = current
+
+    tokens -= cost
+    if tokens < 0:
+        return window, tokens, per - (current - window)
+    return window, tokens, None
+
+
+class _BackendCooldown(Cooldown):
+    # A Cooldown whose state lives in a CooldownBackend, so that every
+    # existing user of buckets keeps working with shared cooldowns
+
+    __slots__ = ('_backend', '_namespace', '_key')
+
+    def __init__(self, rate: float, per: float, backend: CooldownBackend, namespace: str, key: Any) -> None:
+        super().__init__(rate, per)
+        self._backend: CooldownBackend = backend
+        self._namespace: str = namespace
+        self._key: Any = key
+
+    def get_tokens(self, current: Optional[float] = None) -> int:
+        if not current:
+            current = time.time()
+
+        state = self._backend.get_window(self._namespace, self._key)
+        if state is None:
+            return self.rate
+
+        self._window, self._tokens = state
+        tokens = max(self._tokens, 0)
+        if current > self._window + self.per:
+            tokens = self.rate
+        return tokens
+
+    def update_rate_limit(self, current: Optional[float] = None, *, tokens: int = 1) -> Optional[float]:
+        current = current or time.time()
+        self._last = current
+        return self._backend.update_rate_limit(self._namespace, self._key, self.rate, self.per, current, tokens)
+
+    def reset(self) -> None:
+        self._backend.reset(self._namespace, self._key)
+
+    def copy(self) -> Cooldown:
+        return Cooldown(self.rate, self.per)
+
+
+class CooldownBackend:
+    """Storage for command cooldowns and maximum concurrency.
+
+    By default every command keeps its cooldown buckets and concurrency counters
+    in the process it runs in. When a bot is split over several processes, e.g.
+    a group of shards per process, a user can get around those limits by using
+    the command where another process handles it. Passing a backend as the
+    ``cooldown_backend`` parameter of :class:`.Bot` moves this state into the
+    backend so that the limits hold across every process sharing it.
+
+    Each method must apply its change atomically with regards to every other
+    user of the same storage.
+
+    .. versionadded:: 2.6
+    """
+
+    def get_window(self, namespace: str, key: Any) -> Optional[Tuple[float, int]]:
+        """Returns the state of a cooldown bucket.
+
+        Parameters
+        -----------
+        namespace: :class:`str`
+            The qualified name of the command the bucket belongs to.
+        key: Any
+            The bucket key, as returned by the command's :class:`.BucketType`.
+
+        Returns
+        --------
+        Optional[Tuple[:class:`float`, :class:`int`]]
+            The start of the bucket's current window and its remaining tokens,
+            or ``None`` if the bucket doesn't exist.
+        """
+        raise NotImplementedError
+
+    def update_rate_limit(
+        self, namespace: str, key: Any, rate: int, per: float, current: float, tokens: int
+    ) -> Optional[float]:
+        """Takes tokens from a cooldown bucket, creating it if needed.
+
+        This is the atomic equivalent of :meth:`~discord.app_commands.Cooldown.update_rate_limit`.
+
+        Parameters
+        -----------
+        namespace: :class:`str`
+            The qualified name of the command the bucket belongs to.
+        key: Any
+            The bucket key.
+        rate: :class:`int`
+            The number of tokens available per ``per`` seconds.
+        per: :class:`float`
+            The length of the cooldown period in seconds.
+        current: :class:`float`
+            The time in seconds since Unix epoch to update the bucket at.
+        tokens: :class:`int`
+            The number of tokens to take.
+
+        Returns
+        --------
+        Optional[:class:`float`]
+            The retry-after time in seconds if rate limited.
+        """
+        raise NotImplementedError
+
+    def reset(self, namespace: str, key: Any) -> None:
+        """Resets a cooldown bucket to its initial state.
+
+        Parameters
+        -----------
+        namespace: :class:`str`
+            The qualified name of the command the bucket belongs to.
+        key: Any
+            The bucket key.
+        """
+        raise NotImplementedError
+
+    def acquire(self, namespace: str, key: Any, number: int) -> bool:
+        """Takes a concurrency slot if fewer than ``number`` are taken.
+
+        Parameters
+        -----------
+        namespace: :class:`str`
+            The qualified name of the command.
+        key: Any
+            The bucket key, as returned by the command's :class:`.BucketType`.
+        number: :class:`int`
+            The maximum number of concurrent invocations.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether a slot was taken.
+        """
+        raise NotImplementedError
+
+    def release(self, namespace: str, key: Any) -> None:
+        """Gives back a concurrency slot taken with :meth:`acquire`.
+
+        Parameters
+        -----------
+        namespace: :class:`str`
+            The qualified name of the command.
+        key: Any
+            The bucket key.
+        """
+        raise NotImplementedError
+
+    def sweep(self, current: Optional[float] = None) -> int:
+        """Removes every cooldown bucket that has expired.
+
+        Backends also expire buckets on their own as they are used, this
+        only frees the space they take up in one go.
+
+        Parameters
+        -----------
+        current: Optional[:class:`float`]
+            The time in seconds since Unix epoch to expire buckets at.
+            If not supplied then :func:`time.time()` is used.
+
+        Returns
+        --------
+        :class:`int`
+            The number of buckets removed.
+        """
+        return 0
+
+
+class MemoryCooldownBackend(CooldownBackend):
+    """A :class:`CooldownBackend` that keeps its state in memory.
+
+    This only shares limits between the bots and commands of one process,
+    but is a reference for other backends and useful in tests.
+
+    .. versionadded:: 2.6
+    """
+
+    def __init__(self) -> None:
+        # (namespace, key) -> [window, tokens, expires]
+        self._buckets: Dict[Tuple[str, Any], List[Any]] = {}
+        self._expiry: List[Tuple[float, int, Tuple[str, Any]]] = []
+        self._counter: int = 0
+        self._concurrency: Dict[Tuple[str, Any], int] = {}
+
+    def __repr__(self) -> str:
+        return f'<MemoryCooldownBackend buckets={len(self._buckets)} concurrency={len(self._concurrency)}>'
+
+    def get_window(self, namespace: str, key: Any) -> Optional[Tuple[float, int]]:
+        state = self._buckets.get((namespace, key))
+        if state is None:
+            return None
+        return state[0], state[1]
+
+    def update_rate_limit(
+        self, namespace: str, key: Any, rate: int, per: float, current: float, tokens: int
+    ) -> Optional[float]:
+        self.sweep(current)
+        state = self._buckets.get((namespace, key))
+        if state is None:
+            state = self._buckets[(namespace, key)] = [0.0, rate, 0.0]
+            self._counter += 1
+            heapq.heappush(self._expiry, (current + per, self._counter, (namespace, key)))
+
+        state[0], state[1], retry_after = _update_tokens(state[0], state[1], rate, per, current, tokens)
+        state[2] = current + per
+        return retry_after
+
+    def reset(self, namespace: str, key: Any) -> None:
+        self._buckets.pop((namespace, key), None)
+
+    def acquire(self, namespace: str, key: Any, number: int) -> bool:
+        count = self._concurrency.get((namespace, key), 0)
+        if count >= number:
+            return False
+        self._concurrency[(namespace, key)] = count + 1
+        return True
+
+    def release(self, namespace: str, key: Any) -> None:
+        count = self._concurrency.pop((namespace, key), 0) - 1
+        if count > 0:
+            self._concurrency[(namespace, key)] = count
+
+    def sweep(self, current: Optional[float] = None) -> int:
+        current = current or time.time()
+        expiry = self._expiry
+        buckets = self._buckets
+        removed = 0
+        # Same lazy scheme as CooldownMapping, entries of buckets used since are pushed back
+        while expiry and expiry[0][0] < current:
+            _, _, bucket_key = heapq.heappop(expiry)
+            state = buckets.get(bucket_key)
+            if state is None:
+                continue
+            if current > state[2]:
+                del buckets[bucket_key]
+                removed += 1
+            else:
+                self._counter += 1
+                heapq.heappush(expiry, (state[2], self._counter, bucket_key))
+        return removed
+
+
+# Every slot is (key hash, window, tokens, expires). A hash of 0 marks a free slot and
+# concurrency counters, which never expire on their own, are stored with an infinite expiry.
+_SLOT = struct.Struct('<Qdqd')
+_HEADER = struct.Struct('<8sI')
+_MAGIC = b'DPYCOOL1'
+_GROUP_SIZE = 8
+_INFINITY = float('inf')
+
+
+class SharedMemoryCooldownBackend(CooldownBackend):
+    """A :class:`CooldownBackend` shared between processes through a memory-mapped file.
+
+    Every process of the bot running on the same machine opens the same file.
+    Operations read and write the mapping directly under a file lock, so
+    checking a cooldown costs no round trip to another process.
+
+    The file holds a fixed number of slots. A bucket can only be stored in a
+    small group of slots chosen by its key, expired buckets being reused first.
+    When every slot of a group is in use the bucket closest to expiring is
+    dropped, so the file should be sized well above the number of buckets
+    expected to be active at once.
+
+    .. versionadded:: 2.6
+
+    .. note::
+
+        This backend requires a POSIX system.
+
+    .. warning::
+
+        Concurrency slots taken by a process that exits without releasing them
+        stay taken until :meth:`clear` is called.
+
+    Parameters
+    -----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The file to share state through. It is created if it doesn't exist.
+    slots: :class:`int`
+        The number of slots to create the file with. Ignored if the file
+        already exists. Defaults to ``65536``, taking up 2MiB.
+
+    Raises
+    -------
+    RuntimeError
+        The system doesn't support file locks.
+    ValueError
+        The file exists but isn't a cooldown file.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], *, slots: int = 65536) -> None:
+        if fcntl is None:
+            raise RuntimeError('SharedMemoryCooldownBackend requires a POSIX system')
+
+        groups = max(slots // _GROUP_SIZE, 1)
+        self.path: str = os.fspath(path)
+        self._lock: threading.Lock = threading.Lock()
+        self._fd: int = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            with self._locked():
+                size = os.fstat(self._fd).st_size
+                if size == 0:
+                    size = _HEADER.size + groups * _GROUP_SIZE * _SLOT.size
+                    os.ftruncate(self._fd, size)
+                    os.pwrite(self._fd, _HEADER.pack(_MAGIC, groups), 0)
+
+            self._mmap: mmap.mmap = mmap.mmap(self._fd, size)
+            magic, groups = _HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC or size != _HEADER.size + groups * _GROUP_SIZE * _SLOT.size:
+                self._mmap.close()
+                raise ValueError(f'{self.path} is not a cooldown file')
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+        self._groups: int = groups
+
+    def __repr__(self) -> str:
+        return f'<SharedMemoryCooldownBackend path={self.path!r} slots={self.slots}>'
+
+    @property
+    def slots(self) -> int:
+        """:class:`int`: The number of slots in the file."""
+        return self._groups * _GROUP_SIZE
+
+    def close(self) -> None:
+        """Closes the file. The state stays in it for other processes."""
+        self._mmap.close()
+        os.close(self._fd)
+
+    def _locked(self) -> _FileLock:
+        return _FileLock(self._lock, self._fd)
+
+    @staticmethod
+    def _hash(kind: bytes, namespace: str, key: Any) -> int:
+        # hash() isn't stable across processes for strings, keys are ints or tuples of them
+        digest = hashlib.blake2b(kind + repr((namespace, key)).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'little') or 1
+
+    def _find(self, hashed: int, current: float, create: bool) -> Optional[int]:
+        # Returns the offset of the slot for a hash, taking a free or expired one if asked to
+        view = self._mmap
+        start = _HEADER.size + (hashed % self._groups) * _GROUP_SIZE * _SLOT.size
+        free = None
+        oldest = None
+        oldest_expires = _INFINITY
+        for offset in range(start, start + _GROUP_SIZE * _SLOT.size, _SLOT.size):
+            slot_hash, _, _, expires = _SLOT.unpack_from(view, offset)
+            if slot_hash == hashed:
+                return offset
+            if free is None and (slot_hash == 0 or expires < current):
+                free = offset
+            if expires < oldest_expires:
+                oldest, oldest_expires = offset, expires
+
+        if not create:
+            return None
+        return free if free is not None else oldest
+
+    def get_window(self, namespace: str, key: Any) -> Optional[Tuple[float, int]]:
+        hashed = self._hash(b'c', namespace, key)
+        with self._locked():
+            offset = self._find(hashed, 0.0, False)
+            if offset is None:
+                return None
+            _, window, tokens, _ = _SLOT.unpack_from(self._mmap, offset)
+        return window, tokens
+
+    def update_rate_limit(
+        self, namespace: str, key: Any, rate: int, per: float, current: float, tokens: int
+    ) -> Optional[float]:
+        hashed = self._hash(b'c', namespace, key)
+        with self._locked():
+            offset = self._find(hashed, current, True)
+            if offset is None:
+                # Every slot of the group holds a running command, don't rate limit without a bucket
+                return None
+
+            slot_hash, window, remaining, _ = _SLOT.unpack_from(self._mmap, offset)
+            if slot_hash != hashed:
+                window, remaining = 0.0, rate
+
+            window, remaining, retry_after = _update_tokens(window, remaining, rate, per, current, tokens)
+            _SLOT.pack_into(self._mmap, offset, hashed, window, remaining, current + per)
+        return retry_after
+
+    def reset(self, namespace: str, key: Any) -> None:
+        hashed = self._hash(b'c', namespace, key)
+        with self._locked():
+            offset = self._find(hashed, 0.0, False)
+            if offset is not None:
+                _SLOT.pack_into(self._mmap, offset, 0, 0.0, 0, 0.0)
+
+    def acquire(self, namespace: str, key: Any, number: int) -> bool:
+        hashed = self._hash(b'm', namespace, key)
+        with self._locked():
+            offset = self._find(hashed, time.time(), True)
+            if offset is None:
+                return False
+
+            slot_hash, _, count, _ = _SLOT.unpack_from(self._mmap, offset)
+            if slot_hash != hashed:
+                count = 0
+            if count >= number:
+                return False
+            _SLOT.pack_into(self._mmap, offset, hashed, 0.0, count + 1, _INFINITY)
+        return True
+
+    def release(self, namespace: str, key: Any) -> None:
+        hashed = self._hash(b'm', namespace, key)
+        with self._locked():
+            offset = self._find(hashed, 0.0, False)
+            if offset is None:
+                return
+
+            _, _, count, _ = _SLOT.unpack_from(self._mmap, offset)
+            if count > 1:
+                _SLOT.pack_into(self._mmap, offset, hashed, 0.0, count - 1, _INFINITY)
+            else:
+                _SLOT.pack_into(self._mmap, offset, 0, 0.0, 0, 0.0)
+
+    def sweep(self, current: Optional[float] = None) -> int:
+        current = current or time.time()
+        view = self._mmap
+        removed = 0
+        with self._locked():
+            for offset in range(_HEADER.size, len(view), _SLOT.size):
+                slot_hash, _, _, expires = _SLOT.unpack_from(view, offset)
+                if slot_hash and expires < current:
+                    _SLOT.pack_into(view, offset, 0, 0.0, 0, 0.0)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Removes every cooldown bucket and concurrency slot, for every process."""
+        with self._locked():
+            self._mmap[_HEADER.size :] = bytes(len(self._mmap) - _HEADER.size)
+
+
+class _FileLock:
+    # Excludes other threads through the lock and other processes through flock
+    __slots__ = ('lock', 'fd')
+
+    def __init__(self, lock: threading.Lock, fd: int) -> None:
+        self.lock: threading.Lock = lock
+        self.fd: int = fd
+
+    def __enter__(self) -> None:
+        self.lock.acquire()
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)  # type: ignore # only constructed when available
+        except BaseException:
+            self.lock.release()
+            raise
+
+    def __exit__(self, *args: Any) -> None:
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)  # type: ignore
+        finally:
+            self.lock.release()
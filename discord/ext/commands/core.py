@@ -31,9 +31,11 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     Dict,
     Generator,
     Generic,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -51,8 +53,8 @@ import discord
 from ._types import _BaseCommand, CogT
 from .cog import Cog
 from .context import Context
-from .converter import Greedy, run_converters
-from .cooldowns import BucketType, Cooldown, CooldownMapping, DynamicCooldownMapping, MaxConcurrency
+from .converter import Greedy, run_converters, _compile_converter
+from .cooldowns import BucketType, Cooldown, CooldownBackend, CooldownMapping, DynamicCooldownMapping, MaxConcurrency
 from .errors import *
 from .parameters import Parameter, Signature
 from discord.app_commands.commands import NUMPY_DOCSTRING_ARG_REGEX
@@ -61,6 +63,7 @@ if TYPE_CHECKING:
     from typing_extensions import Concatenate, ParamSpec, Self
 
     from ._types import BotT, Check, ContextT, Coro, CoroFunc, Error, Hook, UserCheck
+    from .converter import _ConvertFunc
 
 
 __all__ = (
@@ -244,7 +247,9 @@ def hooked_wrapped_callback(
             raise CommandInvokeError(exc) from exc
         finally:
             if command._max_concurrency is not None:
-                await command._max_concurrency.release(ctx.message)
+                await command._max_concurrency.release(
+                    ctx.message, backend=command._cooldown_backend(ctx), namespace=command.qualified_name
+                )
 
             await command.call_after_hooks(ctx)
         return ret
@@ -253,17 +258,25 @@ def hooked_wrapped_callback(
 
 
 class _CaseInsensitiveDict(dict):
+    # Keys are stored casefolded, so names that are already casefolded
+    # (the common case) can be found without casefolding them again.
     def __contains__(self, k):
-        return super().__contains__(k.casefold())
+        return super().__contains__(k) or super().__contains__(k.casefold())
 
     def __delitem__(self, k):
         return super().__delitem__(k.casefold())
 
     def __getitem__(self, k):
-        return super().__getitem__(k.casefold())
+        value = super().get(k, MISSING)
+        if value is MISSING:
+            return super().__getitem__(k.casefold())
+        return value
 
     def get(self, k, default=None):
-        return super().get(k.casefold(), default)
+        value = super().get(k, MISSING)
+        if value is MISSING:
+            return super().get(k.casefold(), default)
+        return value
 
     def pop(self, k, default=None):
         return super().pop(k.casefold(), default)
@@ -293,6 +306,47 @@ class _AttachmentIterator:
         return self.index >= len(self.data)
 
 
+class _ParameterPlan:
+    # Everything transform has to find out about a parameter before converting
+    # an argument for it, worked out once per parameter rather than per invocation
+
+    GREEDY_ATTACHMENTS = 1
+    GREEDY_POSITIONAL = 2
+    GREEDY_VAR_POSITIONAL = 3
+
+    __slots__ = (
+        'param',
+        'converter',
+        'convert',
+        'greedy',
+        'attachment',
+        'optional',
+        'optional_attachment',
+        'flag_default',
+    )
+
+    def __init__(self, command: Command[Any, ..., Any], param: Parameter) -> None:
+        converter = param.converter
+        self.param: Parameter = param
+        self.greedy: int = 0
+        if isinstance(converter, Greedy):
+            if converter.converter is discord.Attachment:
+                self.greedy = self.GREEDY_ATTACHMENTS
+            elif param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
+                self.greedy = self.GREEDY_POSITIONAL
+            elif param.kind == param.VAR_POSITIONAL:
+                self.greedy = self.GREEDY_VAR_POSITIONAL
+            # a KEYWORD_ONLY Greedy[X] is parsed as just X
+            converter = converter.constructed_converter
+
+        self.converter: Any = converter
+        self.convert: _ConvertFunc = _compile_converter(converter)
+        self.attachment: bool = converter is discord.Attachment
+        self.optional: bool = command._is_typing_optional(param.annotation)
+        self.optional_attachment: bool = self.optional and param.annotation.__args__[0] is discord.Attachment
+        self.flag_default: bool = hasattr(converter, '__commands_is_flag__') and converter._can_be_constructible()
+
+
 class Command(_BaseCommand, Generic[CogT, P, T]):
     r"""A class that implements the protocol for a bot text command.
 
@@ -511,6 +565,9 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             globalns = {}
 
         self.params: Dict[str, Parameter] = get_signature_parameters(function, globalns)
+        # Parameter name -> how to parse it, filled as the command is invoked
+        self._parameter_plans: Dict[str, _ParameterPlan] = {}
+        self._signature_cache: Optional[Tuple[Tuple[Tuple[str, Parameter], ...], str]] = None
 
     def add_check(self, func: UserCheck[Context[Any]], /) -> None:
         """Adds a check to the command.
@@ -650,36 +707,38 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             ctx.bot.dispatch('command_error', ctx, error)
 
     async def transform(self, ctx: Context[BotT], param: Parameter, attachments: _AttachmentIterator, /) -> Any:
-        converter = param.converter
+        return await self._transform(ctx, _ParameterPlan(self, param), attachments)
+
+    def _get_plan(self, param: Parameter) -> _ParameterPlan:
+        plan = self._parameter_plans.get(param.name)
+        if plan is None or plan.param is not param:
+            plan = self._parameter_plans[param.name] = _ParameterPlan(self, param)
+        return plan
+
+    async def _transform(self, ctx: Context[BotT], plan: _ParameterPlan, attachments: _AttachmentIterator) -> Any:
+        param = plan.param
         consume_rest_is_special = param.kind == param.KEYWORD_ONLY and not self.rest_is_raw
         view = ctx.view
         view.skip_ws()
 
         # The greedy converter is simple -- it keeps going until it fails in which case,
         # it undos the view ready for the next parameter to use instead
-        if isinstance(converter, Greedy):
+        if plan.greedy:
             # Special case for Greedy[discord.Attachment] to consume the attachments iterator
-            if converter.converter is discord.Attachment:
+            if plan.greedy == plan.GREEDY_ATTACHMENTS:
                 return list(attachments)
-
-            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
-                return await self._transform_greedy_pos(ctx, param, param.required, converter.constructed_converter)
-            elif param.kind == param.VAR_POSITIONAL:
-                return await self._transform_greedy_var_pos(ctx, param, converter.constructed_converter)
-            else:
-                # if we're here, then it's a KEYWORD_ONLY param type
-                # since this is mostly useless, we'll helpfully transform Greedy[X]
-                # into just X and do the parsing that way.
-                converter = converter.constructed_converter
+            if plan.greedy == plan.GREEDY_POSITIONAL:
+                return await self._transform_greedy_pos(ctx, param, param.required, plan.convert)
+            return await self._transform_greedy_var_pos(ctx, param, plan.convert)
 
         # Try to detect Optional[discord.Attachment] or discord.Attachment special converter
-        if converter is discord.Attachment:
+        if plan.attachment:
             try:
                 return next(attachments)
             except StopIteration:
                 raise MissingRequiredAttachment(param)
 
-        if self._is_typing_optional(param.annotation) and param.annotation.__args__[0] is discord.Attachment:
+        if plan.optional_attachment:
             if attachments.is_empty():
                 # I have no idea who would be doing Optional[discord.Attachment] = 1
                 # but for those cases then 1 should be returned instead of None
@@ -690,10 +749,10 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             if param.kind == param.VAR_POSITIONAL:
                 raise RuntimeError()  # break the loop
             if param.required:
-                if self._is_typing_optional(param.annotation):
+                if plan.optional:
                     return None
-                if hasattr(converter, '__commands_is_flag__') and converter._can_be_constructible():
-                    return await converter._construct_default(ctx)
+                if plan.flag_default:
+                    return await plan.converter._construct_default(ctx)
                 raise MissingRequiredArgument(param)
             return await param.get_default(ctx)
 
@@ -704,17 +763,18 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             try:
                 ctx.current_argument = argument = view.get_quoted_word()
             except ArgumentParsingError as exc:
-                if self._is_typing_optional(param.annotation):
+                if plan.optional:
                     view.index = previous
                     return None if param.required else await param.get_default(ctx)
                 else:
                     raise exc
         view.previous = previous
 
-        # type-checker fails to narrow argument
-        return await run_converters(ctx, converter, argument, param)  # type: ignore
+        return await plan.convert(ctx, argument, param)  # type: ignore
 
-    async def _transform_greedy_pos(self, ctx: Context[BotT], param: Parameter, required: bool, converter: Any) -> Any:
+    async def _transform_greedy_pos(
+        self, ctx: Context[BotT], param: Parameter, required: bool, convert: _ConvertFunc
+    ) -> Any:
         view = ctx.view
         result = []
         while not view.eof:
@@ -724,7 +784,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             view.skip_ws()
             try:
                 ctx.current_argument = argument = view.get_quoted_word()
-                value = await run_converters(ctx, converter, argument, param)  # type: ignore
+                value = await convert(ctx, argument, param)  # type: ignore
             except (CommandError, ArgumentParsingError):
                 view.index = previous
                 break
@@ -735,12 +795,12 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             return await param.get_default(ctx)
         return result
 
-    async def _transform_greedy_var_pos(self, ctx: Context[BotT], param: Parameter, converter: Any) -> Any:
+    async def _transform_greedy_var_pos(self, ctx: Context[BotT], param: Parameter, convert: _ConvertFunc) -> Any:
         view = ctx.view
         previous = view.index
         try:
             ctx.current_argument = argument = view.get_quoted_word()
-            value = await run_converters(ctx, converter, argument, param)  # type: ignore
+            value = await convert(ctx, argument, param)  # type: ignore
         except (CommandError, ArgumentParsingError):
             view.index = previous
             raise RuntimeError() from None  # break loop
@@ -839,25 +899,37 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         view = ctx.view
         iterator = iter(self.params.items())
 
+        # Subclasses overriding transform get called with the parameter like before
+        overridden = type(self).transform is not Command.transform
+
         for name, param in iterator:
             ctx.current_parameter = param
+            plan = self._get_plan(param)
             if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
-                transformed = await self.transform(ctx, param, attachments)
+                if overridden:
+                    transformed = await self.transform(ctx, param, attachments)
+                else:
+                    transformed = await self._transform(ctx, plan, attachments)
                 args.append(transformed)
             elif param.kind == param.KEYWORD_ONLY:
                 # kwarg only param denotes "consume rest" semantics
                 if self.rest_is_raw:
                     ctx.current_argument = argument = view.read_rest()
                     kwargs[name] = await run_converters(ctx, param.converter, argument, param)
-                else:
+                elif overridden:
                     kwargs[name] = await self.transform(ctx, param, attachments)
+                else:
+                    kwargs[name] = await self._transform(ctx, plan, attachments)
                 break
             elif param.kind == param.VAR_POSITIONAL:
                 if view.eof and self.require_var_positional:
                     raise MissingRequiredArgument(param)
                 while not view.eof:
                     try:
-                        transformed = await self.transform(ctx, param, attachments)
+                        if overridden:
+                            transformed = await self.transform(ctx, param, attachments)
+                        else:
+                            transformed = await self._transform(ctx, plan, attachments)
                         args.append(transformed)
                     except RuntimeError:
                         break
@@ -909,11 +981,20 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         if hook is not None:
             await hook(ctx)
 
+    def _cooldown_backend(self, ctx: Context[BotT]) -> Optional[CooldownBackend]:
+        return getattr(ctx.bot, 'cooldown_backend', None)
+
+    def _get_bucket(self, ctx: Context[BotT], current: Optional[float] = None) -> Optional[Cooldown]:
+        backend = self._cooldown_backend(ctx)
+        if backend is None:
+            return self._buckets.get_bucket(ctx, current)
+        return self._buckets.get_bucket(ctx, current, backend=backend, namespace=self.qualified_name)
+
     def _prepare_cooldowns(self, ctx: Context[BotT]) -> None:
         if self._buckets.valid:
             dt = ctx.message.edited_at or ctx.message.created_at
             current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
-            bucket = self._buckets.get_bucket(ctx, current)
+            bucket = self._get_bucket(ctx, current)
             if bucket is not None:
                 retry_after = bucket.update_rate_limit(current)
                 if retry_after:
@@ -927,7 +1008,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
 
         if self._max_concurrency is not None:
             # For this application, context can be duck-typed as a Message
-            await self._max_concurrency.acquire(ctx)
+            await self._max_concurrency.acquire(ctx, backend=self._cooldown_backend(ctx), namespace=self.qualified_name)
 
         try:
             if self.cooldown_after_parsing:
@@ -940,7 +1021,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             await self.call_before_hooks(ctx)
         except:
             if self._max_concurrency is not None:
-                await self._max_concurrency.release(ctx)
+                await self._max_concurrency.release(ctx, backend=self._cooldown_backend(ctx), namespace=self.qualified_name)
             raise
 
     def is_on_cooldown(self, ctx: Context[BotT], /) -> bool:
@@ -963,7 +1044,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         if not self._buckets.valid:
             return False
 
-        bucket = self._buckets.get_bucket(ctx)
+        bucket = self._get_bucket(ctx)
         if bucket is None:
             return False
         dt = ctx.message.edited_at or ctx.message.created_at
@@ -983,7 +1064,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             The invocation context to reset the cooldown under.
         """
         if self._buckets.valid:
-            bucket = self._buckets.get_bucket(ctx)
+            bucket = self._get_bucket(ctx)
             if bucket is not None:
                 bucket.reset()
 
@@ -1008,7 +1089,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             If this is ``0.0`` then the command isn't on cooldown.
         """
         if self._buckets.valid:
-            bucket = self._buckets.get_bucket(ctx)
+            bucket = self._get_bucket(ctx)
             if bucket is None:
                 return 0.0
             dt = ctx.message.edited_at or ctx.message.created_at
@@ -1170,6 +1251,18 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         if self.usage is not None:
             return self.usage
 
+        # Help commands ask for this for every command they list, so it's only rebuilt when params change.
+        # Comparing the items is cheap while they're the same objects.
+        params = tuple(self.params.items())
+        cached = self._signature_cache
+        if cached is not None and cached[0] == params:
+            return cached[1]
+
+        signature = self._build_signature()
+        self._signature_cache = (params, signature)
+        return signature
+
+    def _build_signature(self) -> str:
         params = self.clean_params
         if not params:
             return ''
@@ -1285,6 +1378,9 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
                 # since we have no checks, then we just return True.
                 return True
 
+            if len(predicates) > 1 and getattr(ctx.bot, 'concurrent_checks', False):
+                return await _run_checks_concurrently(predicates, ctx)
+
             return await discord.utils.async_all(predicate(ctx) for predicate in predicates)  # type: ignore
         finally:
             ctx.command = original
@@ -1298,17 +1394,63 @@ class GroupMixin(Generic[CogT]):
     -----------
     all_commands: :class:`dict`
         A mapping of command name to :class:`.Command`
-        objects.
+        objects. It should only be modified through :meth:`add_command`
+        and :meth:`remove_command`.
     case_insensitive: :class:`bool`
         Whether the commands should be case insensitive. Defaults to ``False``.
     """
 
+    # Bumped whenever a command is added to or removed from any GroupMixin.
+    # The flattened command indexes are rebuilt when it changes, since
+    # a group doesn't know about every GroupMixin it's registered in.
+    _command_registry_version: ClassVar[int] = 0
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         case_insensitive = kwargs.get('case_insensitive', False)
         self.all_commands: Dict[str, Command[CogT, ..., Any]] = _CaseInsensitiveDict() if case_insensitive else {}
         self.case_insensitive: bool = case_insensitive
+        # (registry version, qualified name -> command, commands in walk order)
+        self.__command_index: Optional[
+            Tuple[int, Dict[str, Command[CogT, ..., Any]], Tuple[Command[CogT, ..., Any], ...]]
+        ] = None
         super().__init__(*args, **kwargs)
 
+    @staticmethod
+    def _invalidate_command_index() -> None:
+        GroupMixin._command_registry_version += 1
+
+    def _get_command_index(
+        self,
+    ) -> Tuple[Dict[str, Command[CogT, ..., Any]], Tuple[Command[CogT, ..., Any], ...]]:
+        # Maps every name a command can be reached by from here, aliases included, to it.
+        # e.g. with a group `tag` aliased `t` and a subcommand `create`, both 'tag create'
+        # and 't create' are keys. Names of case insensitive groups are stored casefolded.
+        version = GroupMixin._command_registry_version
+        cached = self.__command_index
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        index: Dict[str, Command[CogT, ..., Any]] = {}
+        walked: List[Command[CogT, ..., Any]] = []
+        seen: Set[Command[CogT, ..., Any]] = set()
+        for name, command in self.all_commands.items():
+            index[name] = command
+            is_group = isinstance(command, GroupMixin)
+            if is_group:
+                sub_index, sub_walked = command._get_command_index()
+                for sub_name, sub_command in sub_index.items():
+                    index[f'{name} {sub_name}'] = sub_command
+
+            if command not in seen:
+                seen.add(command)
+                walked.append(command)
+                if is_group:
+                    walked.extend(sub_walked)  # type: ignore # bound above
+
+        walked_tuple = tuple(walked)
+        self.__command_index = (version, index, walked_tuple)
+        return index, walked_tuple
+
     @property
     def commands(self) -> Set[Command[CogT, ..., Any]]:
         """Set[:class:`.Command`]: A unique set of commands without aliases that are registered."""
@@ -1355,6 +1497,7 @@ class GroupMixin(Generic[CogT]):
         if command.name in self.all_commands:
             raise CommandRegistrationError(command.name)
 
+        self._invalidate_command_index()
         self.all_commands[command.name] = command
         for alias in command.aliases:
             if alias in self.all_commands:
@@ -1389,6 +1532,7 @@ class GroupMixin(Generic[CogT]):
         if command is None:
             return None
 
+        self._invalidate_command_index()
         if name in command.aliases:
             # we're removing an alias so we don't want to remove the rest
             return command
@@ -1409,15 +1553,15 @@ class GroupMixin(Generic[CogT]):
         .. versionchanged:: 1.4
             Duplicates due to aliases are no longer returned
 
+        .. versionchanged:: 2.6
+            Commands are walked from a snapshot that is only rebuilt after commands are added or removed.
+
         Yields
         ------
         Union[:class:`.Command`, :class:`.Group`]
             A command or group from the internal list of commands.
         """
-        for command in self.commands:
-            yield command
-            if isinstance(command, GroupMixin):
-                yield from command.walk_commands()
+        yield from self._get_command_index()[1]
 
     def get_command(self, name: str, /) -> Optional[Command[CogT, ..., Any]]:
         """Get a :class:`.Command` from the internal list
@@ -1433,6 +1577,9 @@ class GroupMixin(Generic[CogT]):
 
             ``name`` parameter is now positional-only.
 
+        .. versionchanged:: 2.6
+            Fully qualified names are looked up in a flattened index of every subcommand.
+
         Parameters
         -----------
         name: :class:`str`
@@ -1448,6 +1595,12 @@ class GroupMixin(Generic[CogT]):
         if ' ' not in name:
             return self.all_commands.get(name)
 
+        command = self._get_command_index()[0].get(name)
+        if command is not None:
+            return command
+
+        # Extra whitespace, names of case insensitive groups that aren't casefolded
+        # or trailing arguments after a command all need walking the groups.
         names = name.split()
         if not names:
             return None
@@ -1839,6 +1992,46 @@ def group(
     return command(name=name, cls=cls, **attrs)
 
 
+async def _run_checks_concurrently(predicates: Iterable[UserCheck[ContextT]], ctx: ContextT) -> bool:
+    # Same outcome as async_all, the first failing check in order decides
+    results = await asyncio.gather(
+        *(discord.utils.maybe_coroutine(predicate, ctx) for predicate in predicates),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        if not result:
+            return False
+    return True
+
+
+def _memoize_check(key: Tuple[Any, ...], predicate: Callable[[ContextT], bool]) -> Callable[[ContextT], bool]:
+    # The built-in checks only depend on who invokes a command and where, so the same check
+    # on several commands, e.g. listed by the help command, is only evaluated once per context.
+    def memoized(ctx: ContextT) -> bool:
+        get_check_results = getattr(ctx, '_get_check_results', None)
+        if get_check_results is None:
+            return predicate(ctx)
+
+        results = get_check_results()
+        try:
+            result = results[key]
+        except KeyError:
+            try:
+                result = results[key] = predicate(ctx)
+            except CommandError as e:
+                results[key] = e
+                raise
+            return result
+
+        if isinstance(result, CommandError):
+            raise result.with_traceback(None)
+        return result
+
+    return functools.wraps(predicate)(memoized)
+
+
 def check(predicate: UserCheck[ContextT], /) -> Check[ContextT]:
     r"""A decorator that adds a check to the :class:`.Command` or its
     subclasses. These checks could be accessed via :attr:`.Command.checks`.
@@ -2051,7 +2244,7 @@ def has_role(item: Union[int, str], /) -> Check[Any]:
             raise MissingRole(item)
         return True
 
-    return check(predicate)
+    return check(_memoize_check(('has_role', item), predicate))
 
 
 def has_any_role(*items: Union[int, str]) -> Callable[[T], T]:
@@ -2100,7 +2293,7 @@ def has_any_role(*items: Union[int, str]) -> Callable[[T], T]:
             return True
         raise MissingAnyRole(list(items))
 
-    return check(predicate)
+    return check(_memoize_check(('has_any_role', items), predicate))
 
 
 def bot_has_role(item: int, /) -> Callable[[T], T]:
@@ -2133,7 +2326,7 @@ def bot_has_role(item: int, /) -> Callable[[T], T]:
             raise BotMissingRole(item)
         return True
 
-    return check(predicate)
+    return check(_memoize_check(('bot_has_role', item), predicate))
 
 
 def bot_has_any_role(*items: int) -> Callable[[T], T]:
@@ -2162,7 +2355,7 @@ def bot_has_any_role(*items: int) -> Callable[[T], T]:
             return True
         raise BotMissingAnyRole(list(items))
 
-    return check(predicate)
+    return check(_memoize_check(('bot_has_any_role', items), predicate))
 
 
 def has_permissions(**perms: bool) -> Check[Any]:
@@ -2209,7 +2402,7 @@ def has_permissions(**perms: bool) -> Check[Any]:
 
         raise MissingPermissions(missing)
 
-    return check(predicate)
+    return check(_memoize_check(('has_permissions', tuple(perms.items())), predicate))
 
 
 def bot_has_permissions(**perms: bool) -> Check[Any]:
@@ -2234,7 +2427,7 @@ def bot_has_permissions(**perms: bool) -> Check[Any]:
 
         raise BotMissingPermissions(missing)
 
-    return check(predicate)
+    return check(_memoize_check(('bot_has_permissions', tuple(perms.items())), predicate))
 
 
 def has_guild_permissions(**perms: bool) -> Check[Any]:
@@ -2263,7 +2456,7 @@ def has_guild_permissions(**perms: bool) -> Check[Any]:
 
         raise MissingPermissions(missing)
 
-    return check(predicate)
+    return check(_memoize_check(('has_guild_permissions', tuple(perms.items())), predicate))
 
 
 def bot_has_guild_permissions(**perms: bool) -> Check[Any]:
@@ -2289,7 +2482,7 @@ def bot_has_guild_permissions(**perms: bool) -> Check[Any]:
 
         raise BotMissingPermissions(missing)
 
-    return check(predicate)
+    return check(_memoize_check(('bot_has_guild_permissions', tuple(perms.items())), predicate))
 
 
 def dm_only() -> Check[Any]:
@@ -24,6 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import itertools
 import copy
 import functools
@@ -169,19 +170,22 @@ class Paginator:
         RuntimeError
             The line was too big for the current :attr:`max_size`.
         """
-        max_page_size = self.max_size - self._prefix_len - self._suffix_len - 2 * self._linesep_len
-        if len(line) > max_page_size:
+        suffix_len = self._suffix_len
+        linesep_len = len(self.linesep)
+        line_len = len(line)
+        max_page_size = self.max_size - self._prefix_len - suffix_len - 2 * linesep_len
+        if line_len > max_page_size:
             raise RuntimeError(f'Line exceeds maximum page size {max_page_size}')
 
-        if self._count + len(line) + self._linesep_len > self.max_size - self._suffix_len:
+        if self._count + line_len + linesep_len > self.max_size - suffix_len:
             self.close_page()
 
-        self._count += len(line) + self._linesep_len
+        self._count += line_len + linesep_len
         self._current_page.append(line)
 
         if empty:
             self._current_page.append('')
-            self._count += self._linesep_len
+            self._count += linesep_len
 
     def close_page(self) -> None:
         """Prematurely terminate a page."""
@@ -652,17 +656,27 @@ class HelpCommand:
             return sorted(iterator, key=key) if sort else list(iterator)  # type: ignore
 
         # if we're here then we need to check every command if it can run
-        async def predicate(cmd: Command[Any, ..., Any]) -> bool:
+        # a command listed more than once during an invocation, e.g. under a cog and a group, is only checked once
+        results = self.context._get_check_results()
+
+        async def predicate(cmd: Command[Any, ..., Any], ctx: Context[BotT]) -> bool:
             try:
-                return await cmd.can_run(self.context)
+                valid = await cmd.can_run(ctx)
             except CommandError:
-                return False
+                valid = False
+            results[('can_run', cmd)] = valid
+            return valid
+
+        pending = list(iterator)
+        unchecked = [cmd for cmd in dict.fromkeys(pending) if ('can_run', cmd) not in results]
+        if self.context.bot.concurrent_checks:
+            # can_run swaps out ctx.command while it runs, so checks running together can't share a context
+            await asyncio.gather(*(predicate(cmd, copy.copy(self.context)) for cmd in unchecked))
+        else:
+            for cmd in unchecked:
+                await predicate(cmd, self.context)
 
-        ret = []
-        for cmd in iterator:
-            valid = await predicate(cmd)
-            if valid:
-                ret.append(cmd)
+        ret = [cmd for cmd in pending if results[('can_run', cmd)]]
 
         if sort:
             ret.sort(key=key)
@@ -966,22 +980,26 @@ class HelpCommand:
         # passes an invalid subcommand, we need to walk through
         # the command group chain ourselves.
         keys = command.split(' ')
-        cmd = bot.all_commands.get(keys[0])
+        # Existing subcommands are found in the bot's flattened index, only
+        # names that aren't found are walked to know which part is wrong.
+        cmd = bot._get_command_index()[0].get(command) if len(keys) > 1 else None
         if cmd is None:
-            string = await maybe_coro(self.command_not_found, self.remove_mentions(keys[0]))
-            return await self.send_error_message(string)
-
-        for key in keys[1:]:
-            try:
-                found = cmd.all_commands.get(key)  # type: ignore
-            except AttributeError:
-                string = await maybe_coro(self.subcommand_not_found, cmd, self.remove_mentions(key))
+            cmd = bot.all_commands.get(keys[0])
+            if cmd is None:
+                string = await maybe_coro(self.command_not_found, self.remove_mentions(keys[0]))
                 return await self.send_error_message(string)
-            else:
-                if found is None:
+
+            for key in keys[1:]:
+                try:
+                    found = cmd.all_commands.get(key)  # type: ignore
+                except AttributeError:
                     string = await maybe_coro(self.subcommand_not_found, cmd, self.remove_mentions(key))
                     return await self.send_error_message(string)
-                cmd = found
+                else:
+                    if found is None:
+                        string = await maybe_coro(self.subcommand_not_found, cmd, self.remove_mentions(key))
+                        return await self.send_error_message(string)
+                    cmd = found
 
         if isinstance(cmd, Group):
             return await self.send_group_help(cmd)
@@ -807,6 +807,7 @@ class HybridGroup(Group[CogT, P, T]):
         if command.name in self.all_commands:
             raise CommandRegistrationError(command.name)
 
+        self._invalidate_command_index()
         self.all_commands[command.name] = command
         for alias in command.aliases:
             if alias in self.all_commands:
@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from .errors import UnexpectedQuoteError, InvalidEndOfQuotedStringError, ExpectedClosingQuoteError
 
@@ -194,3 +194,42 @@ class StringView:
 
     def __repr__(self) -> str:
         return f'<StringView pos: {self.index} prev: {self.previous} end: {self.end} eof: {self.eof}>'
+
+
+class _PrefixTrie:
+    """Matches the start of a message against many prefixes at once.
+
+    The match is the same as trying :meth:`StringView.skip_string` with each
+    prefix in order, the first prefix in iteration order wins even if a longer
+    one also matches. A message that can't start with any prefix is rejected
+    after looking at its first character.
+    """
+
+    __slots__ = ('prefixes', '_root')
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        self.prefixes: Tuple[str, ...] = tuple(prefixes)
+        # Each node maps characters to child nodes, and None to the
+        # (index, prefix) of the first prefix that ends there
+        self._root: Dict[Any, Any] = {}
+        for index, prefix in enumerate(self.prefixes):
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node.setdefault(None, (index, prefix))
+
+    def match(self, content: str) -> Optional[str]:
+        node = self._root
+        best = node.get(None)
+        for char in content:
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(None)
+            if found is not None and (best is None or found[0] < best[0]):
+                best = found
+
+        return None if best is None else best[1]
+
+    def __repr__(self) -> str:
+        return f'<_PrefixTrie prefixes={len(self.prefixes)}>'
@@ -32,6 +32,7 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Optional,
@@ -42,7 +43,7 @@ from typing import (
     overload,
 )
 
-from .enums import UserFlags
+from .enums import ChannelType, UserFlags
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -54,6 +55,7 @@ __all__ = (
     'PublicUserFlags',
     'Intents',
     'MemberCacheFlags',
+    'CacheFlags',
     'ApplicationFlags',
     'ChannelFlags',
     'AutoModPresets',
@@ -1500,6 +1502,204 @@ class MemberCacheFlags(BaseFlags):
         return self.value == 1
 
 
+@fill_with_flags()
+class CacheFlags(BaseFlags):
+    """Controls the library's cache policy for guild entities other than members.
+
+    This allows large bots to cut their memory usage by not caching entity types
+    they have no use for. Members are controlled separately by :class:`MemberCacheFlags`.
+    This class is passed to the ``cache_flags`` parameter in :class:`Client`.
+
+    Entities that are not cached are still dispatched in their respective events,
+    but lookups such as :meth:`Guild.get_channel` or :attr:`Guild.roles` will not
+    find them. In particular, disabling :attr:`roles` means permissions can no
+    longer be resolved from the cache.
+
+    To construct an object you can pass keyword arguments denoting the flags
+    to enable or disable.
+
+    The default value is all flags enabled.
+
+    .. versionadded:: 2.6
+
+    .. container:: operations
+
+        .. describe:: x == y
+
+            Checks if two flags are equal.
+        .. describe:: x != y
+
+            Checks if two flags are not equal.
+
+        .. describe:: x | y, x |= y
+
+            Returns a CacheFlags instance with all enabled flags from
+            both x and y.
+
+        .. describe:: x & y, x &= y
+
+            Returns a CacheFlags instance with only flags enabled on
+            both x and y.
+
+        .. describe:: x ^ y, x ^= y
+
+            Returns a CacheFlags instance with only flags enabled on
+            only one of x or y, not on both.
+
+        .. describe:: ~x
+
+            Returns a CacheFlags instance with all flags inverted from x.
+
+        .. describe:: hash(x)
+
+               Return the flag's hash.
+        .. describe:: iter(x)
+
+               Returns an iterator of ``(name, value)`` pairs. This allows it
+               to be, for example, constructed as a dict or a list of pairs.
+
+        .. describe:: bool(b)
+
+            Returns whether any flag is set to ``True``.
+
+    Attributes
+    -----------
+    value: :class:`int`
+        The raw value. You should query flags via the properties
+        rather than using this raw value.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **kwargs: bool):
+        bits = max(self.VALID_FLAGS.values()).bit_length()
+        self.value: int = (1 << bits) - 1
+        for key, value in kwargs.items():
+            if key not in self.VALID_FLAGS:
+                raise TypeError(f'{key!r} is not a valid flag name.')
+            setattr(self, key, value)
+
+    @classmethod
+    def all(cls: Type[CacheFlags]) -> CacheFlags:
+        """A factory method that creates a :class:`CacheFlags` with everything enabled."""
+        bits = max(cls.VALID_FLAGS.values()).bit_length()
+        value = (1 << bits) - 1
+        self = cls.__new__(cls)
+        self.value = value
+        return self
+
+    @classmethod
+    def none(cls: Type[CacheFlags]) -> CacheFlags:
+        """A factory method that creates a :class:`CacheFlags` with everything disabled."""
+        self = cls.__new__(cls)
+        self.value = self.DEFAULT_VALUE
+        return self
+
+    @alias_flag_value
+    def channels(self):
+        """:class:`bool`: Whether to cache every type of guild channel.
+
+        This corresponds to :attr:`text_channels`, :attr:`voice_channels`,
+        :attr:`stage_channels`, :attr:`categories` and :attr:`forums` together.
+        """
+        return 0b11111
+
+    @flag_value
+    def text_channels(self):
+        """:class:`bool`: Whether to cache text and news channels."""
+        return 1 << 0
+
+    @flag_value
+    def voice_channels(self):
+        """:class:`bool`: Whether to cache voice channels."""
+        return 1 << 1
+
+    @flag_value
+    def stage_channels(self):
+        """:class:`bool`: Whether to cache stage channels."""
+        return 1 << 2
+
+    @flag_value
+    def categories(self):
+        """:class:`bool`: Whether to cache category channels."""
+        return 1 << 3
+
+    @flag_value
+    def forums(self):
+        """:class:`bool`: Whether to cache forum and media channels."""
+        return 1 << 4
+
+    @flag_value
+    def threads(self):
+        """:class:`bool`: Whether to cache threads."""
+        return 1 << 5
+
+    @flag_value
+    def roles(self):
+        """:class:`bool`: Whether to cache roles.
+
+        Disabling this means permissions can no longer be computed from the cache.
+        The @everyone role is always cached.
+        """
+        return 1 << 6
+
+    @flag_value
+    def emojis(self):
+        """:class:`bool`: Whether to cache guild emojis.
+
+        This requires :attr:`Intents.emojis_and_stickers` to have any effect.
+        """
+        return 1 << 7
+
+    @flag_value
+    def stickers(self):
+        """:class:`bool`: Whether to cache guild stickers.
+
+        This requires :attr:`Intents.emojis_and_stickers` to have any effect.
+        """
+        return 1 << 8
+
+    @flag_value
+    def voice_states(self):
+        """:class:`bool`: Whether to cache the voice states of other members.
+
+        The bot's own voice state is always cached. Since :attr:`MemberCacheFlags.voice`
+        relies on voice states, disabling this also stops members in voice from being
+        cached during start-up.
+        """
+        return 1 << 9
+
+    @flag_value
+    def stage_instances(self):
+        """:class:`bool`: Whether to cache stage instances."""
+        return 1 << 10
+
+    @flag_value
+    def scheduled_events(self):
+        """:class:`bool`: Whether to cache scheduled events."""
+        return 1 << 11
+
+    @flag_value
+    def soundboard_sounds(self):
+        """:class:`bool`: Whether to cache soundboard sounds."""
+        return 1 << 12
+
+    @property
+    def _channel_types(self) -> FrozenSet[ChannelType]:
+        types = set()
+        if self.text_channels:
+            types.update((ChannelType.text, ChannelType.news))
+        if self.voice_channels:
+            types.add(ChannelType.voice)
+        if self.stage_channels:
+            types.add(ChannelType.stage_voice)
+        if self.categories:
+            types.add(ChannelType.category)
+        if self.forums:
+            types.update((ChannelType.forum, ChannelType.media))
+        return frozenset(types)
+
+
 @fill_with_flags()
 class ApplicationFlags(BaseFlags):
     r"""Wraps up the Discord Application flags.
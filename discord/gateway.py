@@ -43,6 +43,7 @@ from . import utils
 from .activity import BaseActivity
 from .enums import SpeakingState
 from .errors import ConnectionClosed
+from .metrics import GatewayMetrics
 
 _log = logging.getLogger(__name__)
 
@@ -93,6 +94,7 @@ class GatewayRatelimiter:
         self.per: float = per
         self.lock: asyncio.Lock = asyncio.Lock()
         self.shard_id: Optional[int] = None
+        self.metrics: Optional[GatewayMetrics] = None
 
     def is_ratelimited(self) -> bool:
         current = time.time()
@@ -116,6 +118,19 @@ class GatewayRatelimiter:
         return 0.0
 
     async def block(self) -> None:
+        metrics = self.metrics
+        if metrics is None:
+            return await self._block()
+
+        metrics.send_queue_depth += 1
+        start = time.perf_counter()
+        try:
+            await self._block()
+        finally:
+            metrics.send_queue_depth -= 1
+            metrics.ratelimit_wait_time += time.perf_counter() - start
+
+    async def _block(self) -> None:
         async with self.lock:
             delta = self.get_delay()
             if delta:
@@ -280,6 +295,8 @@ class DiscordWebSocket:
         The gateway we are currently connected to.
     token
         The authentication token for discord.
+    metrics
+        The :class:`GatewayMetrics` this websocket records its traffic into.
     """
 
     if TYPE_CHECKING:
@@ -310,9 +327,16 @@ class DiscordWebSocket:
     GUILD_SYNC                  = 12
     # fmt: on
 
-    def __init__(self, socket: aiohttp.ClientWebSocketResponse, *, loop: asyncio.AbstractEventLoop) -> None:
+    def __init__(
+        self,
+        socket: aiohttp.ClientWebSocketResponse,
+        *,
+        loop: asyncio.AbstractEventLoop,
+        metrics: Optional[GatewayMetrics] = None,
+    ) -> None:
         self.socket: aiohttp.ClientWebSocketResponse = socket
         self.loop: asyncio.AbstractEventLoop = loop
+        self.metrics: GatewayMetrics = metrics or GatewayMetrics()
 
         # an empty dispatcher to prevent crashes
         self._dispatch: Callable[..., Any] = lambda *args: None
@@ -328,6 +352,7 @@ class DiscordWebSocket:
         self._decompressor: utils._DecompressionContext = utils._ActiveDecompressionContext()
         self._close_code: Optional[int] = None
         self._rate_limiter: GatewayRatelimiter = GatewayRatelimiter()
+        self._rate_limiter.metrics = self.metrics
 
     @property
     def open(self) -> bool:
@@ -373,7 +398,7 @@ class DiscordWebSocket:
             )
 
         socket = await client.http.ws_connect(str(url))
-        ws = cls(socket, loop=client.loop)
+        ws = cls(socket, loop=client.loop, metrics=client._connection._get_gateway_metrics(shard_id))
 
         # dynamically add attributes needed
         ws.token = client.http.token
@@ -488,15 +513,23 @@ class DiscordWebSocket:
         _log.debug('Shard ID %s has sent the RESUME payload.', self.shard_id)
 
     async def received_message(self, msg: Any, /) -> None:
+        metrics = self.metrics
         if type(msg) is bytes:
+            metrics.compressed_bytes += len(msg)
+            start = time.perf_counter()
             msg = self._decompressor.decompress(msg)
+            metrics.decompression_time += time.perf_counter() - start
 
             # Received a partial gateway message
             if msg is None:
                 return
 
+        metrics.messages_received += 1
+        metrics.uncompressed_bytes += len(msg)
         self.log_receive(msg)
+        start = time.perf_counter()
         msg = utils._from_json(msg)
+        metrics.decode_time += time.perf_counter() - start
 
         _log.debug('For Shard ID %s: WebSocket Event: %s', self.shard_id, msg)
         event = msg.get('t')
@@ -571,7 +604,9 @@ class DiscordWebSocket:
         except KeyError:
             _log.debug('Unknown event %s.', event)
         else:
+            start = time.perf_counter()
             func(data)
+            metrics._record_event(event, time.perf_counter() - start)
 
         # remove the dispatched listeners
         removed = []
@@ -782,7 +817,8 @@ class DiscordVoiceWebSocket:
     SESSION_DESCRIPTION
         Receive only. Gives you the secret key required for voice.
     SPEAKING
-        Send only. Notifies the client if you are currently speaking.
+        Notifies the client if you are currently speaking. When received,
+        tells you which user a given SSRC belongs to.
     HEARTBEAT_ACK
         Receive only. Tells you your heartbeat has been acknowledged.
     RESUME
@@ -949,6 +985,13 @@ class DiscordVoiceWebSocket:
             interval = data['heartbeat_interval'] / 1000.0
             self._keep_alive = VoiceKeepAliveHandler(ws=self, interval=min(interval, 5.0))
             self._keep_alive.start()
+        elif op == self.SPEAKING:
+            self._connection.ssrc_map[data['ssrc']] = int(data['user_id'])
+        elif op == self.CLIENT_DISCONNECT:
+            user_id = int(data['user_id'])
+            ssrc_map = self._connection.ssrc_map
+            for ssrc in [ssrc for ssrc, uid in ssrc_map.items() if uid == user_id]:
+                del ssrc_map[ssrc]
 
         await self._hook(self, msg)
 
@@ -76,6 +76,7 @@ from .enums import (
     AutoModRuleEventType,
     ForumOrderType,
     ForumLayoutType,
+    GuildCacheLevel,
 )
 from .mixins import Hashable
 from .user import User
@@ -447,6 +448,7 @@ class Guild(Hashable):
         'max_stage_video_users',
         '_incidents_data',
         '_soundboard_sounds',
+        '_cache_level',
     )
 
     _PREMIUM_GUILD_LIMITS: ClassVar[Dict[Optional[int], _GuildLimit]] = {
@@ -457,7 +459,10 @@ class Guild(Hashable):
         3: _GuildLimit(emoji=250, stickers=60, bitrate=384e3, filesize=104857600),
     }
 
-    def __init__(self, *, data: GuildPayload, state: ConnectionState) -> None:
+    def __init__(
+        self, *, data: GuildPayload, state: ConnectionState, cache_level: GuildCacheLevel = GuildCacheLevel.full
+    ) -> None:
+        self._cache_level: GuildCacheLevel = cache_level
         self._channels: Dict[int, GuildChannel] = {}
         self._members: Dict[int, Member] = {}
         self._voice_states: Dict[int, VoiceState] = {}
@@ -470,6 +475,8 @@ class Guild(Hashable):
         self._from_data(data)
 
     def _add_channel(self, channel: GuildChannel, /) -> None:
+        if self._cache_level is GuildCacheLevel.minimal or channel.type not in self._state._cached_channel_types:
+            return
         self._channels[channel.id] = channel
 
     def _remove_channel(self, channel: Snowflake, /) -> None:
@@ -479,17 +486,21 @@ class Guild(Hashable):
         return self._voice_states.get(user_id)
 
     def _add_member(self, member: Member, /) -> None:
+        if self._cache_level is GuildCacheLevel.minimal and member.id != self._state.self_id:
+            return
         self._members[member.id] = member
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
         thread = Thread(guild=self, state=self._state, data=payload)
-        self._threads[thread.id] = thread
+        self._add_thread(thread)
         return thread
 
     def _remove_member(self, member: Snowflake, /) -> None:
         self._members.pop(member.id, None)
 
     def _add_thread(self, thread: Thread, /) -> None:
+        if self._cache_level is GuildCacheLevel.minimal or not self._state.cache_flags.threads:
+            return
         self._threads[thread.id] = thread
 
     def _remove_thread(self, thread: Snowflake, /) -> None:
@@ -511,11 +522,23 @@ class Guild(Hashable):
         return to_remove
 
     def _add_soundboard_sound(self, sound: SoundboardSound, /) -> None:
+        if self._cache_level is GuildCacheLevel.minimal or not self._state.cache_flags.soundboard_sounds:
+            return
         self._soundboard_sounds[sound.id] = sound
 
     def _remove_soundboard_sound(self, sound: SoundboardSound, /) -> None:
         self._soundboard_sounds.pop(sound.id, None)
 
+    def _add_stage_instance(self, stage_instance: StageInstance, /) -> None:
+        if self._cache_level is GuildCacheLevel.minimal or not self._state.cache_flags.stage_instances:
+            return
+        self._stage_instances[stage_instance.id] = stage_instance
+
+    def _add_scheduled_event(self, scheduled_event: ScheduledEvent, /) -> None:
+        if self._cache_level is GuildCacheLevel.minimal or not self._state.cache_flags.scheduled_events:
+            return
+        self._scheduled_events[scheduled_event.id] = scheduled_event
+
     def __str__(self) -> str:
         return self.name or ''
 
@@ -546,7 +569,10 @@ class Guild(Hashable):
             # if we're here then we're getting added into the cache
             after = VoiceState(data=data, channel=channel)
             before = VoiceState(data=data, channel=None)
-            self._voice_states[user_id] = after
+            if self._cache_level is GuildCacheLevel.full and (
+                self._state.cache_flags.voice_states or user_id == self._state.self_id
+            ):
+                self._voice_states[user_id] = after
 
         member = self.get_member(user_id)
         if member is None:
@@ -558,7 +584,13 @@ class Guild(Hashable):
 
         return member, before, after
 
+    def _should_cache_role(self, role_id: int, /) -> bool:
+        # The @everyone role is always kept so that default_role never returns None
+        return role_id == self.id or (self._cache_level is GuildCacheLevel.full and self._state.cache_flags.roles)
+
     def _add_role(self, role: Role, /) -> None:
+        if not self._should_cache_role(role.id):
+            return
         self._roles[role.id] = role
 
     def _remove_role(self, role_id: int, /) -> Role:
@@ -572,6 +604,20 @@ class Guild(Hashable):
         data.update(id=guild_id)
         return cls(state=state, data=data)  # type: ignore
 
+    def _clear_cached_state(self) -> None:
+        # Drops everything a minimal guild doesn't keep around, other than our own member and @everyone
+        self_id = self._state.self_id
+        self._members = {k: m for k, m in self._members.items() if k == self_id}
+        self._channels.clear()
+        self._threads.clear()
+        self._roles = {k: r for k, r in self._roles.items() if k == self.id}
+        self._voice_states.clear()
+        self._stage_instances.clear()
+        self._scheduled_events.clear()
+        self._soundboard_sounds.clear()
+        self.emojis = ()
+        self.stickers = ()
+
     def _from_data(self, guild: GuildPayload) -> None:
         try:
             self._member_count = guild['member_count']  # pyright: ignore[reportTypedDictNotRequiredAccess]
@@ -591,18 +637,18 @@ class Guild(Hashable):
         self.id: int = int(guild['id'])
         self._roles: Dict[int, Role] = {}
         state = self._state  # speed up attribute access
+        full = self._cache_level is GuildCacheLevel.full
         for r in guild.get('roles', []):
-            role = Role(guild=self, data=r, state=state)
-            self._roles[role.id] = role
+            if self._should_cache_role(int(r['id'])):
+                role = Role(guild=self, data=r, state=state)
+                self._roles[role.id] = role
 
         self.emojis: Tuple[Emoji, ...] = (
-            tuple(map(lambda d: state.store_emoji(self, d), guild.get('emojis', [])))
-            if state.cache_guild_expressions
-            else ()
+            tuple(map(lambda d: state.store_emoji(self, d), guild.get('emojis', []))) if full and state.cache_emojis else ()
         )
         self.stickers: Tuple[GuildSticker, ...] = (
             tuple(map(lambda d: state.store_sticker(self, d), guild.get('stickers', [])))
-            if state.cache_guild_expressions
+            if full and state.cache_stickers
             else ()
         )
         self.features: List[GuildFeature] = guild.get('features', [])
@@ -634,11 +680,20 @@ class Guild(Hashable):
         self._afk_channel_id: Optional[int] = utils._get_as_snowflake(guild, 'afk_channel_id')
         self._incidents_data: Optional[IncidentData] = guild.get('incidents_data')
 
+        if not full:
+            # Minimal guilds only keep track of our own member
+            self_id = state.self_id
+            for mdata in guild.get('members', []):
+                if int(mdata['user']['id']) == self_id:  # type: ignore # Members will have the 'user' key in this scenario
+                    self._add_member(Member(data=mdata, guild=self, state=state))  # type: ignore
+            return
+
         if 'channels' in guild:
             channels = guild['channels']
+            cached_types = state._cached_channel_types
             for c in channels:
                 factory, ch_type = _guild_channel_factory(c['type'])
-                if factory:
+                if factory and ch_type in cached_types:
                     self._add_channel(factory(guild=self, data=c, state=self._state))  # type: ignore
 
         for obj in guild.get('voice_states', []):
@@ -660,26 +715,39 @@ class Guild(Hashable):
             if member is not None:
                 member._presence_update(raw_presence, empty_tuple)  # type: ignore
 
-        if 'threads' in guild:
+        cache_flags = state.cache_flags
+        if 'threads' in guild and cache_flags.threads:
             threads = guild['threads']
             for thread in threads:
                 self._add_thread(Thread(guild=self, state=self._state, data=thread))
 
-        if 'stage_instances' in guild:
+        if 'stage_instances' in guild and cache_flags.stage_instances:
             for s in guild['stage_instances']:
                 stage_instance = StageInstance(guild=self, data=s, state=self._state)
-                self._stage_instances[stage_instance.id] = stage_instance
+                self._add_stage_instance(stage_instance)
 
-        if 'guild_scheduled_events' in guild:
+        if 'guild_scheduled_events' in guild and cache_flags.scheduled_events:
             for s in guild['guild_scheduled_events']:
                 scheduled_event = ScheduledEvent(data=s, state=self._state)
-                self._scheduled_events[scheduled_event.id] = scheduled_event
+                self._add_scheduled_event(scheduled_event)
 
-        if 'soundboard_sounds' in guild:
+        if 'soundboard_sounds' in guild and cache_flags.soundboard_sounds:
             for s in guild['soundboard_sounds']:
                 soundboard_sound = SoundboardSound(guild=self, data=s, state=self._state)
                 self._add_soundboard_sound(soundboard_sound)
 
+    @property
+    def cache_level(self) -> GuildCacheLevel:
+        """:class:`GuildCacheLevel`: How much of this guild's state is kept in the cache.
+
+        Guilds with :attr:`GuildCacheLevel.minimal` do not have any channels, threads,
+        emojis, stickers, voice states, roles other than :attr:`default_role` or
+        members other than :attr:`me` cached.
+
+        .. versionadded:: 2.6
+        """
+        return self._cache_level
+
     @property
     def channels(self) -> Sequence[GuildChannel]:
         """Sequence[:class:`abc.GuildChannel`]: A list of channels that belongs to this guild."""
@@ -3103,7 +3171,7 @@ class Guild(Hashable):
         payload['tags'] = emoji
 
         data = await self._state.http.create_guild_sticker(self.id, payload, file, reason)
-        if self._state.cache_guild_expressions:
+        if self._state.cache_stickers:
             return self._state.store_sticker(self, data)
         else:
             return GuildSticker(state=self._state, data=data)
@@ -3515,7 +3583,7 @@ class Guild(Hashable):
             role_ids = []
 
         data = await self._state.http.create_custom_emoji(self.id, name, img, roles=role_ids, reason=reason)
-        if self._state.cache_guild_expressions:
+        if self._state.cache_emojis:
             return self._state.store_emoji(self, data)
         else:
             return Emoji(guild=self, state=self._state, data=data)
@@ -27,6 +27,7 @@ from __future__ import annotations
 import datetime
 import inspect
 import itertools
+import sys
 from operator import attrgetter
 from typing import Any, Awaitable, Callable, Collection, Dict, List, Optional, TYPE_CHECKING, Tuple, TypeVar, Union
 
@@ -324,9 +325,12 @@ class Member(discord.abc.Messageable, _UserTag):
         self._banner: Optional[str] = data.get('banner')
         self._permissions: Optional[int]
         self._flags: int = data['flags']
-        self._avatar_decoration_data: Optional[AvatarDecorationData] = data.get('avatar_decoration_data')
+        self._avatar_decoration_data: Optional[AvatarDecorationData] = utils._intern_avatar_decoration(
+            data.get('avatar_decoration_data')
+        )
         try:
-            self._permissions = int(data['permissions'])  # pyright: ignore[reportTypedDictNotRequiredAccess]
+            permissions = data['permissions']  # pyright: ignore[reportTypedDictNotRequiredAccess]
+            self._permissions = utils._intern_int(int(permissions))
         except KeyError:
             self._permissions = None
 
@@ -433,7 +437,7 @@ class Member(discord.abc.Messageable, _UserTag):
         self._avatar = data.get('avatar')
         self._banner = data.get('banner')
         self._flags = data.get('flags', 0)
-        self._avatar_decoration_data = data.get('avatar_decoration_data')
+        self._avatar_decoration_data = utils._intern_avatar_decoration(data.get('avatar_decoration_data'))
 
     def _presence_update(self, raw: RawPresenceUpdateEvent, user: UserPayload) -> Optional[Tuple[User, User]]:
         self.activities = raw.activities
@@ -467,11 +471,11 @@ class Member(discord.abc.Messageable, _UserTag):
             to_return = User._copy(self._user)
             u.name, u.discriminator, u._avatar, u.global_name, u._public_flags, u._avatar_decoration_data = (
                 user['username'],
-                user['discriminator'],
+                sys.intern(user['discriminator']),
                 user['avatar'],
                 user.get('global_name'),
-                user.get('public_flags', 0),
-                decoration_payload,
+                utils._intern_int(user.get('public_flags', 0)),
+                utils._intern_avatar_decoration(decoration_payload),  # type: ignore
             )
             # Signal to dispatch on_user_update
             return to_return, u
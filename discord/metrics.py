@@ -0,0 +1,508 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+import sys
+import time
+import types
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .state import ConnectionState
+
+__all__ = (
+    'GatewayMetrics',
+    'PlaybackStats',
+    'CacheUsage',
+    'CacheStats',
+)
+
+
+class GatewayMetrics:
+    """Aggregated traffic statistics for a single gateway connection.
+
+    One instance is kept per shard and survives reconnects, so the counters
+    are cumulative over the lifetime of the client. You can retrieve this
+    object via :attr:`Client.gateway_metrics` or :attr:`ShardInfo.metrics`.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    -----------
+    shard_id: Optional[:class:`int`]
+        The shard ID these metrics belong to.
+    messages_received: :class:`int`
+        The number of complete gateway messages received.
+    compressed_bytes: :class:`int`
+        The number of bytes received over the wire in binary (compressed) frames.
+    uncompressed_bytes: :class:`int`
+        The size of every received payload after decompression, in characters.
+    decompression_time: :class:`float`
+        The total time spent decompressing payloads, in seconds.
+    decode_time: :class:`float`
+        The total time spent decoding JSON payloads, in seconds.
+    ratelimit_wait_time: :class:`float`
+        The total time outgoing payloads spent waiting on the gateway rate limit, in seconds.
+    send_queue_depth: :class:`int`
+        The number of outgoing payloads currently waiting to be sent.
+    events: Dict[:class:`str`, :class:`int`]
+        A mapping of dispatched event names, e.g. ``MESSAGE_CREATE``, to the number of times they were received.
+    parse_time: Dict[:class:`str`, :class:`float`]
+        A mapping of dispatched event names to the total time spent in their parse handler, in seconds.
+    """
+
+    __slots__ = (
+        'shard_id',
+        'messages_received',
+        'compressed_bytes',
+        'uncompressed_bytes',
+        'decompression_time',
+        'decode_time',
+        'ratelimit_wait_time',
+        'send_queue_depth',
+        'events',
+        'parse_time',
+        '_window',
+        '_buckets',
+        '_current_second',
+        '_current',
+        '_started_at',
+    )
+
+    def __init__(self, shard_id: Optional[int] = None, *, window: int = 60) -> None:
+        if window <= 0:
+            raise ValueError('window must be greater than 0')
+
+        self.shard_id: Optional[int] = shard_id
+        self._window: int = window
+        self.send_queue_depth: int = 0
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f'<GatewayMetrics shard_id={self.shard_id} messages_received={self.messages_received} '
+            f'compressed_bytes={self.compressed_bytes} uncompressed_bytes={self.uncompressed_bytes}>'
+        )
+
+    def reset(self) -> None:
+        """Resets every counter back to zero.
+
+        :attr:`send_queue_depth` is left untouched since it reflects live state.
+        """
+        self.messages_received: int = 0
+        self.compressed_bytes: int = 0
+        self.uncompressed_bytes: int = 0
+        self.decompression_time: float = 0.0
+        self.decode_time: float = 0.0
+        self.ratelimit_wait_time: float = 0.0
+        self.events: Counter[str] = Counter()
+        self.parse_time: Counter[str] = Counter()
+        # Completed one second buckets of event counts, oldest first
+        self._buckets: Deque[Tuple[int, Counter[str]]] = deque(maxlen=self._window)
+        self._current_second: int = int(time.monotonic())
+        self._current: Counter[str] = Counter()
+        self._started_at: float = time.monotonic()
+
+    def _record_event(self, event: str, elapsed: float) -> None:
+        second = int(time.monotonic())
+        if second != self._current_second:
+            self._buckets.append((self._current_second, self._current))
+            self._current_second = second
+            self._current = Counter()
+
+        self._current[event] += 1
+        self.events[event] += 1
+        self.parse_time[event] += elapsed
+
+    @property
+    def uptime(self) -> float:
+        """:class:`float`: The number of seconds since these metrics started being collected."""
+        return time.monotonic() - self._started_at
+
+    def events_per_second(self, event: Optional[str] = None) -> float:
+        """Returns the rate of dispatched events over the rolling window.
+
+        The window defaults to the last 60 seconds and does not include the
+        second currently in progress.
+
+        Parameters
+        -----------
+        event: Optional[:class:`str`]
+            The event name to get the rate for, e.g. ``MESSAGE_CREATE``.
+            If not given then every event type is counted.
+
+        Returns
+        --------
+        :class:`float`
+            The number of events received per second.
+        """
+        now = int(time.monotonic())
+        cutoff = now - self._window
+        buckets = [counts for second, counts in self._buckets if second >= cutoff]
+        if self._current_second != now and self._current_second >= cutoff:
+            buckets.append(self._current)
+
+        span = min(self._window, max(1, now - int(self._started_at)))
+        if event is None:
+            total = sum(sum(counts.values()) for counts in buckets)
+        else:
+            total = sum(counts[event] for counts in buckets)
+        return total / span
+
+    def average_parse_time(self, event: str) -> float:
+        """Returns the average time spent in the parse handler for an event.
+
+        Parameters
+        -----------
+        event: :class:`str`
+            The event name, e.g. ``GUILD_CREATE``.
+
+        Returns
+        --------
+        :class:`float`
+            The average handler time in seconds, or ``0.0`` if the event was never received.
+        """
+        count = self.events[event]
+        if not count:
+            return 0.0
+        return self.parse_time[event] / count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a snapshot of these metrics as a plain dictionary.
+
+        This is suitable for exporting to a monitoring system.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            The metrics snapshot.
+        """
+        return {
+            'shard_id': self.shard_id,
+            'uptime': self.uptime,
+            'messages_received': self.messages_received,
+            'compressed_bytes': self.compressed_bytes,
+            'uncompressed_bytes': self.uncompressed_bytes,
+            'decompression_time': self.decompression_time,
+            'decode_time': self.decode_time,
+            'ratelimit_wait_time': self.ratelimit_wait_time,
+            'send_queue_depth': self.send_queue_depth,
+            'events': dict(self.events),
+            'events_per_second': {event: self.events_per_second(event) for event in self.events},
+            'parse_time': dict(self.parse_time),
+        }
+
+
+class PlaybackStats:
+    """Timing statistics for the audio played by a voice client.
+
+    A new instance is created every time :meth:`VoiceClient.play` is called, so the
+    counters cover a single player. You can retrieve this object via
+    :attr:`VoiceClient.playback_stats`.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    -----------
+    packets_sent: :class:`int`
+        The number of voice packets handed to the socket, including silence.
+    dropped_packets: :class:`int`
+        The number of voice packets the socket failed to send.
+    underruns: :class:`int`
+        The number of frames that weren't read ahead of time when they were due,
+        meaning playback had to wait for the audio source.
+    resyncs: :class:`int`
+        The number of times playback fell too far behind and its clock was moved
+        forward instead of sending a burst of late frames.
+    encode_time: :class:`float`
+        The total time spent encoding PCM frames to Opus, in seconds.
+    encrypt_time: :class:`float`
+        The total time spent building and encrypting voice packets, in seconds.
+    max_lateness: :class:`float`
+        The largest delay between when a frame was due and when it was sent, in seconds.
+    """
+
+    #: The upper bounds in seconds of the :meth:`lateness_histogram` buckets,
+    #: the last bucket counting everything above them.
+    LATENESS_BUCKETS: Tuple[float, ...] = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05)
+
+    __slots__ = (
+        'packets_sent',
+        'dropped_packets',
+        'underruns',
+        'resyncs',
+        'encode_time',
+        'encrypt_time',
+        'max_lateness',
+        '_lateness',
+        '_frames',
+    )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f'<PlaybackStats packets_sent={self.packets_sent} dropped_packets={self.dropped_packets} '
+            f'underruns={self.underruns} max_lateness={self.max_lateness:.4f}>'
+        )
+
+    def reset(self) -> None:
+        """Resets every counter back to zero."""
+        self.packets_sent: int = 0
+        self.dropped_packets: int = 0
+        self.underruns: int = 0
+        self.resyncs: int = 0
+        self.encode_time: float = 0.0
+        self.encrypt_time: float = 0.0
+        self.max_lateness: float = 0.0
+        self._lateness: List[int] = [0] * (len(self.LATENESS_BUCKETS) + 1)
+        self._frames: int = 0
+
+    def _record_lateness(self, lateness: float) -> None:
+        self._frames += 1
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+
+        for index, bound in enumerate(self.LATENESS_BUCKETS):
+            if lateness <= bound:
+                self._lateness[index] += 1
+                return
+        self._lateness[-1] += 1
+
+    @property
+    def frames_played(self) -> int:
+        """:class:`int`: The number of audio frames the player sent on its clock."""
+        return self._frames
+
+    def lateness_histogram(self) -> Dict[float, int]:
+        """Returns how late frames were sent compared to when they were due.
+
+        Returns
+        --------
+        Dict[:class:`float`, :class:`int`]
+            A mapping of each bucket's upper bound in seconds to the number of frames
+            in it. Frames later than every bound are counted under ``float('inf')``.
+        """
+        bounds = (*self.LATENESS_BUCKETS, float('inf'))
+        return dict(zip(bounds, self._lateness))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a snapshot of these statistics as a plain dictionary.
+
+        This is suitable for exporting to a monitoring system.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            The statistics snapshot.
+        """
+        return {
+            'frames_played': self._frames,
+            'packets_sent': self.packets_sent,
+            'dropped_packets': self.dropped_packets,
+            'underruns': self.underruns,
+            'resyncs': self.resyncs,
+            'encode_time': self.encode_time,
+            'encrypt_time': self.encrypt_time,
+            'max_lateness': self.max_lateness,
+            'lateness_histogram': self.lateness_histogram(),
+        }
+
+
+_CONTAINERS = (list, tuple, set, frozenset, deque)
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def _estimate_size(roots: Iterable[Any], seen: Set[int]) -> int:
+    # Roots are always measured, everything reachable from them only if it hasn't been seen
+    # yet. Only containers and library objects are traversed so that e.g. the event loop,
+    # functions or classes that happen to be referenced are never attributed to a model.
+    getsizeof = sys.getsizeof
+    total = 0
+    stack: List[Any] = []
+    for root in roots:
+        seen.add(id(root))
+        stack.append(root)
+
+    while stack:
+        obj = stack.pop()
+        total += getsizeof(obj)
+
+        if isinstance(obj, dict):
+            children = [*obj.keys(), *obj.values()]
+        elif isinstance(obj, _CONTAINERS):
+            children = obj
+        elif type(obj).__module__.startswith('discord.'):
+            children = []
+            for cls in type(obj).__mro__:
+                for slot in cls.__dict__.get('__slots__', ()):
+                    try:
+                        children.append(getattr(obj, slot))
+                    except AttributeError:
+                        pass
+
+            try:
+                children.append(obj.__dict__)
+            except AttributeError:
+                pass
+        else:
+            continue
+
+        for child in children:
+            key = id(child)
+            if key in seen or isinstance(child, _OPAQUE) or type(child).__module__ == 'discord.enums':
+                continue
+            seen.add(key)
+            stack.append(child)
+
+    return total
+
+
+class CacheUsage(NamedTuple):
+    """Represents how much memory a single kind of cached object uses.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    -----------
+    count: :class:`int`
+        The number of objects cached.
+    size: :class:`int`
+        The approximate number of bytes used by these objects. This is ``0``
+        if sizes were not estimated.
+    """
+
+    count: int
+    size: int
+
+    @property
+    def average_size(self) -> float:
+        """:class:`float`: The approximate number of bytes used per object."""
+        return self.size / self.count if self.count else 0.0
+
+
+class CacheStats:
+    """A snapshot of what the library's cache currently holds.
+
+    You can retrieve this object via :meth:`Client.cache_stats`.
+
+    Sizes are estimated by walking the attributes of each cached object and summing
+    :func:`sys.getsizeof` of everything reachable from it. Objects shared between
+    models, such as the :class:`User` behind a :class:`Member`, are only counted once,
+    under the first kind of object they were found through. The categories are walked
+    in the order their attributes are listed below and guilds are walked last, so the
+    size of :attr:`guilds` only covers what isn't accounted for by the other categories.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    -----------
+    users: :class:`CacheUsage`
+        The usage of cached users.
+    members: :class:`CacheUsage`
+        The usage of cached members.
+    channels: :class:`CacheUsage`
+        The usage of cached guild and private channels.
+    threads: :class:`CacheUsage`
+        The usage of cached threads.
+    roles: :class:`CacheUsage`
+        The usage of cached roles.
+    emojis: :class:`CacheUsage`
+        The usage of cached emojis and stickers.
+    messages: :class:`CacheUsage`
+        The usage of the message cache.
+    views: :class:`CacheUsage`
+        The usage of views and modals that are listening for interactions.
+    guilds: :class:`CacheUsage`
+        The usage of cached guilds.
+    """
+
+    __slots__ = (
+        'users',
+        'members',
+        'channels',
+        'threads',
+        'roles',
+        'emojis',
+        'messages',
+        'views',
+        'guilds',
+    )
+
+    def __init__(self, **usage: CacheUsage) -> None:
+        for name in self.__slots__:
+            setattr(self, name, usage.get(name, CacheUsage(0, 0)))
+
+    def __repr__(self) -> str:
+        inner = ' '.join(f'{name}={getattr(self, name).count}' for name in self.__slots__)
+        return f'<CacheStats {inner} total_size={self.total_size}>'
+
+    @property
+    def total_size(self) -> int:
+        """:class:`int`: The approximate number of bytes used by every cached object."""
+        return sum(getattr(self, name).size for name in self.__slots__)
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """Returns this snapshot as a plain dictionary.
+
+        Returns
+        --------
+        Dict[:class:`str`, Dict[:class:`str`, :class:`int`]]
+            A mapping of category name to its ``count`` and ``size``.
+        """
+        return {name: getattr(self, name)._asdict() for name in self.__slots__}
+
+    @classmethod
+    def _from_state(cls, state: ConnectionState, *, estimate_size: bool = True) -> CacheStats:
+        guilds = list(state._guilds.values())
+        view_store = state._view_store
+        views = {id(item.view): item.view for items in view_store._views.values() for item in items.values() if item.view}
+        views.update((id(view), view) for view in view_store._synced_message_views.values())
+        views.update((id(modal), modal) for modal in view_store._modals.values())
+
+        categories: Dict[str, List[Any]] = {
+            'users': list(state._users.values()),
+            'members': [m for guild in guilds for m in guild._members.values()],
+            'channels': [c for guild in guilds for c in guild._channels.values()] + list(state._private_channels.values()),
+            'threads': [t for guild in guilds for t in guild._threads.values()],
+            'roles': [r for guild in guilds for r in guild._roles.values()],
+            'emojis': list(state._emojis.values()) + list(state._stickers.values()),
+            'messages': list(state._messages or ()),
+            'views': list(views.values()),
+            'guilds': guilds,
+        }
+
+        if not estimate_size:
+            return cls(**{name: CacheUsage(len(objects), 0) for name, objects in categories.items()})
+
+        # Guilds and the state act as barriers so that walking e.g. a member
+        # doesn't end up measuring the entire guild it belongs to
+        seen = {id(state), id(view_store), *(id(guild) for guild in guilds)}
+        usage = {}
+        for name, objects in categories.items():
+            usage[name] = CacheUsage(len(objects), _estimate_size(objects, seen))
+        return cls(**usage)
@@ -24,9 +24,12 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import bisect
+import mmap
+import os
 import struct
 
-from typing import TYPE_CHECKING, ClassVar, IO, Generator, Tuple, Optional
+from typing import TYPE_CHECKING, ClassVar, IO, Generator, List, Tuple, Optional, Union
 
 from .errors import DiscordException
 
@@ -34,6 +37,7 @@ __all__ = (
     'OggError',
     'OggPage',
     'OggStream',
+    'MappedOggStream',
 )
 
 
@@ -59,13 +63,12 @@ class OggPage:
 
     def __init__(self, stream: IO[bytes]) -> None:
         try:
-            header = stream.read(struct.calcsize(self._header.format))
+            header = stream.read(self._header.size)
 
             self.flag, self.gran_pos, self.serial, self.pagenum, self.crc, self.segnum = self._header.unpack(header)
 
             self.segtable: bytes = stream.read(self.segnum)
-            bodylen = sum(struct.unpack('B' * self.segnum, self.segtable))
-            self.data: bytes = stream.read(bodylen)
+            self.data: bytes = stream.read(sum(self.segtable))
         except Exception:
             raise OggError('bad data stream') from None
 
@@ -111,7 +114,234 @@ class OggStream:
         partial = b''
         for page in self._iter_pages():
             for data, complete in page.iter_packets():
-                partial += data
+                # Only packets spanning pages need to be joined
+                if partial:
+                    data = partial + data
                 if complete:
-                    yield partial
+                    yield data
                     partial = b''
+                else:
+                    partial = data
+
+
+_PAGE_HEADER = struct.Struct('<4sBBQIIIB')
+_NO_GRANULE = 0xFFFFFFFFFFFFFFFF
+_CONTINUED = 0x01
+
+
+def _packet_samples(packet: Union[bytes, memoryview]) -> int:
+    # The number of 48KHz samples in an Opus packet, from its TOC byte (RFC 6716 section 3.1)
+    if not packet:
+        return 0
+
+    toc = packet[0]
+    config = toc >> 3
+    if config < 12:
+        frame = (480, 960, 1920, 2880)[config & 3]
+    elif config < 16:
+        frame = (480, 960)[config & 1]
+    else:
+        frame = (120, 240, 480, 960)[config & 3]
+
+    code = toc & 3
+    if code == 0:
+        return frame
+    if code in (1, 2):
+        return frame * 2
+    return frame * (packet[1] & 0x3F if len(packet) > 1 else 0)
+
+
+class MappedOggStream:
+    """A zero-copy Ogg stream parser over an in-memory or memory-mapped buffer.
+
+    Unlike :class:`OggStream`, which reads and copies every page from a file-like
+    object, this parses pages in place and yields packets as :class:`memoryview`
+    slices of the underlying buffer. Only packets that span multiple pages are
+    copied in order to join them.
+
+    A seek index from granule position to page offset is built on first use by
+    walking the page headers only, allowing playback to start at any position
+    without parsing the pages before it.
+
+    Parameters
+    -----------
+    source: Union[:class:`str`, :class:`os.PathLike`, :term:`py:bytes-like object`]
+        A path to a file to memory-map, or a buffer containing the stream.
+    """
+
+    def __init__(self, source: Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap]) -> None:
+        self._mmap: Optional[mmap.mmap] = None
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as fp:
+                if os.fstat(fp.fileno()).st_size:
+                    self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view: memoryview = memoryview(self._mmap if self._mmap is not None else b'')
+        else:
+            self._view = memoryview(source)
+
+        # Granule positions and byte offsets of every page on which a packet ends
+        self._granules: Optional[List[int]] = None
+        self._offsets: List[int] = []
+
+    def __enter__(self) -> MappedOggStream:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the buffer, closing the memory-mapped file if there is one.
+
+        Packets that are still referenced keep the mapping alive until they are released.
+        """
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Exported packet views are still alive, the mapping is freed along with them
+                pass
+
+    def _page_at(self, offset: int) -> Tuple[int, int, memoryview, int, int]:
+        # Returns (flag, granule, segment table, body offset, next page offset)
+        view = self._view
+        try:
+            magic, _, flag, granule, _, _, _, segnum = _PAGE_HEADER.unpack_from(view, offset)
+        except struct.error:
+            raise OggError('bad data stream') from None
+
+        if magic != b'OggS':
+            raise OggError(f'invalid header magic {bytes(magic)}')
+
+        table_start = offset + _PAGE_HEADER.size
+        segtable = view[table_start : table_start + segnum]
+        body = table_start + segnum
+        end = body + sum(segtable)
+        if len(segtable) != segnum or end > len(view):
+            raise OggError('bad data stream')
+        return flag, granule, segtable, body, end
+
+    def _build_index(self) -> List[int]:
+        granules: List[int] = []
+        offsets: List[int] = []
+        offset = 0
+        size = len(self._view)
+        while offset < size:
+            _, granule, _, _, end = self._page_at(offset)
+            if granule != _NO_GRANULE:
+                granules.append(granule)
+                offsets.append(offset)
+            offset = end
+
+        self._offsets = offsets
+        self._granules = granules
+        return granules
+
+    @property
+    def index(self) -> List[Tuple[int, int]]:
+        """List[Tuple[:class:`int`, :class:`int`]]: The seek index of the stream.
+
+        Each entry is a tuple of a page's granule position and its byte offset.
+        Pages on which no packet ends have no granule position and are omitted.
+        """
+        granules = self._granules if self._granules is not None else self._build_index()
+        return list(zip(granules, self._offsets))
+
+    @property
+    def duration(self) -> float:
+        """:class:`float`: The duration of the stream in seconds, from its last granule position."""
+        granules = self._granules if self._granules is not None else self._build_index()
+        return granules[-1] / 48000 if granules else 0.0
+
+    def seek_offset(self, position: int) -> int:
+        """Finds the byte offset to start reading at to reach a position in the stream.
+
+        Parameters
+        -----------
+        position: :class:`int`
+            The position in 48KHz samples.
+
+        Returns
+        --------
+        :class:`int`
+            The byte offset of the page to start parsing from.
+        """
+        granules = self._granules if self._granules is not None else self._build_index()
+        entry = bisect.bisect_right(granules, position)
+        if entry >= len(granules):
+            return len(self._view)
+        # Start a page early, the first packet ending on the target page may have started before it
+        return self._offsets[entry - 1] if entry > 0 else 0
+
+    def iter_packets(self, *, start: int = 0) -> Generator[Union[memoryview, bytes], None, None]:
+        """Iterates over the packets of the stream.
+
+        Parameters
+        -----------
+        start: :class:`int`
+            The position in 48KHz samples to start at. Packets ending at or before
+            this position are skipped. Defaults to ``0``, yielding every packet
+            including the stream headers.
+
+        Yields
+        -------
+        Union[:class:`memoryview`, :class:`bytes`]
+            A packet. Packets spanning several pages are joined into :class:`bytes`.
+        """
+        view = self._view
+        size = len(view)
+        seeking = start > 0
+        offset = self.seek_offset(start) if seeking else 0
+        partial: List[memoryview] = []
+        # Whether we are in the middle of a packet that started before the first page we read
+        skipping = False
+        first = True
+
+        while offset < size:
+            flag, granule, segtable, body, end = self._page_at(offset)
+            if flag & _CONTINUED:
+                skipping = skipping or first
+            else:
+                partial.clear()
+                skipping = False
+            first = False
+
+            completed: List[Union[memoryview, bytes]] = []
+            packet_start = packet_end = body
+            for lace in segtable:
+                packet_end += lace
+                if lace == 255:
+                    continue
+
+                if skipping:
+                    skipping = False
+                elif partial:
+                    partial.append(view[packet_start:packet_end])
+                    completed.append(b''.join(partial))
+                    partial.clear()
+                else:
+                    completed.append(view[packet_start:packet_end])
+                packet_start = packet_end
+
+            if packet_start != packet_end and not skipping:
+                partial.append(view[packet_start:packet_end])
+            offset = end
+
+            if not seeking:
+                yield from completed
+                continue
+
+            # The granule position is the end of the last packet completed on the page,
+            # so work backwards from it to find where each packet ends
+            packet_ends = []
+            position = granule
+            for packet in reversed(completed):
+                packet_ends.append(position)
+                position -= _packet_samples(packet)
+            packet_ends.reverse()
+
+            for packet, packet_end_position in zip(completed, packet_ends):
+                if packet_end_position > start:
+                    yield packet
+            if completed and granule > start:
+                seeking = False
@@ -360,6 +360,8 @@ class Encoder(_OpusStruct):
 
         self.application: int = application_ctl[application]
         self._state: EncoderStruct = self._create_state()
+        # Reused across encode calls, it's only read back up to the encoded length
+        self._output: ctypes.Array[ctypes.c_char] = (ctypes.c_char * self.FRAME_SIZE)()
 
         self.set_bitrate(bitrate)
         self.set_fec(fec)
@@ -408,11 +410,13 @@ class Encoder(_OpusStruct):
         max_data_bytes = len(pcm)
         # bytes can be used to reference pointer
         pcm_ptr = ctypes.cast(pcm, c_int16_ptr)  # type: ignore
-        data = (ctypes.c_char * max_data_bytes)()
+        data = self._output
+        if len(data) < max_data_bytes:
+            data = self._output = (ctypes.c_char * max_data_bytes)()
 
         ret = _lib.opus_encode(self._state, pcm_ptr, frame_size, data, max_data_bytes)
 
-        return array.array('b', data[:ret]).tobytes()
+        return ctypes.string_at(data, ret)
 
 
 class Decoder(_OpusStruct):
@@ -0,0 +1,331 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import array
+import sys
+from typing import List, Optional, Sequence
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+__all__ = (
+    'scale',
+    'ramp',
+    'mix',
+    'crossfade',
+    'rms',
+    'resample',
+)
+
+# All functions here operate on the format used throughout the voice code:
+# 16-bit signed little-endian PCM, 48KHz, 2 channels.
+SAMPLING_RATE = 48000
+CHANNELS = 2
+SAMPLE_WIDTH = 2
+FRAME_WIDTH = CHANNELS * SAMPLE_WIDTH
+
+_MIN_SAMPLE = -32768
+_MAX_SAMPLE = 32767
+_NEEDS_BYTESWAP = sys.byteorder == 'big'
+
+
+def _to_array(data: bytes) -> array.array[int]:
+    samples = array.array('h')
+    samples.frombytes(memoryview(data)[: len(data) - len(data) % SAMPLE_WIDTH])
+    if _NEEDS_BYTESWAP:
+        samples.byteswap()
+    return samples
+
+
+def _from_array(samples: array.array[int]) -> bytes:
+    if _NEEDS_BYTESWAP:
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def _clamp(value: float) -> int:
+    if value > _MAX_SAMPLE:
+        return _MAX_SAMPLE
+    if value < _MIN_SAMPLE:
+        return _MIN_SAMPLE
+    return int(value)
+
+
+def _to_numpy(data: bytes) -> numpy.ndarray:
+    return numpy.frombuffer(data, dtype='<i2', count=len(data) // SAMPLE_WIDTH)
+
+
+def _from_numpy(samples: numpy.ndarray) -> bytes:
+    return numpy.clip(samples, _MIN_SAMPLE, _MAX_SAMPLE).astype('<i2').tobytes()
+
+
+def _frame_gains(start: float, end: float, frames: int) -> List[float]:
+    if frames <= 1:
+        return [start] * frames
+    step = (end - start) / frames
+    return [start + step * i for i in range(frames)]
+
+
+def scale(data: bytes, factor: float) -> bytes:
+    """Multiplies every sample by ``factor``, clipping the result.
+
+    This is the equivalent of ``audioop.mul(data, 2, factor)``.
+
+    Parameters
+    -----------
+    data: :term:`py:bytes-like object`
+        The PCM data to scale.
+    factor: :class:`float`
+        The factor to multiply by, e.g. ``0.5`` to halve the volume.
+
+    Returns
+    --------
+    :class:`bytes`
+        The scaled PCM data.
+    """
+    if factor == 1.0:
+        return bytes(data)
+
+    if HAS_NUMPY:
+        return _from_numpy(_to_numpy(data) * factor)
+
+    samples = _to_array(data)
+    if factor == 0.0:
+        return bytes(len(samples) * SAMPLE_WIDTH)
+    if -1.0 <= factor <= 1.0:
+        # Nothing can clip, so skip clamping every sample
+        return _from_array(array.array('h', [int(s * factor) for s in samples]))
+    return _from_array(array.array('h', [_clamp(s * factor) for s in samples]))
+
+
+def ramp(data: bytes, start: float, end: float) -> bytes:
+    """Applies a gain that changes linearly from ``start`` to ``end`` over the data.
+
+    Both channels of a sample frame share the same gain. This is useful to fade
+    audio in or out without the clicks of an abrupt volume change.
+
+    Parameters
+    -----------
+    data: :term:`py:bytes-like object`
+        The PCM data to apply the gain to.
+    start: :class:`float`
+        The gain at the start of the data.
+    end: :class:`float`
+        The gain reached by the end of the data.
+
+    Returns
+    --------
+    :class:`bytes`
+        The PCM data with the gain applied.
+    """
+    if start == end:
+        return scale(data, start)
+
+    frames = len(data) // FRAME_WIDTH
+
+    if HAS_NUMPY:
+        samples = _to_numpy(data)[: frames * CHANNELS].reshape(-1, CHANNELS)
+        gains = numpy.linspace(start, end, frames, endpoint=False)[:, None]
+        return _from_numpy(samples * gains)
+
+    samples = _to_array(data)
+    gains = _frame_gains(start, end, frames)
+    out = array.array('h', [_clamp(samples[i] * gains[i // CHANNELS]) for i in range(frames * CHANNELS)])
+    return _from_array(out)
+
+
+def mix(frames: Sequence[bytes], gains: Optional[Sequence[float]] = None) -> bytes:
+    """Mixes several PCM frames together into one, clipping the result.
+
+    Frames shorter than the longest one are treated as padded with silence.
+
+    Parameters
+    -----------
+    frames: Sequence[:term:`py:bytes-like object`]
+        The PCM data to mix.
+    gains: Optional[Sequence[:class:`float`]]
+        The gain to apply to each frame before mixing. Defaults to ``1.0`` for every frame.
+
+    Returns
+    --------
+    :class:`bytes`
+        The mixed PCM data.
+    """
+    if gains is not None and len(gains) != len(frames):
+        raise ValueError('gains must have the same length as frames')
+
+    if not frames:
+        return b''
+    if len(frames) == 1:
+        return scale(frames[0], gains[0] if gains is not None else 1.0)
+
+    length = max(len(frame) for frame in frames) // SAMPLE_WIDTH
+
+    if HAS_NUMPY:
+        mixed = numpy.zeros(length, dtype=numpy.float32 if gains is not None else numpy.int32)
+        for index, frame in enumerate(frames):
+            samples = _to_numpy(frame)
+            if gains is not None:
+                mixed[: len(samples)] += samples * gains[index]
+            else:
+                mixed[: len(samples)] += samples
+        return _from_numpy(mixed)
+
+    mixed = [0.0] * length
+    for index, frame in enumerate(frames):
+        samples = _to_array(frame)
+        gain = gains[index] if gains is not None else 1.0
+        if gain == 1.0:
+            mixed[: len(samples)] = [a + b for a, b in zip(mixed, samples)]
+        else:
+            mixed[: len(samples)] = [a + b * gain for a, b in zip(mixed, samples)]
+    return _from_array(array.array('h', [_clamp(s) for s in mixed]))
+
+
+def crossfade(outgoing: bytes, incoming: bytes, start: float, end: float) -> bytes:
+    """Crossfades between two PCM frames.
+
+    ``start`` and ``end`` give the progress of the crossfade at the start and end
+    of the frame, from ``0.0`` (only ``outgoing`` is audible) to ``1.0`` (only
+    ``incoming`` is audible). Crossfading over several frames is done by
+    advancing the progress every frame.
+
+    Parameters
+    -----------
+    outgoing: :term:`py:bytes-like object`
+        The PCM data being faded out.
+    incoming: :term:`py:bytes-like object`
+        The PCM data being faded in.
+    start: :class:`float`
+        The crossfade progress at the start of the frame.
+    end: :class:`float`
+        The crossfade progress at the end of the frame.
+
+    Returns
+    --------
+    :class:`bytes`
+        The crossfaded PCM data.
+    """
+    return mix([ramp(outgoing, 1.0 - start, 1.0 - end), ramp(incoming, start, end)])
+
+
+def rms(data: bytes) -> float:
+    """Computes the root mean square level of the PCM data, from ``0.0`` to ``1.0``.
+
+    This is useful to detect whether a source is silent, for example to duck
+    other audio only while someone is actually speaking.
+
+    Parameters
+    -----------
+    data: :term:`py:bytes-like object`
+        The PCM data to measure.
+
+    Returns
+    --------
+    :class:`float`
+        The normalised RMS level.
+    """
+    count = len(data) // SAMPLE_WIDTH
+    if not count:
+        return 0.0
+
+    if HAS_NUMPY:
+        samples = _to_numpy(data).astype(numpy.float64)
+        return float(numpy.sqrt(numpy.mean(samples * samples))) / -_MIN_SAMPLE
+
+    total = sum(s * s for s in _to_array(data))
+    return (total / count) ** 0.5 / -_MIN_SAMPLE
+
+
+def resample(data: bytes, rate: int, *, channels: int = CHANNELS) -> bytes:
+    """Converts 16-bit PCM data at an arbitrary sample rate into 48KHz stereo.
+
+    Linear interpolation is used, which is cheap and good enough for sound
+    effects and speech. Mono input is duplicated into both channels.
+
+    Parameters
+    -----------
+    data: :term:`py:bytes-like object`
+        The PCM data to convert.
+    rate: :class:`int`
+        The sample rate of ``data`` in Hz.
+    channels: :class:`int`
+        The number of channels in ``data``, either ``1`` or ``2``. Defaults to ``2``.
+
+    Raises
+    -------
+    ValueError
+        An invalid rate or number of channels was passed.
+
+    Returns
+    --------
+    :class:`bytes`
+        The converted PCM data.
+    """
+    if rate <= 0:
+        raise ValueError(f'rate must be positive, not {rate}')
+    if channels not in (1, 2):
+        raise ValueError(f'channels must be 1 or 2, not {channels}')
+
+    if rate == SAMPLING_RATE and channels == CHANNELS:
+        return bytes(data)
+
+    if HAS_NUMPY:
+        samples = _to_numpy(data)
+        samples = samples[: len(samples) - len(samples) % channels].reshape(-1, channels)
+        frames = len(samples)
+        out_frames = frames * SAMPLING_RATE // rate
+        if not frames or not out_frames:
+            return b''
+        positions = numpy.arange(out_frames) * (rate / SAMPLING_RATE)
+        source = numpy.arange(frames)
+        out = numpy.empty((out_frames, CHANNELS), dtype=numpy.float64)
+        for channel in range(CHANNELS):
+            out[:, channel] = numpy.interp(positions, source, samples[:, channel % channels])
+        return _from_numpy(numpy.round(out))
+
+    samples = _to_array(data)
+    frames = len(samples) // channels
+    out_frames = frames * SAMPLING_RATE // rate
+    ratio = rate / SAMPLING_RATE
+    last = frames - 1
+    out = array.array('h', bytes(out_frames * FRAME_WIDTH))
+    for i in range(out_frames):
+        position = i * ratio
+        index = int(position)
+        fraction = position - index
+        following = index + 1 if index < last else last
+        for channel in range(CHANNELS):
+            c = channel % channels
+            a = samples[index * channels + c]
+            b = samples[following * channels + c]
+            out[i * CHANNELS + channel] = round(a + (b - a) * fraction)
+    return _from_array(out)
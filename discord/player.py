@@ -25,8 +25,8 @@ from __future__ import annotations
 
 import threading
 import subprocess
+import concurrent.futures
 import warnings
-import audioop
 import asyncio
 import logging
 import shlex
@@ -35,13 +35,37 @@ import json
 import sys
 import re
 import io
+import os
+import mmap
+import array
+import tempfile
+import weakref
+
+from collections import OrderedDict, deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from typing import Any, Callable, Generic, IO, Optional, TYPE_CHECKING, Tuple, TypeVar, Union
-
+from . import pcm
 from .enums import SpeakingState
 from .errors import ClientException
+from .metrics import PlaybackStats
 from .opus import Encoder as OpusEncoder, OPUS_SILENCE
-from .oggparse import OggStream
+from .oggparse import MappedOggStream, OggStream, _packet_samples
 from .utils import MISSING
 
 if TYPE_CHECKING:
@@ -56,11 +80,21 @@ _log = logging.getLogger(__name__)
 
 __all__ = (
     'AudioSource',
+    'SeekableAudioSource',
     'PCMAudio',
     'FFmpegAudio',
     'FFmpegPCMAudio',
     'FFmpegOpusAudio',
+    'FFmpegProber',
+    'OggOpusAudio',
     'PCMVolumeTransformer',
+    'MixedAudioSource',
+    'BroadcastAudio',
+    'BroadcastSubscriber',
+    'OpusClip',
+    'OpusClipAudio',
+    'OpusClipCache',
+    'AudioScheduler',
 )
 
 CREATE_NO_WINDOW: int
@@ -118,6 +152,53 @@ class AudioSource:
         self.cleanup()
 
 
+class SeekableAudioSource(AudioSource):
+    """Represents an audio stream that keeps track of its position and can seek.
+
+    Players expose the position of these sources through :attr:`VoiceClient.position`
+    and can seek them with :meth:`VoiceClient.seek`.
+
+    .. versionadded:: 2.6
+
+    .. warning::
+
+        :meth:`seek` is called from outside the audio thread. Implementations should
+        record the requested position and move to it on the next :meth:`read`.
+    """
+
+    @property
+    def position(self) -> float:
+        """:class:`float`: The position in seconds of the next frame to be read.
+
+        Subclasses must implement this.
+        """
+        raise NotImplementedError
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Optional[:class:`float`]: The duration of the stream in seconds, if it is known."""
+        return None
+
+    def seek(self, position: float) -> None:
+        """Moves the stream to a position.
+
+        Subclasses must implement this.
+
+        Parameters
+        -----------
+        position: :class:`float`
+            The position in seconds to continue reading from.
+
+        Raises
+        -------
+        ValueError
+            The position is negative.
+        ClientException
+            The stream does not support seeking.
+        """
+        raise NotImplementedError
+
+
 class PCMAudio(AudioSource):
     """Represents raw 16-bit 48KHz stereo PCM audio source.
 
@@ -147,6 +228,9 @@ class FFmpegAudio(AudioSource):
     """
 
     BLOCKSIZE: int = io.DEFAULT_BUFFER_SIZE
+    #: How far ahead in seconds a seek may be reached by reading through the running
+    #: process instead of restarting it at the new position.
+    SEEK_SKIP_THRESHOLD: float = 5.0
 
     def __init__(
         self,
@@ -177,6 +261,13 @@ class FFmpegAudio(AudioSource):
         kwargs = {'stdout': subprocess.PIPE, 'stderr': subprocess.PIPE if piping_stderr else stderr}
         kwargs.update(subprocess_kwargs)
 
+        # Kept around to restart the process at another position when seeking
+        self._spawn_args: Tuple[List[str], Dict[str, Any]] = (args, kwargs)
+        self._piping_stdin: bool = piping_stdin
+        self._samples: int = 0
+        self._pending_seek: Optional[float] = None
+        self._seek_lock: threading.Lock = threading.Lock()
+
         # Ensure attribute is assigned even in the case of errors
         self._process: subprocess.Popen = MISSING
         self._process = self._spawn_process(args, **kwargs)
@@ -211,9 +302,10 @@ class FFmpegAudio(AudioSource):
         else:
             return process
 
-    def _kill_process(self) -> None:
+    def _kill_process(self, proc: subprocess.Popen = MISSING) -> None:
         # this function gets called in __del__ so instance attributes might not even exist
-        proc = getattr(self, '_process', MISSING)
+        if proc is MISSING:
+            proc = getattr(self, '_process', MISSING)
         if proc is MISSING:
             return
 
@@ -265,12 +357,63 @@ class FFmpegAudio(AudioSource):
                 self._stderr.close()
                 return
 
+    def _read_frame(self) -> bytes:
+        # Reads the next frame, adding its length to self._samples
+        raise NotImplementedError
+
+    def _seek_position(self) -> float:
+        pending = self._pending_seek
+        if pending is not None:
+            return pending
+        return self._samples / OpusEncoder.SAMPLING_RATE
+
+    def _request_seek(self, position: float) -> None:
+        if position < 0:
+            raise ValueError('position cannot be negative')
+        if self._piping_stdin:
+            raise ClientException('Cannot seek audio piped to ffmpeg.')
+        with self._seek_lock:
+            self._pending_seek = position
+
+    def _apply_seek(self) -> None:
+        # Called from the audio thread, so the blocking work of seeking never happens in the caller
+        with self._seek_lock:
+            position, self._pending_seek = self._pending_seek, None
+        if position is None:
+            return
+
+        target = round(position * OpusEncoder.SAMPLING_RATE)
+        ahead = target - self._samples
+        if 0 <= ahead <= self.SEEK_SKIP_THRESHOLD * OpusEncoder.SAMPLING_RATE:
+            # Close enough that decoding through is cheaper than starting a new process
+            while self._samples < target:
+                if not self._read_frame():
+                    break
+            return
+
+        self._respawn(position)
+        self._samples = target
+
+    def _respawn(self, position: float) -> None:
+        # Input seeking: -ss before -i makes ffmpeg seek in the demuxer instead of decoding up to the position
+        args, kwargs = self._spawn_args
+        index = args.index('-i') if '-i' in args else 1
+        args = [*args[:index], '-ss', f'{position:.3f}', *args[index:]]
+
+        old = self._process
+        self._process = self._spawn_process(args, **kwargs)
+        self._stdout = self._process.stdout  # type: ignore # process stdout is explicitly set
+        if self._stderr is not None:
+            # The reader thread moves over to the new pipe once the old one is closed
+            self._stderr = self._process.stderr
+        self._kill_process(old)
+
     def cleanup(self) -> None:
         self._kill_process()
         self._process = self._stdout = self._stdin = self._stderr = MISSING
 
 
-class FFmpegPCMAudio(FFmpegAudio):
+class FFmpegPCMAudio(FFmpegAudio, SeekableAudioSource):
     """An audio source from FFmpeg (or AVConv).
 
     This launches a sub-process to a specific input file given.
@@ -280,6 +423,12 @@ class FFmpegPCMAudio(FFmpegAudio):
         You must have the ffmpeg or avconv executable in your path environment
         variable in order for this to work.
 
+    .. versionchanged:: 2.6
+
+        This is now a :class:`SeekableAudioSource`. Seeking a short distance ahead reads
+        through the running process, otherwise ffmpeg is restarted with input seeking
+        without probing the source again. Audio piped to ffmpeg does not support seeking.
+
     Parameters
     ------------
     source: Union[:class:`str`, :class:`io.BufferedIOBase`]
@@ -344,17 +493,30 @@ class FFmpegPCMAudio(FFmpegAudio):
 
         super().__init__(source, executable=executable, args=args, **subprocess_kwargs)
 
-    def read(self) -> bytes:
+    @property
+    def position(self) -> float:
+        return self._seek_position()
+
+    def seek(self, position: float) -> None:
+        self._request_seek(position)
+
+    def _read_frame(self) -> bytes:
         ret = self._stdout.read(OpusEncoder.FRAME_SIZE)
         if len(ret) != OpusEncoder.FRAME_SIZE:
             return b''
+        self._samples += OpusEncoder.SAMPLES_PER_FRAME
         return ret
 
+    def read(self) -> bytes:
+        if self._pending_seek is not None:
+            self._apply_seek()
+        return self._read_frame()
+
     def is_opus(self) -> bool:
         return False
 
 
-class FFmpegOpusAudio(FFmpegAudio):
+class FFmpegOpusAudio(FFmpegAudio, SeekableAudioSource):
     """An audio source from FFmpeg (or AVConv).
 
     This launches a sub-process to a specific input file given.  However, rather than
@@ -375,6 +537,12 @@ class FFmpegOpusAudio(FFmpegAudio):
         You must have the ffmpeg or avconv executable in your path environment
         variable in order for this to work.
 
+    .. versionchanged:: 2.6
+
+        This is now a :class:`SeekableAudioSource`. Seeking a short distance ahead reads
+        through the running process, otherwise ffmpeg is restarted with input seeking
+        without probing the source again. Audio piped to ffmpeg does not support seeking.
+
     Parameters
     ------------
     source: Union[:class:`str`, :class:`io.BufferedIOBase`]
@@ -471,6 +639,7 @@ class FFmpegOpusAudio(FFmpegAudio):
         source: str,
         *,
         method: Optional[Union[str, Callable[[str, str], Tuple[Optional[str], Optional[int]]]]] = None,
+        prober: Optional[FFmpegProber] = None,
         **kwargs: Any,
     ) -> Self:
         """|coro|
@@ -501,6 +670,15 @@ class FFmpegOpusAudio(FFmpegAudio):
             source = await discord.FFmpegOpusAudio.from_probe("song.webm", method=custom_probe)
             voice_client.play(source)
 
+        Sharing probe processes and results between tracks with an :class:`FFmpegProber`: ::
+
+            prober = discord.FFmpegProber(ttl=3600)
+            source = await discord.FFmpegOpusAudio.from_probe(url, prober=prober)
+
+        Skipping the probe when the codec is already known, such as from a site's metadata: ::
+
+            source = await discord.FFmpegOpusAudio.from_probe(url, codec='opus', bitrate=160)
+
         Parameters
         ------------
         source
@@ -511,9 +689,17 @@ class FFmpegOpusAudio(FFmpegAudio):
             (or avconv).  As a callable, it must take two string arguments, ``source`` and
             ``executable``.  Both parameters are the same values passed to this factory function.
             ``executable`` will default to ``ffmpeg`` if not provided as a keyword argument.
+        prober: Optional[:class:`FFmpegProber`]
+            The prober to probe the source through, reusing its cached results.
+
+            .. versionadded:: 2.6
         kwargs
-            The remaining parameters to be passed to the :class:`FFmpegOpusAudio` constructor,
-            excluding ``bitrate`` and ``codec``.
+            The remaining parameters to be passed to the :class:`FFmpegOpusAudio` constructor.
+            If ``codec`` is given, the source is not probed and ``bitrate`` is used as is.
+
+            .. versionchanged:: 2.6
+
+                ``codec`` and ``bitrate`` skip probing instead of being rejected.
 
         Raises
         --------
@@ -528,8 +714,13 @@ class FFmpegOpusAudio(FFmpegAudio):
             An instance of this class.
         """
 
-        executable = kwargs.get('executable')
-        codec, bitrate = await cls.probe(source, method=method, executable=executable)
+        codec = kwargs.pop('codec', None)
+        bitrate = kwargs.pop('bitrate', None)
+        if codec is None:
+            executable = kwargs.get('executable')
+            codec, probed_bitrate = await cls.probe(source, method=method, executable=executable, prober=prober)
+            if bitrate is None:
+                bitrate = probed_bitrate
         return cls(source, bitrate=bitrate, codec=codec, **kwargs)
 
     @classmethod
@@ -539,6 +730,7 @@ class FFmpegOpusAudio(FFmpegAudio):
         *,
         method: Optional[Union[str, Callable[[str, str], Tuple[Optional[str], Optional[int]]]]] = None,
         executable: Optional[str] = None,
+        prober: Optional[FFmpegProber] = None,
     ) -> Tuple[Optional[str], Optional[int]]:
         """|coro|
 
@@ -552,6 +744,10 @@ class FFmpegOpusAudio(FFmpegAudio):
             Identical to the ``method`` parameter for :meth:`FFmpegOpusAudio.from_probe`.
         executable: :class:`str`
             Identical to the ``executable`` parameter for :class:`FFmpegOpusAudio`.
+        prober: Optional[:class:`FFmpegProber`]
+            The prober to probe the source through, reusing its cached results.
+
+            .. versionadded:: 2.6
 
         Raises
         --------
@@ -566,6 +762,25 @@ class FFmpegOpusAudio(FFmpegAudio):
             A 2-tuple with the codec and bitrate of the input source.
         """
 
+        if prober is not None:
+            return await prober.probe(source, method=method, executable=executable)
+
+        loop = asyncio.get_running_loop()
+
+        def run(func: Callable[[str, str], Tuple[Optional[str], Optional[int]]], source: str, executable: str):
+            return loop.run_in_executor(None, lambda: func(source, executable))
+
+        return await cls._probe(source, method, executable, run)
+
+    @classmethod
+    async def _probe(
+        cls,
+        source: str,
+        method: Optional[Union[str, Callable[[str, str], Tuple[Optional[str], Optional[int]]]]],
+        executable: Optional[str],
+        run: Callable[..., Awaitable[Tuple[Optional[str], Optional[int]]]],
+    ) -> Tuple[Optional[str], Optional[int]]:
+        # Shared by probe and FFmpegProber, which only differ in how a probe function gets run
         method = method or 'native'
         executable = executable or 'ffmpeg'
         probefunc = fallback = None
@@ -585,10 +800,9 @@ class FFmpegOpusAudio(FFmpegAudio):
             raise TypeError(f"Expected str or callable for parameter 'probe', not '{method.__class__.__name__}'")
 
         codec = bitrate = None
-        loop = asyncio.get_running_loop()
         try:
-            codec, bitrate = await loop.run_in_executor(None, lambda: probefunc(source, executable))
-        except (KeyboardInterrupt, SystemExit):
+            codec, bitrate = await run(probefunc, source, executable)
+        except (KeyboardInterrupt, SystemExit, asyncio.CancelledError):
             raise
         except BaseException:
             if not fallback:
@@ -597,8 +811,8 @@ class FFmpegOpusAudio(FFmpegAudio):
 
             _log.exception("Probe '%s' using '%s' failed, trying fallback", method, executable)
             try:
-                codec, bitrate = await loop.run_in_executor(None, lambda: fallback(source, executable))
-            except (KeyboardInterrupt, SystemExit):
+                codec, bitrate = await run(fallback, source, executable)
+            except (KeyboardInterrupt, SystemExit, asyncio.CancelledError):
                 raise
             except BaseException:
                 _log.exception("Fallback probe using '%s' failed", executable)
@@ -610,10 +824,29 @@ class FFmpegOpusAudio(FFmpegAudio):
         return codec, bitrate
 
     @staticmethod
-    def _probe_codec_native(source, executable: str = 'ffmpeg') -> Tuple[Optional[str], Optional[int]]:
+    def _probe_args_native(source, executable: str = 'ffmpeg') -> List[str]:
         exe = executable[:2] + 'probe' if executable in ('ffmpeg', 'avconv') else executable
-        args = [exe, '-v', 'quiet', '-print_format', 'json', '-show_streams', '-select_streams', 'a:0', source]
+        return [exe, '-v', 'quiet', '-print_format', 'json', '-show_streams', '-select_streams', 'a:0', source]
+
+    @staticmethod
+    def _probe_args_fallback(source, executable: str = 'ffmpeg') -> List[str]:
+        return [executable, '-hide_banner', '-i', source]
+
+    @staticmethod
+    def _probe_codec_native(source, executable: str = 'ffmpeg') -> Tuple[Optional[str], Optional[int]]:
+        args = FFmpegOpusAudio._probe_args_native(source, executable)
         output = subprocess.check_output(args, timeout=20)
+        return FFmpegOpusAudio._parse_probe_native(output)
+
+    @staticmethod
+    def _probe_codec_fallback(source, executable: str = 'ffmpeg') -> Tuple[Optional[str], Optional[int]]:
+        args = FFmpegOpusAudio._probe_args_fallback(source, executable)
+        proc = subprocess.Popen(args, creationflags=CREATE_NO_WINDOW, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        out, _ = proc.communicate(timeout=20)
+        return FFmpegOpusAudio._parse_probe_fallback(out)
+
+    @staticmethod
+    def _parse_probe_native(output: bytes) -> Tuple[Optional[str], Optional[int]]:
         codec = bitrate = None
 
         if output:
@@ -627,10 +860,7 @@ class FFmpegOpusAudio(FFmpegAudio):
         return codec, bitrate
 
     @staticmethod
-    def _probe_codec_fallback(source, executable: str = 'ffmpeg') -> Tuple[Optional[str], Optional[int]]:
-        args = [executable, '-hide_banner', '-i', source]
-        proc = subprocess.Popen(args, creationflags=CREATE_NO_WINDOW, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        out, _ = proc.communicate(timeout=20)
+    def _parse_probe_fallback(out: bytes) -> Tuple[Optional[str], Optional[int]]:
         output = out.decode('utf8')
         codec = bitrate = None
 
@@ -644,12 +874,347 @@ class FFmpegOpusAudio(FFmpegAudio):
 
         return codec, bitrate
 
+    @property
+    def position(self) -> float:
+        return self._seek_position()
+
+    def seek(self, position: float) -> None:
+        self._request_seek(position)
+
+    def _respawn(self, position: float) -> None:
+        super()._respawn(position)
+        self._packet_iter = OggStream(self._stdout).iter_packets()
+
+    def _read_frame(self) -> bytes:
+        packet = next(self._packet_iter, b'')
+        if not _is_opus_header(packet):
+            self._samples += _packet_samples(packet)
+        return packet
+
     def read(self) -> bytes:
-        return next(self._packet_iter, b'')
+        if self._pending_seek is not None:
+            self._apply_seek()
+        return self._read_frame()
+
+    def is_opus(self) -> bool:
+        return True
+
+
+class FFmpegProber:
+    """Probes audio sources for :meth:`FFmpegOpusAudio.from_probe`, sharing work between tracks.
+
+    Probe processes run as asyncio subprocesses rather than blocking executor threads,
+    at most :attr:`max_concurrency` at a time. Results are cached by source for
+    :attr:`ttl` seconds and concurrent probes of the same source only run once.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    -----------
+    max_concurrency: :class:`int`
+        The maximum number of probe processes running at once. Defaults to ``4``.
+    ttl: Optional[:class:`float`]
+        How long in seconds a result stays cached. ``None`` caches results until they
+        are evicted. Defaults to ``600``.
+    max_size: :class:`int`
+        The maximum number of cached results. The least recently used result is
+        evicted first. Defaults to ``1024``.
+
+    Attributes
+    -----------
+    ttl: Optional[:class:`float`]
+        How long in seconds a result stays cached.
+    max_size: :class:`int`
+        The maximum number of cached results.
+    """
+
+    #: How long in seconds a probe process may run before it is killed.
+    TIMEOUT: float = 20.0
+
+    def __init__(self, *, max_concurrency: int = 4, ttl: Optional[float] = 600.0, max_size: int = 1024) -> None:
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+
+        self.ttl: Optional[float] = ttl
+        self.max_size: int = max_size
+        self._max_concurrency: int = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # source -> (expiry, (codec, bitrate))
+        self._results: OrderedDict[str, Tuple[float, Tuple[Optional[str], Optional[int]]]] = OrderedDict()
+        # The result is None if the caller running the probe was cancelled, the waiters then probe again
+        self._probing: Dict[str, asyncio.Future[Optional[Tuple[Optional[str], Optional[int]]]]] = {}
+
+    def __repr__(self) -> str:
+        return f'<FFmpegProber results={len(self._results)} max_concurrency={self._max_concurrency} ttl={self.ttl}>'
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, source: str) -> bool:
+        return self.get(source) is not None
+
+    @property
+    def max_concurrency(self) -> int:
+        """:class:`int`: The maximum number of probe processes running at once."""
+        return self._max_concurrency
+
+    def get(self, source: str) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """Gets the cached result for a source, if it hasn't expired.
+
+        Parameters
+        -----------
+        source: :class:`str`
+            The source that was probed.
+
+        Returns
+        --------
+        Optional[Tuple[Optional[:class:`str`], Optional[:class:`int`]]]
+            The codec and bitrate of the source, or ``None`` if it isn't cached.
+        """
+        entry = self._results.get(source)
+        if entry is None:
+            return None
+
+        expiry, result = entry
+        if expiry < time.monotonic():
+            del self._results[source]
+            return None
+
+        self._results.move_to_end(source)
+        return result
+
+    def set(self, source: str, codec: Optional[str], bitrate: Optional[int]) -> None:
+        """Caches the codec and bitrate of a source, such as when they are known from its metadata.
+
+        Parameters
+        -----------
+        source: :class:`str`
+            The source to cache the result for.
+        codec: Optional[:class:`str`]
+            The codec of the source's audio stream.
+        bitrate: Optional[:class:`int`]
+            The bitrate of the source's audio stream in kbps.
+        """
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else float('inf')
+        self._results[source] = (expiry, (codec, bitrate))
+        self._results.move_to_end(source)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+    def invalidate(self, source: str) -> None:
+        """Removes the cached result for a source, if there is one.
+
+        Parameters
+        -----------
+        source: :class:`str`
+            The source to forget.
+        """
+        self._results.pop(source, None)
+
+    def clear(self) -> None:
+        """Removes every cached result."""
+        self._results.clear()
+
+    async def probe(
+        self,
+        source: str,
+        *,
+        method: Optional[Union[str, Callable[[str, str], Tuple[Optional[str], Optional[int]]]]] = None,
+        executable: Optional[str] = None,
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """|coro|
+
+        Probes a source for its codec and bitrate, or returns the cached result.
+
+        Failed probes are not cached.
+
+        Parameters
+        ------------
+        source: :class:`str`
+            Identical to the ``source`` parameter for :meth:`FFmpegOpusAudio.probe`.
+        method
+            Identical to the ``method`` parameter for :meth:`FFmpegOpusAudio.probe`.
+        executable: Optional[:class:`str`]
+            Identical to the ``executable`` parameter for :meth:`FFmpegOpusAudio.probe`.
+
+        Raises
+        --------
+        AttributeError
+            Invalid probe method, must be ``'native'`` or ``'fallback'``.
+        TypeError
+            Invalid value for ``probe`` parameter, must be :class:`str` or a callable.
+
+        Returns
+        ---------
+        Tuple[Optional[:class:`str`], Optional[:class:`int`]]
+            A 2-tuple with the codec and bitrate of the input source.
+        """
+        result = self.get(source)
+        if result is not None:
+            return result
+
+        pending = self._probing.get(source)
+        while pending is not None:
+            result = await asyncio.shield(pending)
+            if result is not None:
+                return result
+            pending = self._probing.get(source)
+
+        future: asyncio.Future[Optional[Tuple[Optional[str], Optional[int]]]] = asyncio.get_running_loop().create_future()
+        self._probing[source] = future
+        try:
+            result = await FFmpegOpusAudio._probe(source, method, executable, self._run)
+        except asyncio.CancelledError:
+            # Only this caller was cancelled, hand the probe over to whoever else waits on it
+            future.set_result(None)
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved in case nothing else was waiting on it
+            future.exception()
+            raise
+        else:
+            if result[0] is not None:
+                self.set(source, *result)
+            future.set_result(result)
+            return result
+        finally:
+            del self._probing[source]
+
+    async def _run(
+        self,
+        func: Callable[[str, str], Tuple[Optional[str], Optional[int]]],
+        source: str,
+        executable: str,
+    ) -> Tuple[Optional[str], Optional[int]]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async with self._semaphore:
+            if func is FFmpegOpusAudio._probe_codec_native:
+                args = FFmpegOpusAudio._probe_args_native(source, executable)
+                output = await self._communicate(args, check=True)
+                return FFmpegOpusAudio._parse_probe_native(output)
+            if func is FFmpegOpusAudio._probe_codec_fallback:
+                args = FFmpegOpusAudio._probe_args_fallback(source, executable)
+                output = await self._communicate(args, check=False)
+                return FFmpegOpusAudio._parse_probe_fallback(output)
+
+            # Custom probe methods are synchronous
+            return await asyncio.get_running_loop().run_in_executor(None, lambda: func(source, executable))
+
+    async def _communicate(self, args: List[str], *, check: bool) -> bytes:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL if check else subprocess.STDOUT,
+            creationflags=CREATE_NO_WINDOW,
+        )
+        try:
+            output, _ = await asyncio.wait_for(process.communicate(), timeout=self.TIMEOUT)
+        except BaseException:
+            # Timed out or cancelled, don't leave the process running
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+        if check and process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, args, output)
+        return output
+
+
+class OggOpusAudio(SeekableAudioSource):
+    """An audio source that plays an Ogg Opus file directly, without ffmpeg.
+
+    The file is memory-mapped and its packets are sent as they are stored, so
+    playing it costs neither a subprocess nor any encoding. Seeking uses the
+    page index of a :class:`~discord.oggparse.MappedOggStream` and is immediate.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    ------------
+    source: Union[:class:`str`, :class:`os.PathLike`, :term:`py:bytes-like object`]
+        The path of an Ogg Opus file or a buffer containing one.
+    start: :class:`float`
+        The position in seconds to start playing from. Defaults to ``0``.
+
+    Raises
+    --------
+    OggError
+        The file is not a valid Ogg stream.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, os.PathLike, bytes, bytearray, memoryview],
+        *,
+        start: float = 0.0,
+    ) -> None:
+        self._stream: MappedOggStream = MappedOggStream(source)
+        # Granule positions count the decoder's pre-skip samples, which are never played
+        self._pre_skip: int = 0
+        for packet in self._stream.iter_packets():
+            if packet[:8] == b'OpusHead' and len(packet) >= 12:
+                self._pre_skip = int.from_bytes(packet[10:12], 'little')
+            break
+
+        self._samples: int = 0
+        self._pending_seek: Optional[float] = None
+        self._seek_lock: threading.Lock = threading.Lock()
+        self._packets: Iterator[Union[bytes, memoryview]] = self._open(start)
+
+    def _open(self, position: float) -> Iterator[Union[bytes, memoryview]]:
+        if position < 0:
+            raise ValueError('position cannot be negative')
+
+        target = round(position * OpusEncoder.SAMPLING_RATE)
+        self._samples = target
+        if target == 0:
+            return self._stream.iter_packets()
+        return self._stream.iter_packets(start=target + self._pre_skip)
+
+    @property
+    def position(self) -> float:
+        pending = self._pending_seek
+        if pending is not None:
+            return pending
+        return self._samples / OpusEncoder.SAMPLING_RATE
+
+    @property
+    def duration(self) -> float:
+        return max(self._stream.duration - self._pre_skip / OpusEncoder.SAMPLING_RATE, 0.0)
+
+    def seek(self, position: float) -> None:
+        if position < 0:
+            raise ValueError('position cannot be negative')
+        with self._seek_lock:
+            self._pending_seek = position
+
+    def read(self) -> Union[bytes, memoryview]:
+        if self._pending_seek is not None:
+            with self._seek_lock:
+                position, self._pending_seek = self._pending_seek, None
+            if position is not None:
+                self._packets = self._open(position)
+
+        for packet in self._packets:
+            if _is_opus_header(packet):
+                continue
+            self._samples += _packet_samples(packet)
+            return packet
+        return b''
 
     def is_opus(self) -> bool:
         return True
 
+    def cleanup(self) -> None:
+        stream = getattr(self, '_stream', None)
+        if stream is not None:
+            stream.close()
+
 
 class PCMVolumeTransformer(AudioSource, Generic[AT]):
     """Transforms a previous :class:`AudioSource` to have volume controls.
@@ -697,88 +1262,924 @@ class PCMVolumeTransformer(AudioSource, Generic[AT]):
 
     def read(self) -> bytes:
         ret = self.original.read()
-        return audioop.mul(ret, 2, min(self._volume, 2.0))
+        return pcm.scale(ret, min(self._volume, 2.0))
 
 
-class AudioPlayer(threading.Thread):
-    DELAY: float = OpusEncoder.FRAME_LENGTH / 1000.0
+class _MixerEntry:
+    __slots__ = ('source', 'volume', 'gain', 'target', 'step', 'ducks', 'duck_gain', 'remove_when_faded')
 
-    def __init__(
-        self,
-        source: AudioSource,
-        client: VoiceClient,
-        *,
-        after: Optional[Callable[[Optional[Exception]], Any]] = None,
-    ) -> None:
-        super().__init__(daemon=True, name=f'audio-player:{id(self):#x}')
+    def __init__(self, source: AudioSource, volume: float, ducks: bool) -> None:
         self.source: AudioSource = source
-        self.client: VoiceClient = client
-        self.after: Optional[Callable[[Optional[Exception]], Any]] = after
+        self.volume: float = volume
+        self.gain: float = 1.0
+        self.target: float = 1.0
+        self.step: float = 0.0
+        self.ducks: bool = ducks
+        self.duck_gain: float = 1.0
+        self.remove_when_faded: bool = False
+
+    def fade(self, start: float, target: float, frames: int, *, remove: bool = False) -> None:
+        self.gain = start
+        self.target = target
+        self.step = (target - start) / max(frames, 1)
+        self.remove_when_faded = remove
+
+    def advance(self) -> float:
+        # Moves the fade forward a frame, returning the gain at the end of the frame
+        if self.step:
+            gain = self.gain + self.step
+            if (self.step > 0 and gain >= self.target) or (self.step < 0 and gain <= self.target):
+                gain = self.target
+                self.step = 0.0
+            self.gain = gain
+        return self.gain
+
+
+class MixedAudioSource(AudioSource):
+    r"""Mixes several PCM :class:`AudioSource` into a single stream.
+
+    This allows overlaying sound effects on top of music without stopping
+    playback, ducking the rest of the mix while an effect is playing, and
+    crossfading between sources. Sources are removed from the mix and cleaned
+    up once they are exhausted.
 
-        self._end: threading.Event = threading.Event()
-        self._resumed: threading.Event = threading.Event()
-        self._resumed.set()  # we are not paused
-        self._current_error: Optional[Exception] = None
-        self._lock: threading.Lock = threading.Lock()
+    This does not work on audio sources that have :meth:`AudioSource.is_opus`
+    set to ``True``.
 
-        if after is not None and not callable(after):
-            raise TypeError('Expected a callable for the "after" parameter.')
+    .. versionadded:: 2.6
 
-    def _do_run(self) -> None:
-        self.loops = 0
-        self._start = time.perf_counter()
+    Parameters
+    ------------
+    \*sources: :class:`AudioSource`
+        The sources to start mixing.
+    duck_volume: :class:`float`
+        The volume other sources are lowered to while a ducking source is playing.
+        Defaults to ``0.3``.
+    keep_alive: :class:`bool`
+        Whether to keep producing silence once every source is exhausted rather
+        than ending playback, so more sources can be added later. Defaults to ``False``.
 
-        # getattr lookup speed ups
-        client = self.client
-        play_audio = client.send_audio_packet
-        self._speak(SpeakingState.voice)
+    Raises
+    -------
+    TypeError
+        Not an audio source.
+    ClientException
+        An audio source is opus encoded.
+    """
 
-        while not self._end.is_set():
-            # are we paused?
-            if not self._resumed.is_set():
-                self.send_silence()
-                # wait until we aren't
-                self._resumed.wait()
-                continue
+    # How many frames it takes to duck or unduck, so the change doesn't click
+    DUCK_FRAMES: int = 10
 
-            data = self.source.read()
+    def __init__(self, *sources: AudioSource, duck_volume: float = 0.3, keep_alive: bool = False) -> None:
+        self.duck_volume: float = duck_volume
+        self.keep_alive: bool = keep_alive
+        self._entries: List[_MixerEntry] = []
+        self._lock: threading.Lock = threading.Lock()
 
-            if not data:
-                self.stop()
-                break
+        for source in sources:
+            self.add_source(source)
 
-            # are we disconnected from voice?
-            if not client.is_connected():
-                _log.debug('Not connected, waiting for %ss...', client.timeout)
-                # wait until we are connected, but not forever
-                connected = client.wait_until_connected(client.timeout)
-                if self._end.is_set() or not connected:
-                    _log.debug('Aborting playback')
-                    return
-                _log.debug('Reconnected, resuming playback')
-                self._speak(SpeakingState.voice)
-                # reset our internal data
-                self.loops = 0
-                self._start = time.perf_counter()
+    @property
+    def sources(self) -> List[AudioSource]:
+        """List[:class:`AudioSource`]: The sources currently being mixed."""
+        return [entry.source for entry in self._entries]
 
-            play_audio(data, encode=not self.source.is_opus())
-            self.loops += 1
-            next_time = self._start + self.DELAY * self.loops
-            delay = max(0, self.DELAY + (next_time - time.perf_counter()))
-            time.sleep(delay)
+    def _check_source(self, source: AudioSource) -> None:
+        if not isinstance(source, AudioSource):
+            raise TypeError(f'expected AudioSource not {source.__class__.__name__}.')
 
-        if client.is_connected():
-            self.send_silence()
+        if source.is_opus():
+            raise ClientException('AudioSource must not be Opus encoded.')
+
+    def _find(self, source: AudioSource) -> Optional[_MixerEntry]:
+        for entry in self._entries:
+            if entry.source is source:
+                return entry
+        return None
+
+    def add_source(self, source: AudioSource, *, volume: float = 1.0, duck: bool = False, fade_in: float = 0.0) -> None:
+        """Adds a source to the mix.
+
+        Parameters
+        -----------
+        source: :class:`AudioSource`
+            The source to add.
+        volume: :class:`float`
+            The volume of the source as a floating point percentage. Defaults to ``1.0``.
+        duck: :class:`bool`
+            Whether the other sources should be lowered to :attr:`duck_volume`
+            while this source is playing, e.g. for announcements. Defaults to ``False``.
+        fade_in: :class:`float`
+            How many seconds to fade the source in over. Defaults to ``0.0``.
+
+        Raises
+        -------
+        TypeError
+            Not an audio source.
+        ClientException
+            The audio source is opus encoded.
+        """
+        self._check_source(source)
+        entry = _MixerEntry(source, max(volume, 0.0), duck)
+        if fade_in > 0:
+            entry.fade(0.0, 1.0, self._frames(fade_in))
+
+        with self._lock:
+            self._entries.append(entry)
+
+    def remove_source(self, source: AudioSource, *, fade_out: float = 0.0) -> None:
+        """Removes a source from the mix, cleaning it up.
+
+        Parameters
+        -----------
+        source: :class:`AudioSource`
+            The source to remove.
+        fade_out: :class:`float`
+            How many seconds to fade the source out over before removing it.
+            Defaults to ``0.0``.
+
+        Raises
+        -------
+        ValueError
+            The source is not being mixed.
+        """
+        with self._lock:
+            entry = self._find(source)
+            if entry is None:
+                raise ValueError('source is not being mixed')
+
+            if fade_out > 0:
+                entry.fade(entry.gain, 0.0, self._frames(fade_out), remove=True)
+                return
+
+            self._entries.remove(entry)
+
+        source.cleanup()
+
+    def set_volume(self, source: AudioSource, volume: float) -> None:
+        """Sets the volume of a source in the mix.
+
+        Parameters
+        -----------
+        source: :class:`AudioSource`
+            The source to change the volume of.
+        volume: :class:`float`
+            The new volume as a floating point percentage.
+
+        Raises
+        -------
+        ValueError
+            The source is not being mixed.
+        """
+        entry = self._find(source)
+        if entry is None:
+            raise ValueError('source is not being mixed')
+        entry.volume = max(volume, 0.0)
+
+    def crossfade(self, source: AudioSource, duration: float, *, volume: float = 1.0) -> None:
+        """Crossfades from every non-ducking source currently in the mix to a new source.
+
+        The previous sources are removed once they have faded out.
+
+        Parameters
+        -----------
+        source: :class:`AudioSource`
+            The source to crossfade to.
+        duration: :class:`float`
+            How many seconds the crossfade lasts.
+        volume: :class:`float`
+            The volume of the new source as a floating point percentage. Defaults to ``1.0``.
+
+        Raises
+        -------
+        TypeError
+            Not an audio source.
+        ClientException
+            The audio source is opus encoded.
+        """
+        self._check_source(source)
+        frames = self._frames(duration)
+        entry = _MixerEntry(source, max(volume, 0.0), False)
+        entry.fade(0.0, 1.0, frames)
+
+        with self._lock:
+            for previous in self._entries:
+                if not previous.ducks:
+                    previous.fade(previous.gain, 0.0, frames, remove=True)
+            self._entries.append(entry)
+
+    @staticmethod
+    def _frames(seconds: float) -> int:
+        return max(1, round(seconds * 1000 / OpusEncoder.FRAME_LENGTH))
+
+    def read(self) -> bytes:
+        with self._lock:
+            entries = self._entries[:]
+
+        ducking = any(entry.ducks for entry in entries)
+        duck_step = (1.0 - self.duck_volume) / self.DUCK_FRAMES
+        frames: List[bytes] = []
+        finished: List[_MixerEntry] = []
+
+        for entry in entries:
+            data = entry.source.read()
+            if not data:
+                finished.append(entry)
+                continue
+
+            start = entry.gain * entry.duck_gain
+            gain = entry.advance()
+            if ducking and not entry.ducks:
+                entry.duck_gain = max(self.duck_volume, entry.duck_gain - duck_step)
+            elif entry.duck_gain < 1.0:
+                entry.duck_gain = min(1.0, entry.duck_gain + duck_step)
+            end = gain * entry.duck_gain
+
+            if start == end:
+                frames.append(pcm.scale(data, end * entry.volume) if end * entry.volume != 1.0 else data)
+            else:
+                frames.append(pcm.ramp(data, start * entry.volume, end * entry.volume))
+
+            if entry.remove_when_faded and not entry.step:
+                finished.append(entry)
+
+        if finished:
+            with self._lock:
+                for entry in finished:
+                    try:
+                        self._entries.remove(entry)
+                    except ValueError:
+                        continue
+                    entry.source.cleanup()
+
+        if not frames:
+            return OpusEncoder.FRAME_SIZE * b'\x00' if self.keep_alive else b''
+
+        return pcm.mix(frames)
+
+    def cleanup(self) -> None:
+        with self._lock:
+            entries = self._entries[:]
+            self._entries.clear()
+
+        for entry in entries:
+            entry.source.cleanup()
+
+
+class BroadcastAudio:
+    """Shares a single :class:`AudioSource` between any number of voice clients.
+
+    When many voice clients play the same stream, such as a radio station, giving
+    each of them its own :class:`FFmpegPCMAudio` or :class:`FFmpegOpusAudio` means
+    decoding and encoding the same data once per listener. A broadcast instead reads
+    the source from a single thread, encoding it to Opus once if needed, into a ring
+    buffer of recent frames. Every :meth:`subscribe` call returns a lightweight
+    :class:`BroadcastSubscriber` with its own read cursor into that buffer, which
+    can be passed to :meth:`VoiceClient.play` as usual.
+
+    The broadcast is live: the source is read in real time starting with the first
+    subscriber, and new subscribers join close to the most recent frame. Subscribers
+    that fall further behind than the buffer skip ahead, and subscribers that catch up
+    with the source get silence rather than blocking their player.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    ------------
+    source: :class:`AudioSource`
+        The source to broadcast.
+    buffer: :class:`int`
+        How many 20ms frames to keep for subscribers that fall behind. Defaults to ``50``.
+    encode: :class:`bool`
+        Whether to encode a PCM source to Opus once for every subscriber, rather than
+        each voice client encoding it separately. Requires the opus library.
+        Defaults to ``True``. Ignored for sources that are already Opus encoded.
+    close_when_idle: :class:`bool`
+        Whether to close the broadcast once its last subscriber is cleaned up.
+        Defaults to ``False``.
+
+    Raises
+    -------
+    TypeError
+        Not an audio source.
+    ValueError
+        An invalid buffer size was passed.
+    """
+
+    DELAY: float = OpusEncoder.FRAME_LENGTH / 1000.0
+    # How many frames behind the newest one a new subscriber starts, to absorb scheduling jitter
+    LEAD_FRAMES: int = 3
+
+    def __init__(
+        self,
+        source: AudioSource,
+        *,
+        buffer: int = 50,
+        encode: bool = True,
+        close_when_idle: bool = False,
+    ) -> None:
+        if not isinstance(source, AudioSource):
+            raise TypeError(f'expected AudioSource not {source.__class__.__name__}.')
+
+        if buffer <= self.LEAD_FRAMES:
+            raise ValueError(f'buffer must be greater than {self.LEAD_FRAMES}, not {buffer}')
+
+        self.source: AudioSource = source
+        self.close_when_idle: bool = close_when_idle
+
+        self._encoder: Optional[OpusEncoder] = None
+        if encode and not source.is_opus():
+            self._encoder = OpusEncoder()
+
+        self._opus: bool = source.is_opus() or self._encoder is not None
+        self._silence: bytes = OPUS_SILENCE if self._opus else OpusEncoder.FRAME_SIZE * b'\x00'
+        self._frames: List[bytes] = [b''] * buffer
+        # The absolute index of the next frame to be written
+        self._head: int = 0
+        self._subscribers: int = 0
+        self._ended: bool = False
+        self._closed: threading.Event = threading.Event()
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self) -> str:
+        return f'<BroadcastAudio subscribers={self._subscribers} frames={self._head} ended={self._ended}>'
+
+    @property
+    def subscriber_count(self) -> int:
+        """:class:`int`: The number of subscribers currently reading from the broadcast."""
+        return self._subscribers
+
+    def is_opus(self) -> bool:
+        """:class:`bool`: Checks if the subscribers of this broadcast produce Opus encoded audio."""
+        return self._opus
+
+    def is_done(self) -> bool:
+        """:class:`bool`: Indicates if the source has been exhausted or the broadcast closed."""
+        return self._ended
+
+    def subscribe(self) -> BroadcastSubscriber:
+        """Creates a new subscriber to the broadcast.
+
+        The first subscriber starts reading the source.
+
+        Raises
+        -------
+        ClientException
+            The broadcast has ended.
+
+        Returns
+        --------
+        :class:`BroadcastSubscriber`
+            An audio source to pass to :meth:`VoiceClient.play`.
+        """
+        with self._lock:
+            if self._ended:
+                raise ClientException('Broadcast has ended.')
+
+            self._subscribers += 1
+            cursor = max(self._head - self.LEAD_FRAMES, 0, self._head - len(self._frames))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name=f'audio-broadcast:{id(self):#x}')
+                self._thread.start()
+
+        return BroadcastSubscriber(self, cursor)
+
+    def close(self) -> None:
+        """Stops reading the source and cleans it up.
+
+        Subscribers finish the frames that were already buffered and then end.
+        """
+        self._closed.set()
+        with self._lock:
+            started = self._thread is not None
+            self._ended = True
+
+        # Otherwise the producer thread cleans the source up once it notices
+        if not started:
+            self.source.cleanup()
+
+    def _run(self) -> None:
+        source = self.source
+        encoder = self._encoder
+        frames = self._frames
+        size = len(frames)
+        start = time.perf_counter()
+        loops = 0
+
+        try:
+            while not self._closed.is_set():
+                data = source.read()
+                if not data:
+                    break
+
+                if encoder is not None:
+                    data = encoder.encode(data, encoder.SAMPLES_PER_FRAME)
+
+                with self._lock:
+                    frames[self._head % size] = data
+                    self._head += 1
+
+                loops += 1
+                next_time = start + self.DELAY * loops
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    self._closed.wait(delay)
+        except Exception:
+            _log.exception('Error reading from broadcast source %s', source)
+        finally:
+            with self._lock:
+                self._ended = True
+            source.cleanup()
+
+    def _read(self, cursor: int) -> Tuple[bytes, int]:
+        with self._lock:
+            head = self._head
+            if cursor >= head:
+                if self._ended:
+                    return b'', cursor
+                # Caught up with the source, fill in rather than block the player
+                return self._silence, cursor
+
+            oldest = head - len(self._frames)
+            if cursor < oldest:
+                cursor = oldest
+            return self._frames[cursor % len(self._frames)], cursor + 1
+
+    def _unsubscribe(self) -> None:
+        with self._lock:
+            self._subscribers -= 1
+            idle = self._subscribers <= 0
+
+        if idle and self.close_when_idle:
+            self.close()
+
+
+class BroadcastSubscriber(AudioSource):
+    """An audio source reading from a :class:`BroadcastAudio`.
+
+    These are created through :meth:`BroadcastAudio.subscribe` and should not be
+    created manually.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    -----------
+    broadcast: :class:`BroadcastAudio`
+        The broadcast this subscriber reads from.
+    """
+
+    def __init__(self, broadcast: BroadcastAudio, cursor: int) -> None:
+        self.broadcast: BroadcastAudio = broadcast
+        self._cursor: int = cursor
+        self._subscribed: bool = True
+
+    def read(self) -> bytes:
+        data, self._cursor = self.broadcast._read(self._cursor)
+        return data
+
+    def is_opus(self) -> bool:
+        return self.broadcast.is_opus()
+
+    def cleanup(self) -> None:
+        if self._subscribed:
+            self._subscribed = False
+            self.broadcast._unsubscribe()
+
+
+def _is_opus_header(packet: bytes) -> bool:
+    # The identification and comment headers of an Ogg Opus stream aren't audio
+    return packet[:8] in (b'OpusHead', b'OpusTags')
+
+
+class OpusClip:
+    """Represents a short audio clip that has been encoded to Opus once and kept around.
+
+    These are created by an :class:`OpusClipCache` and should not be created manually.
+    Every call to :meth:`source` returns a new :class:`OpusClipAudio` reading the same
+    stored packets, so playing a clip any number of times never encodes it again.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    -----------
+    key: :class:`str`
+        The key the clip is cached under.
+    """
+
+    __slots__ = ('key', '_buffer', '_offsets', '_path', '__weakref__')
+
+    def __init__(self, key: str, buffer: Union[bytes, mmap.mmap], offsets: array.array[int], path: Optional[str] = None):
+        self.key: str = key
+        self._buffer: Union[bytes, mmap.mmap] = buffer
+        # offsets[i]:offsets[i + 1] is the i-th packet in the buffer
+        self._offsets: array.array[int] = offsets
+        self._path: Optional[str] = path
+
+    def __repr__(self) -> str:
+        return f'<OpusClip key={self.key!r} frames={self.frame_count} size={self.size}>'
+
+    def __len__(self) -> int:
+        return self.frame_count
+
+    @property
+    def frame_count(self) -> int:
+        """:class:`int`: The number of 20ms Opus packets in the clip."""
+        return len(self._offsets) - 1
+
+    @property
+    def duration(self) -> float:
+        """:class:`float`: The duration of the clip in seconds."""
+        return self.frame_count * OpusEncoder.FRAME_LENGTH / 1000.0
+
+    @property
+    def size(self) -> int:
+        """:class:`int`: The number of bytes the clip's packets take up."""
+        return self._offsets[-1]
+
+    def is_memory_mapped(self) -> bool:
+        """:class:`bool`: Indicates if the clip is stored in a memory-mapped file rather than in memory."""
+        return self._path is not None
+
+    def packets(self) -> Iterator[memoryview]:
+        """Iterates over the Opus packets of the clip without copying them.
+
+        Yields
+        -------
+        :class:`memoryview`
+            A view of an Opus packet.
+        """
+        view = memoryview(self._buffer)
+        offsets = self._offsets
+        for index in range(len(offsets) - 1):
+            yield view[offsets[index] : offsets[index + 1]]
+
+    def source(self) -> OpusClipAudio:
+        """Creates a new audio source that plays this clip.
+
+        Returns
+        --------
+        :class:`OpusClipAudio`
+            The audio source to pass to :meth:`VoiceClient.play`.
+        """
+        return OpusClipAudio(self)
+
+    @classmethod
+    def _from_packets(cls, key: str, packets: Iterable[bytes], *, directory: Optional[str] = None) -> OpusClip:
+        offsets = array.array('Q', [0])
+        chunks: List[bytes] = []
+        total = 0
+        for packet in packets:
+            total += len(packet)
+            offsets.append(total)
+            chunks.append(bytes(packet))
+
+        buffer = b''.join(chunks)
+        if directory is None or not buffer:
+            return cls(key, buffer, offsets)
+
+        fd, path = tempfile.mkstemp(prefix='discord-clip-', suffix='.opus', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb+') as fp:
+                fp.write(buffer)
+                fp.flush()
+                mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            os.unlink(path)
+            raise
+        return cls(key, mapped, offsets, path)
+
+    def _release(self) -> None:
+        # The mapping itself stays valid for readers still holding it, only the file goes away
+        if self._path is not None:
+            try:
+                os.unlink(self._path)
+            except OSError:
+                _log.debug('Could not remove cached clip file %s', self._path, exc_info=True)
+
+
+class OpusClipAudio(SeekableAudioSource):
+    """An audio source that plays an :class:`OpusClip`.
+
+    Packets are handed out as :class:`memoryview` slices of the clip's storage,
+    so reading never copies or encodes audio. Seeking moves to the nearest packet.
+
+    These are created through :meth:`OpusClip.source` and should not be created manually.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    -----------
+    clip: :class:`OpusClip`
+        The clip being played.
+    """
+
+    def __init__(self, clip: OpusClip) -> None:
+        self.clip: OpusClip = clip
+        self._view: memoryview = memoryview(clip._buffer)
+        self._offsets: array.array[int] = clip._offsets
+        self._index: int = 0
+
+    @property
+    def position(self) -> float:
+        return self._index * OpusEncoder.FRAME_LENGTH / 1000.0
+
+    @property
+    def duration(self) -> float:
+        return self.clip.duration
+
+    def seek(self, position: float) -> None:
+        if position < 0:
+            raise ValueError('position cannot be negative')
+        self._index = min(round(position * 1000.0 / OpusEncoder.FRAME_LENGTH), self.clip.frame_count)
+
+    def read(self) -> Union[bytes, memoryview]:
+        index = self._index
+        offsets = self._offsets
+        if index >= len(offsets) - 1:
+            return b''
+        self._index = index + 1
+        return self._view[offsets[index] : offsets[index + 1]]
+
+    def is_opus(self) -> bool:
+        return True
+
+
+class OpusClipCache:
+    """A least recently used cache of pre-encoded :class:`OpusClip`.
+
+    Bots that play the same short sound effects over and over would otherwise
+    run ffmpeg and encode every clip on every play. Clips in this cache are
+    encoded once, after which playing them is only a matter of handing out
+    stored packets.
+
+    Clips are kept in memory, or in memory-mapped files inside ``directory``
+    when one is given, which keeps them out of the Python heap. Once the total
+    size of the cached clips goes over ``max_size`` the least recently used
+    clips are evicted.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    ------------
+    max_size: :class:`int`
+        The maximum number of bytes of Opus packets to keep. Defaults to 64 MiB.
+    directory: Optional[:class:`str`]
+        A directory to store clips in as memory-mapped files. Defaults to ``None``,
+        keeping clips in memory.
+    executable: :class:`str`
+        The ffmpeg executable used by :meth:`load`. Defaults to ``ffmpeg``.
+    bitrate: :class:`int`
+        The bitrate in kbps that :meth:`load` encodes clips with. Defaults to ``128``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 64 * 1024 * 1024,
+        directory: Optional[str] = None,
+        executable: str = 'ffmpeg',
+        bitrate: int = 128,
+    ) -> None:
+        self.max_size: int = max_size
+        self.directory: Optional[str] = directory
+        self.executable: str = executable
+        self.bitrate: int = bitrate
+        self._clips: OrderedDict[str, OpusClip] = OrderedDict()
+        self._size: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._loading: Dict[str, asyncio.Future[OpusClip]] = {}
+
+    def __repr__(self) -> str:
+        return f'<OpusClipCache clips={len(self._clips)} size={self._size} max_size={self.max_size}>'
+
+    def __len__(self) -> int:
+        return len(self._clips)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._clips
+
+    @property
+    def size(self) -> int:
+        """:class:`int`: The number of bytes of Opus packets currently cached."""
+        return self._size
+
+    @property
+    def clips(self) -> List[OpusClip]:
+        """List[:class:`OpusClip`]: The cached clips, from least to most recently used."""
+        return list(self._clips.values())
+
+    def get(self, key: str) -> Optional[OpusClip]:
+        """Gets a cached clip, marking it as recently used.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the clip.
+
+        Returns
+        --------
+        Optional[:class:`OpusClip`]
+            The clip, or ``None`` if it isn't cached.
+        """
+        with self._lock:
+            clip = self._clips.get(key)
+            if clip is not None:
+                self._clips.move_to_end(key)
+            return clip
+
+    def add(self, key: str, packets: Iterable[bytes]) -> OpusClip:
+        """Caches a clip from 20ms Opus packets, replacing any clip with the same key.
+
+        A clip bigger than :attr:`max_size` is returned without being cached.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key to cache the clip under.
+        packets: Iterable[:term:`py:bytes-like object`]
+            The Opus packets of the clip.
+
+        Returns
+        --------
+        :class:`OpusClip`
+            The new clip.
+        """
+        clip = OpusClip._from_packets(key, packets, directory=self.directory)
+        evicted: List[OpusClip] = []
+
+        with self._lock:
+            previous = self._clips.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+                evicted.append(previous)
+
+            if clip.size <= self.max_size:
+                self._clips[key] = clip
+                self._size += clip.size
+                while self._size > self.max_size:
+                    _, oldest = self._clips.popitem(last=False)
+                    self._size -= oldest.size
+                    evicted.append(oldest)
+            else:
+                evicted.append(clip)
+
+        for old in evicted:
+            old._release()
+        return clip
+
+    def add_ogg(self, key: str, stream: IO[bytes]) -> OpusClip:
+        """Caches a clip from an Ogg Opus stream, without involving ffmpeg.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key to cache the clip under.
+        stream: :term:`py:file object`
+            A binary file-like object containing Ogg encapsulated Opus.
+
+        Raises
+        -------
+        OggError
+            The stream is not a valid Ogg stream.
+
+        Returns
+        --------
+        :class:`OpusClip`
+            The new clip.
+        """
+        packets = OggStream(stream).iter_packets()
+        return self.add(key, (packet for packet in packets if not _is_opus_header(packet)))
+
+    def remove(self, key: str) -> Optional[OpusClip]:
+        """Removes a clip from the cache.
+
+        Sources already playing the clip keep working.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the clip.
+
+        Returns
+        --------
+        Optional[:class:`OpusClip`]
+            The removed clip, or ``None`` if it wasn't cached.
+        """
+        with self._lock:
+            clip = self._clips.pop(key, None)
+            if clip is not None:
+                self._size -= clip.size
+
+        if clip is not None:
+            clip._release()
+        return clip
+
+    def clear(self) -> None:
+        """Removes every clip from the cache."""
+        with self._lock:
+            clips = list(self._clips.values())
+            self._clips.clear()
+            self._size = 0
+
+        for clip in clips:
+            clip._release()
+
+    def _encode(self, source: str, **options: Any) -> List[bytes]:
+        audio = FFmpegOpusAudio(source, bitrate=self.bitrate, executable=self.executable, **options)
+        try:
+            packets = []
+            for packet in iter(audio.read, b''):
+                if not _is_opus_header(packet):
+                    packets.append(packet)
+            return packets
+        finally:
+            audio.cleanup()
+
+    def _load(self, key: str, source: str, options: Dict[str, Any]) -> OpusClip:
+        return self.add(key, self._encode(source, **options))
+
+    def _loaded(self, key: str, future: asyncio.Future[OpusClip]) -> None:
+        if self._loading.get(key) is future:
+            del self._loading[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled
+            future.exception()
+
+    async def load(self, source: str, *, key: Optional[str] = None, **options: Any) -> OpusClip:
+        r"""|coro|
+
+        Gets a clip from the cache, encoding it with ffmpeg if it isn't cached yet.
+
+        Concurrent loads of the same key only encode the clip once. Cancelling one
+        of them doesn't cancel the encode for the others.
+
+        Parameters
+        -----------
+        source: :class:`str`
+            The file or URL to pass to ffmpeg.
+        key: Optional[:class:`str`]
+            The key to cache the clip under. Defaults to ``source``.
+        \*\*options
+            Extra keyword arguments passed to :class:`FFmpegOpusAudio`,
+            such as ``before_options`` and ``options``.
+
+        Raises
+        -------
+        ClientException
+            The ffmpeg subprocess failed to be created.
 
-    def run(self) -> None:
-        try:
-            self._do_run()
-        except Exception as exc:
-            self._current_error = exc
-            self.stop()
-        finally:
-            self._call_after()
-            self.source.cleanup()
+        Returns
+        --------
+        :class:`OpusClip`
+            The cached clip.
+        """
+        key = source if key is None else key
+        clip = self.get(key)
+        if clip is not None:
+            return clip
+
+        pending = self._loading.get(key)
+        if pending is None:
+            # The encode is shared by every caller, cancelling one of them doesn't cancel it for the others
+            pending = asyncio.get_running_loop().run_in_executor(None, lambda: self._load(key, source, options))
+            self._loading[key] = pending
+            pending.add_done_callback(lambda future: self._loaded(key, future))
+
+        return await asyncio.shield(pending)
+
+    async def source(self, source: str, *, key: Optional[str] = None, **options: Any) -> OpusClipAudio:
+        """|coro|
+
+        A shortcut for :meth:`load` followed by :meth:`OpusClip.source`.
+
+        Returns
+        --------
+        :class:`OpusClipAudio`
+            An audio source playing the clip.
+        """
+        clip = await self.load(source, key=key, **options)
+        return clip.source()
+
+
+def _seekable_source(source: AudioSource) -> Optional[SeekableAudioSource]:
+    # Volume transformers don't change timing, so seek the source they wrap
+    while isinstance(source, PCMVolumeTransformer):
+        source = source.original
+    return source if isinstance(source, SeekableAudioSource) else None
+
+
+class _BasePlayer:
+    # The parts shared by AudioPlayer and ScheduledAudioPlayer
+
+    name: str
+    source: AudioSource
+    client: VoiceClient
+    after: Optional[Callable[[Optional[Exception]], Any]]
+    _current_error: Optional[Exception]
+    _lock: threading.Lock
+    _frames: int
+    _buffer: Deque[bytes]
 
     def _call_after(self) -> None:
         error = self._current_error
@@ -792,9 +2193,229 @@ class AudioPlayer(threading.Thread):
         elif error:
             _log.exception('Exception in voice thread %s', self.name, exc_info=error)
 
+    @property
+    def position(self) -> float:
+        source = _seekable_source(self.source)
+        if source is not None:
+            # Frames read ahead haven't been played yet
+            return max(source.position - len(self._buffer) * OpusEncoder.FRAME_LENGTH / 1000.0, 0.0)
+        return self._frames * OpusEncoder.FRAME_LENGTH / 1000.0
+
+    @property
+    def duration(self) -> Optional[float]:
+        source = _seekable_source(self.source)
+        return source.duration if source is not None else None
+
+    def seek(self, position: float) -> None:
+        source = _seekable_source(self.source)
+        if source is None:
+            raise TypeError(f'{self.source.__class__.__name__} does not support seeking')
+        with self._lock:
+            source.seek(position)
+            self._clear_buffer()
+
+    def _clear_buffer(self) -> None:
+        # Must be called with self._lock held, right after the source changed
+        pass
+
+    def _speak(self, speaking: SpeakingState) -> None:
+        try:
+            asyncio.run_coroutine_threadsafe(self.client.ws.speak(speaking), self.client.client.loop)
+        except Exception:
+            _log.exception("Speaking call in player failed")
+
+    def send_silence(self, count: int = 5) -> None:
+        try:
+            for n in range(count):
+                self.client.send_audio_packet(OPUS_SILENCE, encode=False)
+        except Exception:
+            # Any possible error (probably a socket error) is so inconsequential it's not even worth logging
+            pass
+
+
+class AudioPlayer(_BasePlayer, threading.Thread):
+    DELAY: float = OpusEncoder.FRAME_LENGTH / 1000.0
+    # How many frames behind the clock may fall before it's moved instead of catching up
+    MAX_LAG_FRAMES: int = 5
+
+    def __init__(
+        self,
+        source: AudioSource,
+        client: VoiceClient,
+        *,
+        after: Optional[Callable[[Optional[Exception]], Any]] = None,
+        lookahead: int = 0,
+    ) -> None:
+        super().__init__(daemon=True, name=f'audio-player:{id(self):#x}')
+        self.source: AudioSource = source
+        self.client: VoiceClient = client
+        self.after: Optional[Callable[[Optional[Exception]], Any]] = after
+
+        self._end: threading.Event = threading.Event()
+        self._resumed: threading.Event = threading.Event()
+        self._resumed.set()  # we are not paused
+        self._current_error: Optional[Exception] = None
+        self._lock: threading.Lock = threading.Lock()
+        # Frames played from the current source, for sources that don't track their position
+        self._frames: int = 0
+        # Frames read from the source ahead of when they are due by a separate reader
+        # thread, so a slow read doesn't hold up the frame being sent
+        self.lookahead: int = lookahead
+        self._buffer: Deque[bytes] = deque()
+        self._buffered: threading.Condition = threading.Condition()
+        # Bumped whenever the buffered frames stop matching the source, i.e. on set_source and seek
+        self._generation: int = 0
+        self._exhausted: bool = False
+        self._reader: Optional[threading.Thread] = None
+        self._reader_stopped: bool = False
+        self.stats: PlaybackStats = client._playback_stats if client is not None else PlaybackStats()
+
+        if after is not None and not callable(after):
+            raise TypeError('Expected a callable for the "after" parameter.')
+
+    def _read_ahead(self) -> None:
+        buffer = self._buffer
+        buffered = self._buffered
+
+        def can_read() -> bool:
+            return self._reader_stopped or self._end.is_set() or (len(buffer) < self.lookahead and not self._exhausted)
+
+        while True:
+            with buffered:
+                buffered.wait_for(can_read)
+                if self._reader_stopped or self._end.is_set():
+                    return
+
+            with self._lock:
+                generation = self._generation
+                try:
+                    data = self.source.read()
+                except Exception as exc:
+                    self._current_error = exc
+                    data = b''
+
+            with buffered:
+                # Frames read from a source that was swapped out or seeked meanwhile are dropped
+                if generation == self._generation:
+                    buffer.append(data)
+                    self._exhausted = not data
+                    buffered.notify_all()
+
+    def _stop_reader(self) -> None:
+        with self._buffered:
+            self._reader_stopped = True
+            self._buffered.notify_all()
+        if self._reader is not None:
+            self._reader.join()
+
+    def _clear_buffer(self) -> None:
+        # Must be called with self._lock held, right after the source changed
+        with self._buffered:
+            self._generation += 1
+            self._buffer.clear()
+            self._exhausted = False
+            self._buffered.notify_all()
+
+    def _next_frame(self) -> bytes:
+        if not self.lookahead:
+            with self._lock:
+                return self.source.read()
+
+        buffer = self._buffer
+        with self._buffered:
+            if not buffer:
+                self.stats.underruns += 1
+                self._buffered.wait_for(lambda: buffer or self._end.is_set())
+                if not buffer:
+                    return b''
+            data = buffer.popleft()
+            self._buffered.notify_all()
+            return data
+
+    def _do_run(self) -> None:
+        if self.lookahead:
+            self._reader = threading.Thread(target=self._read_ahead, daemon=True, name=f'{self.name}:reader')
+            self._reader.start()
+            # Start the clock with a full buffer
+            with self._buffered:
+                self._buffered.wait_for(lambda: len(self._buffer) >= self.lookahead or self._exhausted or self._end.is_set())
+
+        self.loops = 0
+        self._start = time.perf_counter()
+
+        # getattr lookup speed ups
+        client = self.client
+        stats = self.stats
+        play_audio = client.send_audio_packet
+        max_lag = self.DELAY * self.MAX_LAG_FRAMES
+        self._speak(SpeakingState.voice)
+
+        while not self._end.is_set():
+            # are we paused?
+            if not self._resumed.is_set():
+                self.send_silence()
+                # wait until we aren't
+                self._resumed.wait()
+                continue
+
+            data = self._next_frame()
+
+            if not data:
+                self.stop()
+                break
+
+            # are we disconnected from voice?
+            if not client.is_connected():
+                _log.debug('Not connected, waiting for %ss...', client.timeout)
+                # wait until we are connected, but not forever
+                connected = client.wait_until_connected(client.timeout)
+                if self._end.is_set() or not connected:
+                    _log.debug('Aborting playback')
+                    return
+                _log.debug('Reconnected, resuming playback')
+                self._speak(SpeakingState.voice)
+                # reset our internal data
+                self.loops = 0
+                self._start = time.perf_counter()
+
+            # Frame n is due at start + n * DELAY, so oversleeping one frame is made up on
+            # the next ones instead of accumulating as drift
+            due = self._start + self.DELAY * self.loops
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            lateness = time.perf_counter() - due
+            if lateness > max_lag:
+                # Too far behind to catch up without a burst of packets, move the clock instead
+                stats.resyncs += 1
+                self.loops = 0
+                self._start = due = time.perf_counter()
+
+            play_audio(data, encode=not self.source.is_opus())
+            stats._record_lateness(max(lateness, 0.0))
+            self._frames += 1
+            self.loops += 1
+
+        if client.is_connected():
+            self.send_silence()
+
+    def run(self) -> None:
+        try:
+            self._do_run()
+        except Exception as exc:
+            self._current_error = exc
+            self.stop()
+        finally:
+            # The source can't be cleaned up while the reader may still be reading from it
+            self._stop_reader()
+            self._call_after()
+            self.source.cleanup()
+
     def stop(self) -> None:
         self._end.set()
         self._resumed.set()
+        with self._buffered:
+            self._buffered.notify_all()
         self._speak(SpeakingState.none)
 
     def pause(self, *, update_speaking: bool = True) -> None:
@@ -819,18 +2440,321 @@ class AudioPlayer(threading.Thread):
         with self._lock:
             self.pause(update_speaking=False)
             self.source = source
+            self._frames = 0
+            self._clear_buffer()
             self.resume(update_speaking=False)
 
-    def _speak(self, speaking: SpeakingState) -> None:
-        try:
-            asyncio.run_coroutine_threadsafe(self.client.ws.speak(speaking), self.client.client.loop)
-        except Exception:
-            _log.exception("Speaking call in player failed")
 
-    def send_silence(self, count: int = 5) -> None:
+class ScheduledAudioPlayer(_BasePlayer):
+    """An :class:`AudioPlayer` replacement that is driven by an :class:`AudioScheduler`
+    worker thread instead of owning a thread of its own.
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        client: VoiceClient,
+        scheduler: AudioScheduler,
+        *,
+        after: Optional[Callable[[Optional[Exception]], Any]] = None,
+    ) -> None:
+        self.name: str = f'scheduled-audio-player:{id(self):#x}'
+        self.source: AudioSource = source
+        self.client: VoiceClient = client
+        self.scheduler: AudioScheduler = scheduler
+        self.after: Optional[Callable[[Optional[Exception]], Any]] = after
+
+        self._ended: bool = False
+        self._paused: bool = False
+        self._send_silence: bool = False
+        self._disconnected_at: Optional[float] = None
+        self._current_error: Optional[Exception] = None
+        self._lock: threading.Lock = threading.Lock()
+        self._frames: int = 0
+        # Frames are read on their tick, never ahead of it
+        self._buffer: Deque[bytes] = deque()
+        self.stats: PlaybackStats = client._playback_stats
+
+        if after is not None and not callable(after):
+            raise TypeError('Expected a callable for the "after" parameter.')
+
+    def start(self) -> None:
+        self._speak(SpeakingState.voice)
+        self.scheduler._add_player(self)
+
+    def stop(self) -> None:
+        self._ended = True
+        self._speak(SpeakingState.none)
+
+    def pause(self, *, update_speaking: bool = True) -> None:
+        if not self._paused:
+            self._paused = True
+            self._send_silence = True
+        if update_speaking:
+            self._speak(SpeakingState.none)
+
+    def resume(self, *, update_speaking: bool = True) -> None:
+        self._paused = False
+        self._send_silence = False
+        if update_speaking:
+            self._speak(SpeakingState.voice)
+
+    def is_playing(self) -> bool:
+        return not self._paused and not self._ended
+
+    def is_paused(self) -> bool:
+        return not self._ended and self._paused
+
+    def set_source(self, source: AudioSource) -> None:
+        with self._lock:
+            self.source = source
+            self._frames = 0
+
+    def _read(self, now: float) -> Optional[Tuple[bytes, bool]]:
+        # Returns the next frame to send for this tick, or None when there is nothing
+        # to send right now. Ends the player when the source is exhausted.
+        if self._paused:
+            if self._send_silence:
+                self._send_silence = False
+                self.send_silence()
+            return None
+
+        client = self.client
+        if not client.is_connected():
+            if self._disconnected_at is None:
+                _log.debug('Not connected, waiting for %ss...', client.timeout)
+                self._disconnected_at = now
+            elif now - self._disconnected_at > client.timeout:
+                _log.debug('Aborting playback')
+                self._ended = True
+            return None
+
+        if self._disconnected_at is not None:
+            _log.debug('Reconnected, resuming playback')
+            self._disconnected_at = None
+            self._speak(SpeakingState.voice)
+
+        with self._lock:
+            source = self.source
+            data = source.read()
+
+        if not data:
+            self.stop()
+            return None
+
+        self._frames += 1
+        return data, not source.is_opus()
+
+    def _send_final_silence(self) -> None:
+        # Called on the worker thread that drives the client, so it can't interleave
+        # with the packets of the client's next player
+        if self._disconnected_at is None and self.client.is_connected():
+            self.send_silence()
+
+    def _finish(self) -> None:
         try:
-            for n in range(count):
-                self.client.send_audio_packet(OPUS_SILENCE, encode=False)
-        except Exception:
-            # Any possible error (probably a socket error) is so inconsequential it's not even worth logging
-            pass
+            self._call_after()
+        finally:
+            self.source.cleanup()
+
+
+class _AudioSchedulerWorker(threading.Thread):
+    def __init__(self, scheduler: AudioScheduler, index: int) -> None:
+        super().__init__(daemon=True, name=f'audio-scheduler:{id(scheduler):#x}:{index}')
+        self.scheduler: AudioScheduler = scheduler
+        self.players: List[ScheduledAudioPlayer] = []
+        self._pending: List[ScheduledAudioPlayer] = []
+        self._pending_lock: threading.Lock = threading.Lock()
+        self._wakeup: threading.Event = threading.Event()
+        self._end: threading.Event = threading.Event()
+
+    @property
+    def load(self) -> int:
+        return len(self.players) + len(self._pending)
+
+    def add(self, player: ScheduledAudioPlayer) -> None:
+        with self._pending_lock:
+            self._pending.append(player)
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        self._end.set()
+        self._wakeup.set()
+
+    def run(self) -> None:
+        delay = AudioScheduler.DELAY
+        next_tick = time.perf_counter()
+
+        while not self._end.is_set():
+            if self._pending:
+                with self._pending_lock:
+                    self.players.extend(self._pending)
+                    self._pending.clear()
+
+            if not self.players:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                next_tick = time.perf_counter()
+                continue
+
+            self._tick(next_tick)
+
+            next_tick += delay
+            remaining = next_tick - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            elif remaining < -delay * AudioScheduler.MAX_LAG_FRAMES:
+                # We've fallen too far behind to catch up without bursting packets, so resync
+                next_tick = time.perf_counter()
+                for player in self.players:
+                    player.stats.resyncs += 1
+
+        for player in self.players + self._pending:
+            player._ended = True
+            self.scheduler._finish_player(player)
+        self.players.clear()
+        self._pending.clear()
+
+    def _tick(self, now: float) -> None:
+        # Read, encode and encrypt every player's frame first, then flush them to the
+        # sockets in one pass so sends for this tick go out as close together as possible.
+        batch: List[Tuple[VoiceClient, Any]] = []
+        finished: List[ScheduledAudioPlayer] = []
+        lateness = max(time.perf_counter() - now, 0.0)
+
+        for player in self.players:
+            if player._ended:
+                finished.append(player)
+                continue
+
+            try:
+                frame = player._read(now)
+                if frame is not None:
+                    client = player.client
+                    batch.append((client, client._prepare_audio_packet(frame[0], encode=frame[1])))
+                    player.stats._record_lateness(lateness)
+            except Exception as exc:
+                player._current_error = exc
+                player.stop()
+
+            if player._ended:
+                finished.append(player)
+
+        for client, packet in batch:
+            client._send_prepared_audio_packet(packet)
+
+        for player in finished:
+            self.players.remove(player)
+            self.scheduler._finish_player(player)
+
+
+class AudioScheduler:
+    """A shared scheduler that drives audio playback for many voice clients from a
+    small, fixed number of threads.
+
+    By default every :meth:`VoiceClient.play` call starts a dedicated thread that
+    reads, encodes and sends a frame every 20ms. When hosting many simultaneous
+    voice connections this means one thread per player. A scheduler instead ticks
+    all of its players on a common 20ms clock, encoding and encrypting each
+    player's frame before flushing the packets to their sockets together.
+
+    Pass an instance to :class:`Client` through the ``audio_scheduler`` parameter
+    to use it for every voice client of that client. The :class:`AudioSource` API
+    is unchanged, however since sources share worker threads their
+    :meth:`AudioSource.read` must not block for long. The ``after`` callbacks and
+    source cleanup run in a separate thread pool. Every player of a voice client
+    runs on the same worker thread.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    -----------
+    workers: :class:`int`
+        The number of worker threads to spread players across. Defaults to ``1``.
+    """
+
+    DELAY: float = OpusEncoder.FRAME_LENGTH / 1000.0
+    MAX_LAG_FRAMES: int = 5
+
+    def __init__(self, *, workers: int = 1) -> None:
+        if workers < 1:
+            raise ValueError(f'workers must be at least 1, not {workers}')
+
+        self._workers: List[_AudioSchedulerWorker] = [_AudioSchedulerWorker(self, index) for index in range(workers)]
+        self._lock: threading.Lock = threading.Lock()
+        self._finalizer: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._closed: bool = False
+        # Every player of a voice client runs on the same worker, since they share the
+        # client's packet buffer, sequence and timestamp
+        self._client_workers: weakref.WeakKeyDictionary[VoiceClient, _AudioSchedulerWorker] = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return f'<AudioScheduler workers={len(self._workers)} players={self.player_count}>'
+
+    @property
+    def workers(self) -> int:
+        """:class:`int`: The number of worker threads in this scheduler."""
+        return len(self._workers)
+
+    @property
+    def player_count(self) -> int:
+        """:class:`int`: The number of players currently being driven by this scheduler."""
+        return sum(worker.load for worker in self._workers)
+
+    def is_closed(self) -> bool:
+        """:class:`bool`: Indicates if the scheduler has been closed."""
+        return self._closed
+
+    def close(self) -> None:
+        """Stops every worker thread, ending all players driven by this scheduler.
+
+        The ``after`` callback of every stopped player is still called.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        for worker in self._workers:
+            if worker.ident is not None:
+                worker.stop()
+                worker.join()
+            else:
+                for player in worker._pending:
+                    self._finish_player(player)
+
+        if self._finalizer is not None:
+            self._finalizer.shutdown(wait=True)
+
+    def _create_player(
+        self,
+        source: AudioSource,
+        client: VoiceClient,
+        *,
+        after: Optional[Callable[[Optional[Exception]], Any]] = None,
+    ) -> ScheduledAudioPlayer:
+        if self._closed:
+            raise ClientException('Audio scheduler is closed.')
+        return ScheduledAudioPlayer(source, client, self, after=after)
+
+    def _add_player(self, player: ScheduledAudioPlayer) -> None:
+        with self._lock:
+            if self._closed:
+                raise ClientException('Audio scheduler is closed.')
+
+            worker = self._client_workers.get(player.client)
+            if worker is None:
+                worker = self._client_workers[player.client] = min(self._workers, key=lambda w: w.load)
+            worker.add(player)
+            if worker.ident is None:
+                worker.start()
+
+    def _finish_player(self, player: ScheduledAudioPlayer) -> None:
+        player._send_final_silence()
+        with self._lock:
+            if self._finalizer is None:
+                self._finalizer = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(self._workers), thread_name_prefix='audio-scheduler-after'
+                )
+            finalizer = self._finalizer
+        finalizer.submit(player._finish)
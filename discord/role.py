@@ -23,13 +23,14 @@ DEALINGS IN THE SOFTWARE.
 """
 
 from __future__ import annotations
+
 from typing import Any, Dict, List, Optional, Union, overload, TYPE_CHECKING
 
 from .asset import Asset
 from .permissions import Permissions
 from .colour import Colour
 from .mixins import Hashable
-from .utils import snowflake_time, _bytes_to_base64_data, _get_as_snowflake, MISSING
+from .utils import snowflake_time, _bytes_to_base64_data, _get_as_snowflake, _intern_int, _intern_str, MISSING
 from .flags import RoleFlags
 
 __all__ = (
@@ -273,10 +274,10 @@ class Role(Hashable):
         return not r
 
     def _update(self, data: RolePayload):
-        self.name: str = data['name']
-        self._permissions: int = int(data.get('permissions', 0))
+        self.name: str = _intern_str(data['name'])
+        self._permissions: int = _intern_int(int(data.get('permissions', 0)))
         self.position: int = data.get('position', 0)
-        self._colour: int = data.get('color', 0)
+        self._colour: int = _intern_int(data.get('color', 0))
         self.hoist: bool = data.get('hoist', False)
         self._icon: Optional[str] = data.get('icon')
         self.unicode_emoji: Optional[str] = data.get('unicode_emoji')
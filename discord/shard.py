@@ -49,6 +49,7 @@ from typing import TYPE_CHECKING, Any, Callable, Tuple, Type, Optional, List, Di
 if TYPE_CHECKING:
     from typing_extensions import Unpack
     from .gateway import DiscordWebSocket
+    from .metrics import GatewayMetrics
     from .activity import BaseActivity
     from .flags import Intents
     from .types.gateway import SessionStartLimit
@@ -285,6 +286,14 @@ class ShardInfo:
         """:class:`float`: Measures latency between a HEARTBEAT and a HEARTBEAT_ACK in seconds for this shard."""
         return self._parent.ws.latency
 
+    @property
+    def metrics(self) -> GatewayMetrics:
+        """:class:`GatewayMetrics`: Traffic statistics for this shard's gateway connection.
+
+        .. versionadded:: 2.6
+        """
+        return self._parent.ws.metrics
+
     def is_ws_ratelimited(self) -> bool:
         """:class:`bool`: Whether the websocket is currently rate limited.
 
@@ -0,0 +1,495 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import logging
+import queue
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, TYPE_CHECKING, Tuple, Union
+
+from . import opus
+from .object import Object
+
+if TYPE_CHECKING:
+    from .member import Member
+    from .user import User
+    from .voice_client import VoiceClient
+
+    Decryptor = Callable[[bytes, int, bool, bytes], bytes]
+
+has_nacl: bool
+
+try:
+    import nacl.bindings  # type: ignore
+
+    has_nacl = True
+except ImportError:
+    has_nacl = False
+
+__all__ = (
+    'AudioSink',
+    'VoiceData',
+)
+
+_log = logging.getLogger(__name__)
+
+_NONCE_PADDING = bytes(20)
+# Payload type Discord uses for Opus audio, RTCP packets are filtered out by this too
+OPUS_PAYLOAD_TYPE = 0x78
+# Gaps larger than this are treated as a discontinuity rather than concealed frame by frame
+MAX_CONCEALED_FRAMES = 5
+
+
+class VoiceData:
+    """Represents 20ms of audio received from a user over a voice connection.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    -----------
+    ssrc: :class:`int`
+        The synchronisation source identifier of the stream the audio came from.
+    user: Optional[Union[:class:`Member`, :class:`User`, :class:`Object`]]
+        The user that sent the audio, if their SSRC is known yet.
+        This is resolved from the speaking events of the voice websocket.
+    sequence: :class:`int`
+        The RTP sequence number of the frame.
+    timestamp: Optional[:class:`int`]
+        The RTP timestamp of the frame, or ``None`` if the frame was lost.
+    opus: Optional[:class:`bytes`]
+        The Opus encoded audio, or ``None`` if the frame was lost in transit.
+    pcm: :class:`bytes`
+        The decoded 16-bit 48KHz stereo PCM. Lost frames are concealed by the
+        decoder. This is empty if the sink only wants Opus, see :meth:`AudioSink.wants_opus`.
+    """
+
+    __slots__ = ('ssrc', 'user', 'sequence', 'timestamp', 'opus', 'pcm')
+
+    def __init__(
+        self,
+        *,
+        ssrc: int,
+        user: Optional[Union[Member, User, Object]],
+        sequence: int,
+        timestamp: Optional[int],
+        opus: Optional[bytes],
+        pcm: bytes = b'',
+    ) -> None:
+        self.ssrc: int = ssrc
+        self.user: Optional[Union[Member, User, Object]] = user
+        self.sequence: int = sequence
+        self.timestamp: Optional[int] = timestamp
+        self.opus: Optional[bytes] = opus
+        self.pcm: bytes = pcm
+
+    def __repr__(self) -> str:
+        return f'<VoiceData ssrc={self.ssrc} user={self.user!r} sequence={self.sequence} lost={self.opus is None}>'
+
+    def is_lost(self) -> bool:
+        """:class:`bool`: Indicates if this frame was lost in transit."""
+        return self.opus is None
+
+
+class AudioSink:
+    """Represents a destination for audio received over a voice connection.
+
+    Audio is delivered in 20ms frames, one :class:`VoiceData` per user per frame,
+    ordered per user and with lost frames filled in.
+
+    .. warning::
+
+        The sink writes are done in a separate decoding thread.
+
+    .. versionadded:: 2.6
+    """
+
+    def write(self, data: VoiceData) -> None:
+        """Receives 20ms worth of audio from a single user.
+
+        Subclasses must implement this.
+
+        Parameters
+        -----------
+        data: :class:`VoiceData`
+            The received audio.
+        """
+        raise NotImplementedError
+
+    def wants_opus(self) -> bool:
+        """Checks if the sink wants the audio Opus encoded, skipping decoding it to PCM."""
+        return False
+
+    def cleanup(self) -> None:
+        """Called when clean-up is needed to be done.
+
+        Useful for closing files or flushing buffers after
+        it is done receiving audio.
+        """
+        pass
+
+
+class RTPPacket:
+    __slots__ = ('sequence', 'timestamp', 'ssrc', 'opus')
+
+    def __init__(self, sequence: int, timestamp: int, ssrc: int, opus: bytes) -> None:
+        self.sequence: int = sequence
+        self.timestamp: int = timestamp
+        self.ssrc: int = ssrc
+        self.opus: bytes = opus
+
+
+def _decrypt_aead_xchacha20_poly1305_rtpsize(packet: bytes, header_size: int, extended: bool, key: bytes) -> bytes:
+    # The extension header (but not its body) is part of the authenticated data
+    if extended:
+        aad_size = header_size + 4
+        extension_size = struct.unpack_from('>H', packet, header_size + 2)[0] * 4
+    else:
+        aad_size = header_size
+        extension_size = 0
+
+    plaintext = nacl.bindings.crypto_aead_xchacha20poly1305_ietf_decrypt(
+        packet[aad_size:-4], packet[:aad_size], packet[-4:] + _NONCE_PADDING, key
+    )
+    return plaintext[extension_size:]
+
+
+def _strip_extension(plaintext: bytes, extended: bool) -> bytes:
+    if not extended:
+        return plaintext
+    return plaintext[4 + struct.unpack_from('>H', plaintext, 2)[0] * 4 :]
+
+
+def _decrypt_xsalsa20_poly1305(packet: bytes, header_size: int, extended: bool, key: bytes) -> bytes:
+    nonce = packet[:12] + _NONCE_PADDING[:12]
+    return _strip_extension(nacl.bindings.crypto_secretbox_open(packet[header_size:], nonce, key), extended)
+
+
+def _decrypt_xsalsa20_poly1305_suffix(packet: bytes, header_size: int, extended: bool, key: bytes) -> bytes:
+    plaintext = nacl.bindings.crypto_secretbox_open(packet[header_size:-24], packet[-24:], key)
+    return _strip_extension(plaintext, extended)
+
+
+def _decrypt_xsalsa20_poly1305_lite(packet: bytes, header_size: int, extended: bool, key: bytes) -> bytes:
+    plaintext = nacl.bindings.crypto_secretbox_open(packet[header_size:-4], packet[-4:] + _NONCE_PADDING, key)
+    return _strip_extension(plaintext, extended)
+
+
+_DECRYPTORS: Dict[str, Decryptor] = {
+    'aead_xchacha20_poly1305_rtpsize': _decrypt_aead_xchacha20_poly1305_rtpsize,
+    'xsalsa20_poly1305': _decrypt_xsalsa20_poly1305,
+    'xsalsa20_poly1305_suffix': _decrypt_xsalsa20_poly1305_suffix,
+    'xsalsa20_poly1305_lite': _decrypt_xsalsa20_poly1305_lite,
+}
+
+
+def decrypt_rtp_packet(mode: str, key: bytes, packet: bytes) -> RTPPacket:
+    """Parses and decrypts an RTP voice packet.
+
+    Raises :exc:`ValueError` for malformed packets and :exc:`nacl.exceptions.CryptoError`
+    when the packet does not authenticate.
+    """
+    if len(packet) < 12:
+        raise ValueError('packet is too short')
+
+    extended = bool(packet[0] & 0x10)
+    header_size = 12 + (packet[0] & 0x0F) * 4
+    _, _, sequence, timestamp, ssrc = struct.unpack_from('>BBHII', packet)
+
+    try:
+        decryptor = _DECRYPTORS[mode]
+    except KeyError:
+        raise ValueError(f'unsupported encryption mode {mode!r}') from None
+
+    try:
+        payload = decryptor(packet, header_size, extended, key)
+    except struct.error as exc:
+        raise ValueError('packet is malformed') from exc
+    return RTPPacket(sequence, timestamp, ssrc, payload)
+
+
+def _sequence_distance(start: int, end: int) -> int:
+    return (end - start) & 0xFFFF
+
+
+class JitterBuffer:
+    """Reorders the packets of a single RTP stream and detects lost ones."""
+
+    def __init__(self, depth: int = 3) -> None:
+        self.depth: int = depth
+        self.last_received: float = 0.0
+        self._packets: Dict[int, RTPPacket] = {}
+        self._next: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._packets)
+
+    def push(self, packet: RTPPacket) -> None:
+        self.last_received = time.monotonic()
+        sequence = packet.sequence
+        if self._next is not None and _sequence_distance(self._next, sequence) >= 0x8000:
+            # Arrived after we'd already given up on it
+            return
+        self._packets[sequence] = packet
+
+    def peek(self, sequence: int) -> Optional[RTPPacket]:
+        return self._packets.get(sequence)
+
+    def pop_ready(self, *, flush: bool = False) -> Iterator[Tuple[int, Optional[RTPPacket]]]:
+        """Yields ``(sequence, packet)`` pairs in order, where ``packet`` is ``None`` for a lost packet.
+
+        Unless ``flush`` is passed, gaps are only declared lost once enough later packets are buffered.
+        """
+        packets = self._packets
+        if self._next is None:
+            if not packets or (not flush and len(packets) < self.depth):
+                return
+            reference = next(iter(packets))
+            self._next = min(packets, key=lambda s: _sequence_distance(reference - 0x8000, s))
+
+        while packets:
+            sequence = self._next
+            packet = packets.pop(sequence, None)
+            if packet is None:
+                if not flush and len(packets) < self.depth:
+                    return
+
+                gap = min(_sequence_distance(sequence, s) for s in packets)
+                if gap > MAX_CONCEALED_FRAMES:
+                    # A discontinuity such as a restarted stream, resync instead of concealing it
+                    self._next = (sequence + gap) & 0xFFFF
+                    continue
+
+            self._next = (sequence + 1) & 0xFFFF
+            yield sequence, packet
+
+
+class _SSRCStream:
+    __slots__ = ('buffer', 'decoder')
+
+    def __init__(self, depth: int) -> None:
+        self.buffer: JitterBuffer = JitterBuffer(depth)
+        self.decoder: Optional[opus.Decoder] = None
+
+
+class _DecodeWorker(threading.Thread):
+    def __init__(self, receiver: AudioReceiver, index: int) -> None:
+        super().__init__(daemon=True, name=f'audio-receiver:{id(receiver):#x}:{index}')
+        self.receiver: AudioReceiver = receiver
+        self.queue: queue.SimpleQueue[Optional[bytes]] = queue.SimpleQueue()
+        self.streams: Dict[int, _SSRCStream] = {}
+
+    def run(self) -> None:
+        receiver = self.receiver
+        interval = AudioReceiver.FLUSH_INTERVAL
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    packet = self.queue.get(timeout=interval)
+                except queue.Empty:
+                    packet = b''
+
+                if packet is None:
+                    break
+
+                if packet:
+                    self._process(packet)
+
+                now = time.monotonic()
+                if now - last_flush >= interval:
+                    last_flush = now
+                    self._flush(now - interval * receiver.jitter_depth)
+
+            self._flush(None)
+        except Exception as exc:
+            receiver._error = exc
+            receiver.stop()
+        finally:
+            receiver._worker_done()
+
+    def _process(self, raw: bytes) -> None:
+        receiver = self.receiver
+        try:
+            packet = decrypt_rtp_packet(receiver._mode, receiver._key, raw)
+        except Exception:
+            _log.debug('Dropping voice packet that failed to decrypt', exc_info=True)
+            return
+
+        stream = self.streams.get(packet.ssrc)
+        if stream is None:
+            stream = self.streams[packet.ssrc] = _SSRCStream(receiver.jitter_depth)
+
+        stream.buffer.push(packet)
+        self._deliver(packet.ssrc, stream, flush=False)
+
+    def _flush(self, older_than: Optional[float]) -> None:
+        # Drain streams that have gone quiet, otherwise their tail would sit in the buffer
+        for ssrc, stream in self.streams.items():
+            if stream.buffer and (older_than is None or stream.buffer.last_received <= older_than):
+                self._deliver(ssrc, stream, flush=True)
+
+    def _deliver(self, ssrc: int, stream: _SSRCStream, *, flush: bool) -> None:
+        receiver = self.receiver
+        sink = receiver.sink
+        wants_opus = receiver._wants_opus
+        user = receiver._resolve_user(ssrc)
+
+        for sequence, packet in stream.buffer.pop_ready(flush=flush):
+            pcm = b''
+            if not wants_opus:
+                decoder = stream.decoder
+                if decoder is None:
+                    decoder = stream.decoder = opus.Decoder()
+                if packet is not None:
+                    pcm = decoder.decode(packet.opus, fec=False)
+                else:
+                    # Recover the lost frame from the next packet's FEC data if it's here, otherwise conceal it
+                    following = stream.buffer.peek((sequence + 1) & 0xFFFF)
+                    if following is not None:
+                        pcm = decoder.decode(following.opus, fec=True)
+                    else:
+                        pcm = decoder.decode(None, fec=False)
+
+            if packet is not None:
+                data = VoiceData(
+                    ssrc=ssrc, user=user, sequence=sequence, timestamp=packet.timestamp, opus=packet.opus, pcm=pcm
+                )
+            else:
+                data = VoiceData(ssrc=ssrc, user=user, sequence=sequence, timestamp=None, opus=None, pcm=pcm)
+            sink.write(data)
+
+
+class AudioReceiver:
+    """Receives, decrypts and decodes the audio of a voice connection into an :class:`AudioSink`.
+
+    Packets are sharded by SSRC across the decode workers, so every user's stream
+    is decoded in order by a single thread while different users decode in parallel.
+    """
+
+    FLUSH_INTERVAL: float = opus.Decoder.FRAME_LENGTH / 1000.0
+
+    def __init__(
+        self,
+        sink: AudioSink,
+        client: VoiceClient,
+        *,
+        after: Optional[Callable[[Optional[Exception]], Any]] = None,
+        workers: int = 1,
+        jitter_depth: int = 3,
+    ) -> None:
+        if not has_nacl:
+            raise RuntimeError('PyNaCl library needed in order to use voice')
+
+        if after is not None and not callable(after):
+            raise TypeError('Expected a callable for the "after" parameter.')
+
+        if workers < 1:
+            raise ValueError(f'workers must be at least 1, not {workers}')
+
+        self.sink: AudioSink = sink
+        self.client: VoiceClient = client
+        self.after: Optional[Callable[[Optional[Exception]], Any]] = after
+        self.jitter_depth: int = jitter_depth
+
+        self._wants_opus: bool = sink.wants_opus()
+        self._workers: List[_DecodeWorker] = [_DecodeWorker(self, index) for index in range(workers)]
+        self._running_workers: int = workers
+        self._lock: threading.Lock = threading.Lock()
+        self._stopped: bool = False
+        self._error: Optional[Exception] = None
+        self._mode: str = client.mode
+        self._secret_key: List[int] = client.secret_key
+        self._key: bytes = bytes(self._secret_key)
+
+    def start(self) -> None:
+        for worker in self._workers:
+            worker.start()
+        self.client._connection.add_socket_listener(self._on_packet)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+
+        self.client._connection.remove_socket_listener(self._on_packet)
+        for worker in self._workers:
+            worker.queue.put(None)
+
+    def is_listening(self) -> bool:
+        return not self._stopped
+
+    def _on_packet(self, data: bytes) -> None:
+        # Called from the socket reader thread, so only route the packet here
+        if len(data) < 12 or data[1] & 0x7F != OPUS_PAYLOAD_TYPE:
+            return
+
+        client = self.client
+        secret_key = client.secret_key
+        if secret_key is not self._secret_key:
+            self._secret_key = secret_key
+            self._key = bytes(secret_key)
+            self._mode = client.mode
+
+        ssrc = int.from_bytes(data[8:12], 'big')
+        workers = self._workers
+        workers[ssrc % len(workers)].queue.put(data)
+
+    def _resolve_user(self, ssrc: int) -> Optional[Union[Member, User, Object]]:
+        user_id = self.client._connection.ssrc_map.get(ssrc)
+        if user_id is None:
+            return None
+
+        guild = self.client.guild
+        member = guild.get_member(user_id) if guild is not None else None
+        if member is not None:
+            return member
+        return self.client._state.get_user(user_id) or Object(id=user_id)
+
+    def _worker_done(self) -> None:
+        with self._lock:
+            self._running_workers -= 1
+            if self._running_workers:
+                return
+
+        try:
+            self._call_after()
+        finally:
+            self.sink.cleanup()
+
+    def _call_after(self) -> None:
+        error = self._error
+
+        if self.after is not None:
+            try:
+                self.after(error)
+            except Exception as exc:
+                exc.__context__ = error
+                _log.exception('Calling the after function failed.', exc_info=exc)
+        elif error:
+            _log.exception('Exception in voice receive thread', exc_info=error)
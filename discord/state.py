@@ -43,6 +43,7 @@ from typing import (
     Generic,
     Tuple,
     Deque,
+    FrozenSet,
     Literal,
     overload,
 )
@@ -65,9 +66,9 @@ from .raw_models import *
 from .presences import RawPresenceUpdateEvent
 from .member import Member
 from .role import Role
-from .enums import ChannelType, try_enum, Status
+from .enums import ChannelType, GuildCacheLevel, try_enum, Status
 from . import utils
-from .flags import ApplicationFlags, Intents, MemberCacheFlags
+from .flags import ApplicationFlags, CacheFlags, Intents, MemberCacheFlags
 from .invite import Invite
 from .integrations import _integration_factory
 from .interactions import Interaction
@@ -81,6 +82,8 @@ from .audit_logs import AuditLogEntry
 from ._types import ClientT
 from .soundboard import SoundboardSound
 from .subscription import Subscription
+from .metrics import GatewayMetrics
+from .player import AudioScheduler
 
 
 if TYPE_CHECKING:
@@ -212,6 +215,7 @@ class ConnectionState(Generic[ClientT]):
 
         self.allowed_mentions: Optional[AllowedMentions] = allowed_mentions
         self._chunk_requests: Dict[Union[int, str], ChunkRequest] = {}
+        self._gateway_metrics: Dict[Optional[int], GatewayMetrics] = {}
 
         activity = options.get('activity', None)
         if activity:
@@ -253,6 +257,27 @@ class ConnectionState(Generic[ClientT]):
             cache_flags._verify_intents(intents)
 
         self.member_cache_flags: MemberCacheFlags = cache_flags
+
+        entity_cache_flags = options.get('cache_flags', None)
+        if entity_cache_flags is None:
+            entity_cache_flags = CacheFlags.all()
+        elif not isinstance(entity_cache_flags, CacheFlags):
+            raise TypeError(f'cache_flags parameter must be CacheFlags not {type(entity_cache_flags)!r}')
+
+        self.cache_flags: CacheFlags = entity_cache_flags
+        self._cached_channel_types: FrozenSet[ChannelType] = entity_cache_flags._channel_types
+
+        guild_cache_policy = options.get('guild_cache_policy', None)
+        if guild_cache_policy is not None and not callable(guild_cache_policy):
+            raise TypeError(f'guild_cache_policy parameter must be a callable not {type(guild_cache_policy)!r}')
+
+        self.guild_cache_policy: Optional[Callable[[int, GuildPayload], GuildCacheLevel]] = guild_cache_policy
+
+        audio_scheduler = options.get('audio_scheduler', None)
+        if audio_scheduler is not None and not isinstance(audio_scheduler, AudioScheduler):
+            raise TypeError(f'audio_scheduler parameter must be AudioScheduler not {type(audio_scheduler)!r}')
+
+        self.audio_scheduler: Optional[AudioScheduler] = audio_scheduler
         self._activity: Optional[ActivityPayload] = activity
         self._status: Optional[str] = status
         self._intents: Intents = intents
@@ -281,6 +306,14 @@ class ConnectionState(Generic[ClientT]):
     def cache_guild_expressions(self) -> bool:
         return self._intents.emojis_and_stickers
 
+    @property
+    def cache_emojis(self) -> bool:
+        return self._intents.emojis_and_stickers and self.cache_flags.emojis
+
+    @property
+    def cache_stickers(self) -> bool:
+        return self._intents.emojis_and_stickers and self.cache_flags.stickers
+
     async def close(self) -> None:
         for voice in self.voice_clients:
             try:
@@ -326,6 +359,13 @@ class ConnectionState(Generic[ClientT]):
         for key in removed:
             del self._chunk_requests[key]
 
+    def _get_gateway_metrics(self, shard_id: Optional[int]) -> GatewayMetrics:
+        try:
+            return self._gateway_metrics[shard_id]
+        except KeyError:
+            metrics = self._gateway_metrics[shard_id] = GatewayMetrics(shard_id)
+            return metrics
+
     def clear_chunk_requests(self, shard_id: int | None) -> None:
         removed = []
         for key, request in self._chunk_requests.items():
@@ -526,14 +566,67 @@ class ConnectionState(Generic[ClientT]):
     def _get_message(self, msg_id: Optional[int]) -> Optional[Message]:
         return utils.find(lambda m: m.id == msg_id, reversed(self._messages)) if self._messages else None
 
-    def _add_guild_from_data(self, data: GuildPayload) -> Guild:
-        guild = Guild(data=data, state=self)
+    def _add_guild_from_data(self, data: GuildPayload, *, cache_level: GuildCacheLevel = GuildCacheLevel.full) -> Guild:
+        guild = Guild(data=data, state=self, cache_level=cache_level)
         self._add_guild(guild)
         return guild
 
+    def _get_guild_cache_level(self, guild_id: int, data: GuildPayload) -> GuildCacheLevel:
+        policy = self.guild_cache_policy
+        if policy is None:
+            return GuildCacheLevel.full
+
+        try:
+            level = policy(guild_id, data)
+        except Exception:
+            _log.exception('Guild cache policy raised for guild ID %s, falling back to a full cache.', guild_id)
+            return GuildCacheLevel.full
+
+        if not isinstance(level, GuildCacheLevel):
+            _log.warning('Guild cache policy returned %r for guild ID %s, falling back to a full cache.', level, guild_id)
+            return GuildCacheLevel.full
+        return level
+
+    def _demote_guild(self, guild: Guild) -> None:
+        for emoji in guild.emojis:
+            self._emojis.pop(emoji.id, None)
+
+        for sticker in guild.stickers:
+            self._stickers.pop(sticker.id, None)
+
+        guild._cache_level = GuildCacheLevel.minimal
+        guild._clear_cached_state()
+
+    async def set_guild_cache_level(self, guild: Guild, level: GuildCacheLevel) -> None:
+        if guild._cache_level is level:
+            return
+
+        if level is GuildCacheLevel.minimal:
+            self._demote_guild(guild)
+            return
+
+        # There's no way to ask the gateway for another GUILD_CREATE, so the
+        # state that a minimal guild dropped has to be rebuilt over HTTP instead
+        data: Dict[str, Any] = await self.http.get_guild(guild.id)  # type: ignore
+        data['channels'] = await self.http.get_all_guild_channels(guild.id)
+        data['threads'] = (await self.http.get_active_threads(guild.id))['threads']
+        data['guild_scheduled_events'] = await self.http.get_scheduled_events(guild.id, False)
+        data['soundboard_sounds'] = (await self.http.get_soundboard_sounds(guild.id))['items']
+
+        guild._cache_level = level
+        guild._from_data(data)  # type: ignore
+
+        if self._guild_needs_chunking(guild):
+            await self.chunk_guild(guild)
+
     def _guild_needs_chunking(self, guild: Guild) -> bool:
         # If presences are enabled then we get back the old guild.large behaviour
-        return self._chunk_guilds and not guild.chunked and not (self._intents.presences and not guild.large)
+        return (
+            self._chunk_guilds
+            and guild._cache_level is GuildCacheLevel.full
+            and not guild.chunked
+            and not (self._intents.presences and not guild.large)
+        )
 
     def _get_guild_channel(
         self, data: PartialMessagePayload, guild_id: Optional[int] = None
@@ -1168,8 +1261,11 @@ class ConnectionState(Generic[ClientT]):
         for emoji in before_emojis:
             self._emojis.pop(emoji.id, None)
         # guild won't be None here
-        guild.emojis = tuple(map(lambda d: self.store_emoji(guild, d), data['emojis']))
-        self.dispatch('guild_emojis_update', guild, before_emojis, guild.emojis)
+        if guild._cache_level is GuildCacheLevel.full and self.cache_flags.emojis:
+            guild.emojis = after_emojis = tuple(map(lambda d: self.store_emoji(guild, d), data['emojis']))
+        else:
+            after_emojis = tuple(Emoji(guild=guild, state=self, data=d) for d in data['emojis'])
+        self.dispatch('guild_emojis_update', guild, before_emojis, after_emojis)
 
     def parse_guild_stickers_update(self, data: gw.GuildStickersUpdateEvent) -> None:
         guild = self._get_guild(int(data['guild_id']))
@@ -1181,8 +1277,11 @@ class ConnectionState(Generic[ClientT]):
         for emoji in before_stickers:
             self._stickers.pop(emoji.id, None)
 
-        guild.stickers = tuple(map(lambda d: self.store_sticker(guild, d), data['stickers']))
-        self.dispatch('guild_stickers_update', guild, before_stickers, guild.stickers)
+        if guild._cache_level is GuildCacheLevel.full and self.cache_flags.stickers:
+            guild.stickers = after_stickers = tuple(map(lambda d: self.store_sticker(guild, d), data['stickers']))
+        else:
+            after_stickers = tuple(GuildSticker(state=self, data=d) for d in data['stickers'])
+        self.dispatch('guild_stickers_update', guild, before_stickers, after_stickers)
 
     def parse_guild_audit_log_entry_create(self, data: gw.GuildAuditLogEntryCreate) -> None:
         guild = self._get_guild(int(data['guild_id']))
@@ -1243,17 +1342,23 @@ class ConnectionState(Generic[ClientT]):
         self.dispatch('automod_action', execution)
 
     def _get_create_guild(self, data: gw.GuildCreateEvent) -> Guild:
+        guild_id = int(data['id'])
+        cache_level = self._get_guild_cache_level(guild_id, data)
         if data.get('unavailable') is False:
             # GUILD_CREATE with unavailable in the response
             # usually means that the guild has become available
             # and is therefore in the cache
-            guild = self._get_guild(int(data['id']))
+            guild = self._get_guild(guild_id)
             if guild is not None:
                 guild.unavailable = False
+                if cache_level is GuildCacheLevel.minimal:
+                    self._demote_guild(guild)
+                else:
+                    guild._cache_level = cache_level
                 guild._from_data(data)
                 return guild
 
-        return self._add_guild_from_data(data)
+        return self._add_guild_from_data(data, cache_level=cache_level)
 
     def is_guild_evicted(self, guild: Guild) -> bool:
         return guild.id not in self._guilds
@@ -1498,7 +1603,7 @@ class ConnectionState(Generic[ClientT]):
         guild = self._get_guild(int(data['guild_id']))
         if guild is not None:
             stage_instance = StageInstance(guild=guild, state=self, data=data)
-            guild._stage_instances[stage_instance.id] = stage_instance
+            guild._add_stage_instance(stage_instance)
             self.dispatch('stage_instance_create', stage_instance)
         else:
             _log.debug('STAGE_INSTANCE_CREATE referencing unknown guild ID: %s. Discarding.', data['guild_id'])
@@ -1532,7 +1637,7 @@ class ConnectionState(Generic[ClientT]):
         guild = self._get_guild(int(data['guild_id']))
         if guild is not None:
             scheduled_event = ScheduledEvent(state=self, data=data)
-            guild._scheduled_events[scheduled_event.id] = scheduled_event
+            guild._add_scheduled_event(scheduled_event)
             self.dispatch('scheduled_event_create', scheduled_event)
         else:
             _log.debug('SCHEDULED_EVENT_CREATE referencing unknown guild ID: %s. Discarding.', data['guild_id'])
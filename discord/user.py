@@ -24,6 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import sys
 from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
 
 import discord.abc
@@ -31,7 +32,15 @@ from .asset import Asset
 from .colour import Colour
 from .enums import DefaultAvatar
 from .flags import PublicUserFlags
-from .utils import snowflake_time, _bytes_to_base64_data, MISSING, _get_as_snowflake
+from .utils import (
+    snowflake_time,
+    _bytes_to_base64_data,
+    MISSING,
+    _get_as_snowflake,
+    _intern_avatar_decoration,
+    _intern_int,
+    _intern_str,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -114,15 +123,15 @@ class BaseUser(_UserTag):
     def _update(self, data: Union[UserPayload, PartialUserPayload]) -> None:
         self.name = data['username']
         self.id = int(data['id'])
-        self.discriminator = data['discriminator']
+        self.discriminator = sys.intern(data['discriminator'])
         self.global_name = data.get('global_name')
         self._avatar = data['avatar']
         self._banner = data.get('banner', None)
         self._accent_colour = data.get('accent_color', None)
-        self._public_flags = data.get('public_flags', 0)
+        self._public_flags = _intern_int(data.get('public_flags', 0))
         self.bot = data.get('bot', False)
         self.system = data.get('system', False)
-        self._avatar_decoration_data = data.get('avatar_decoration_data')
+        self._avatar_decoration_data = _intern_avatar_decoration(data.get('avatar_decoration_data'))
 
     @classmethod
     def _copy(cls, user: Self) -> Self:
@@ -394,7 +403,7 @@ class ClientUser(BaseUser):
         super()._update(data)
         # There's actually an Optional[str] phone field as well but I won't use it
         self.verified = data.get('verified', False)
-        self.locale = data.get('locale')
+        self.locale = _intern_str(data.get('locale'))
         self._flags = data.get('flags', 0)
         self.mfa_enabled = data.get('mfa_enabled', False)
 
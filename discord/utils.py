@@ -621,6 +621,70 @@ def _get_as_snowflake(data: Any, key: str) -> Optional[int]:
         return value and int(value)
 
 
+# Canonical instances of values that repeat a lot across cached models, such as
+# permission bitfields or role colours. Ints above 256 aren't cached by CPython so
+# every payload would otherwise get its own copy. These are capped so that a
+# stream of unique values can't grow them without bound.
+_INTERN_LIMIT = 65536
+_interned_ints: Dict[int, int] = {}
+# Strings are kept here rather than passed to sys.intern, which never frees them on
+# newer Python versions, since some such as role names are chosen by users.
+_interned_strs: Dict[str, str] = {}
+_interned_decorations: Dict[Tuple[Any, ...], Any] = {}
+
+
+def _intern_int(value: int) -> int:
+    try:
+        return _interned_ints[value]
+    except KeyError:
+        if len(_interned_ints) < _INTERN_LIMIT:
+            _interned_ints[value] = value
+        return value
+
+
+@overload
+def _intern_str(value: None) -> None:
+    ...
+
+
+@overload
+def _intern_str(value: str) -> str:
+    ...
+
+
+@overload
+def _intern_str(value: Optional[str]) -> Optional[str]:
+    ...
+
+
+def _intern_str(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+
+    try:
+        return _interned_strs[value]
+    except KeyError:
+        if len(_interned_strs) < _INTERN_LIMIT:
+            _interned_strs[value] = value
+        return value
+
+
+def _intern_avatar_decoration(data: Optional[Dict[str, Any]]) -> Any:
+    # Avatar decorations come from a fixed catalogue, so many users share the exact same payload
+    if data is None:
+        return None
+
+    key = tuple(data.items())
+    try:
+        return _interned_decorations[key]
+    except KeyError:
+        if len(_interned_decorations) < _INTERN_LIMIT:
+            _interned_decorations[key] = data
+        return data
+    except TypeError:
+        return data
+
+
 def _get_mime_type_for_image(data: bytes):
     if data.startswith(b'\x89\x50\x4E\x47\x0D\x0A\x1A\x0A'):
         return 'image/png'
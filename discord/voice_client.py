@@ -27,12 +27,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import struct
+import time
 from typing import Any, Callable, List, Optional, TYPE_CHECKING, Tuple, Union
 
 from . import opus
 from .gateway import *
 from .errors import ClientException
+from .metrics import PlaybackStats
 from .player import AudioPlayer, AudioSource
+from .sinks import AudioReceiver, AudioSink
 from .utils import MISSING
 from .voice_state import VoiceConnectionState
 
@@ -43,6 +46,7 @@ if TYPE_CHECKING:
     from .state import ConnectionState
     from .user import ClientUser
     from .opus import Encoder, APPLICATION_CTL, BAND_CTL, SIGNAL_CTL
+    from .player import ScheduledAudioPlayer
     from .channel import StageChannel, VoiceChannel
     from . import abc
 
@@ -58,6 +62,7 @@ if TYPE_CHECKING:
 has_nacl: bool
 
 try:
+    import nacl.bindings  # type: ignore
     import nacl.secret  # type: ignore
     import nacl.utils  # type: ignore
 
@@ -73,6 +78,11 @@ __all__ = (
 
 _log = logging.getLogger(__name__)
 
+_RTP_HEADER = struct.Struct('>BBHII')
+_NONCE_PADDING = bytes(20)
+# Large enough for any opus frame plus RTP header, MAC and nonce.
+_PACKET_BUFFER_SIZE = 4096
+
 
 class VoiceProtocol:
     """A class that represents the Discord voice protocol.
@@ -228,10 +238,19 @@ class VoiceClient(VoiceProtocol):
 
         self.sequence: int = 0
         self.timestamp: int = 0
-        self._player: Optional[AudioPlayer] = None
+        self._player: Optional[Union[AudioPlayer, ScheduledAudioPlayer]] = None
+        self._receiver: Optional[AudioReceiver] = None
+        self._playback_stats: PlaybackStats = PlaybackStats()
         self.encoder: Encoder = MISSING
         self._incr_nonce: int = 0
 
+        # Per-connection encryption state, rebuilt whenever the mode or secret key changes
+        self._cipher_mode: Optional[SupportedModes] = None
+        self._cipher_secret_key: Optional[List[int]] = None
+        self._cipher_key: bytes = b''
+        self._encrypt_packet: Callable[[bytes, bytes], Union[bytes, memoryview]] = MISSING
+        self._packet_buffer: bytearray = bytearray(_PACKET_BUFFER_SIZE)
+
         self._connection: VoiceConnectionState = self.create_connection_state()
 
     warn_nacl: bool = not has_nacl
@@ -338,6 +357,7 @@ class VoiceClient(VoiceProtocol):
         Disconnects this voice client from voice.
         """
         self.stop()
+        self.stop_listening()
         await self._connection.disconnect(force=force, wait=True)
         self.cleanup()
 
@@ -368,58 +388,71 @@ class VoiceClient(VoiceProtocol):
 
     # audio related
 
+    def _update_cipher(self) -> None:
+        mode = self.mode
+        secret_key = self.secret_key
+        self._cipher_mode = mode
+        self._cipher_secret_key = secret_key
+        self._cipher_key = bytes(secret_key)
+        self._encrypt_packet = getattr(self, '_encrypt_' + mode)
+
+    def _write_packet(self, *parts: bytes) -> Union[bytes, memoryview]:
+        # Assembles the packet into the reused buffer, the returned view is only
+        # valid until the next packet is written.
+        buffer = self._packet_buffer
+        if sum(map(len, parts)) > len(buffer):
+            return b''.join(parts)
+
+        offset = 0
+        for part in parts:
+            end = offset + len(part)
+            buffer[offset:end] = part
+            offset = end
+
+        return memoryview(buffer)[:offset]
+
+    def _next_nonce(self) -> bytes:
+        nonce = self._incr_nonce
+        self._incr_nonce = 0 if nonce >= 4294967295 else nonce + 1
+        return nonce.to_bytes(4, 'big')
+
     def _get_voice_packet(self, data):
-        header = bytearray(12)
+        if self._cipher_secret_key is not self.secret_key or self._cipher_mode != self.mode:
+            self._update_cipher()
 
         # Formulate rtp header
-        header[0] = 0x80
-        header[1] = 0x78
-        struct.pack_into('>H', header, 2, self.sequence)
-        struct.pack_into('>I', header, 4, self.timestamp)
-        struct.pack_into('>I', header, 8, self.ssrc)
+        header = _RTP_HEADER.pack(0x80, 0x78, self.sequence, self.timestamp, self.ssrc)
+        return self._encrypt_packet(header, bytes(data))
 
-        encrypt_packet = getattr(self, '_encrypt_' + self.mode)
-        return encrypt_packet(header, data)
-
-    def _encrypt_aead_xchacha20_poly1305_rtpsize(self, header: bytes, data) -> bytes:
+    def _encrypt_aead_xchacha20_poly1305_rtpsize(self, header: bytes, data) -> Union[bytes, memoryview]:
         # Esentially the same as _lite
         # Uses an incrementing 32-bit integer which is appended to the payload
         # The only other difference is we require AEAD with Additional Authenticated Data (the header)
-        box = nacl.secret.Aead(bytes(self.secret_key))
-        nonce = bytearray(24)
-
-        nonce[:4] = struct.pack('>I', self._incr_nonce)
-        self.checked_add('_incr_nonce', 1, 4294967295)
-
-        return header + box.encrypt(bytes(data), bytes(header), bytes(nonce)).ciphertext + nonce[:4]
+        nonce = self._next_nonce()
+        ciphertext = nacl.bindings.crypto_aead_xchacha20poly1305_ietf_encrypt(
+            data, header, nonce + _NONCE_PADDING, self._cipher_key
+        )
+        return self._write_packet(header, ciphertext, nonce)
 
-    def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> bytes:
+    def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> Union[bytes, memoryview]:
         # Deprecated. Removal: 18th Nov 2024. See:
         # https://discord.com/developers/docs/topics/voice-connections#transport-encryption-modes
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-        nonce[:12] = header
-
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext
+        ciphertext = nacl.bindings.crypto_secretbox(data, header + _NONCE_PADDING[:12], self._cipher_key)
+        return self._write_packet(header, ciphertext)
 
-    def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> bytes:
+    def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> Union[bytes, memoryview]:
         # Deprecated. Removal: 18th Nov 2024. See:
         # https://discord.com/developers/docs/topics/voice-connections#transport-encryption-modes
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
         nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)
+        ciphertext = nacl.bindings.crypto_secretbox(data, nonce, self._cipher_key)
+        return self._write_packet(header, ciphertext, nonce)
 
-        return header + box.encrypt(bytes(data), nonce).ciphertext + nonce
-
-    def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> bytes:
+    def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> Union[bytes, memoryview]:
         # Deprecated. Removal: 18th Nov 2024. See:
         # https://discord.com/developers/docs/topics/voice-connections#transport-encryption-modes
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-
-        nonce[:4] = struct.pack('>I', self._incr_nonce)
-        self.checked_add('_incr_nonce', 1, 4294967295)
-
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext + nonce[:4]
+        nonce = self._next_nonce()
+        ciphertext = nacl.bindings.crypto_secretbox(data, nonce + _NONCE_PADDING, self._cipher_key)
+        return self._write_packet(header, ciphertext, nonce)
 
     def play(
         self,
@@ -432,6 +465,7 @@ class VoiceClient(VoiceProtocol):
         expected_packet_loss: float = 0.15,
         bandwidth: BAND_CTL = 'full',
         signal_type: SIGNAL_CTL = 'auto',
+        lookahead: int = 0,
     ) -> None:
         """Plays an :class:`AudioSource`.
 
@@ -451,6 +485,10 @@ class VoiceClient(VoiceProtocol):
         .. versionchanged:: 2.4
             Added encoder parameters as keyword arguments.
 
+        .. versionchanged:: 2.6
+            Added the ``lookahead`` parameter. Statistics about the playback are
+            available through :attr:`playback_stats`.
+
         Parameters
         -----------
         source: :class:`AudioSource`
@@ -480,6 +518,11 @@ class VoiceClient(VoiceProtocol):
             Configures the type of signal being encoded.  Can be one of:
             ``'auto'``, ``'voice'``, ``'music'``.
             Defaults to ``'auto'``.
+        lookahead: :class:`int`
+            The number of frames to read from the source ahead of when they are due.
+            When set, the source is read on a separate thread, so a slow read doesn't
+            delay the frame being sent. Defaults to ``0``.
+            Ignored when an :class:`AudioScheduler` is used.
 
         Raises
         -------
@@ -502,6 +545,9 @@ class VoiceClient(VoiceProtocol):
         if not isinstance(source, AudioSource):
             raise TypeError(f'source must be an AudioSource not {source.__class__.__name__}')
 
+        if lookahead < 0:
+            raise ValueError('lookahead cannot be negative')
+
         if not source.is_opus():
             self.encoder = opus.Encoder(
                 application=application,
@@ -512,7 +558,12 @@ class VoiceClient(VoiceProtocol):
                 signal_type=signal_type,
             )
 
-        self._player = AudioPlayer(source, self, after=after)
+        self._playback_stats = PlaybackStats()
+        scheduler = self._state.audio_scheduler
+        if scheduler is not None:
+            self._player = scheduler._create_player(source, self, after=after)
+        else:
+            self._player = AudioPlayer(source, self, after=after, lookahead=lookahead)
         self._player.start()
 
     def is_playing(self) -> bool:
@@ -539,6 +590,62 @@ class VoiceClient(VoiceProtocol):
         if self._player:
             self._player.resume()
 
+    @property
+    def position(self) -> Optional[float]:
+        """Optional[:class:`float`]: The position in seconds of the audio being played, if playing.
+
+        For a :class:`SeekableAudioSource` this is the position reported by the source,
+        otherwise it is the time played since the source started playing.
+
+        .. versionadded:: 2.6
+        """
+        return self._player.position if self._player else None
+
+    @property
+    def playback_stats(self) -> PlaybackStats:
+        """:class:`PlaybackStats`: Timing statistics for the audio being played,
+        or the audio played last if nothing is playing.
+
+        .. versionadded:: 2.6
+        """
+        return self._playback_stats
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Optional[:class:`float`]: The duration in seconds of the audio being played,
+        if playing and the source knows its duration.
+
+        .. versionadded:: 2.6
+        """
+        return self._player.duration if self._player else None
+
+    def seek(self, position: float) -> None:
+        """Moves the audio being played to a position.
+
+        The source being played must be a :class:`SeekableAudioSource`, optionally
+        wrapped in a :class:`PCMVolumeTransformer`.
+
+        .. versionadded:: 2.6
+
+        Parameters
+        -----------
+        position: :class:`float`
+            The position in seconds to continue playing from.
+
+        Raises
+        -------
+        ValueError
+            Not playing anything, or the position is negative.
+        TypeError
+            The source being played does not support seeking.
+        ClientException
+            The source could not be seeked, such as audio piped to ffmpeg.
+        """
+        if self._player is None:
+            raise ValueError('Not playing anything.')
+
+        self._player.seek(position)
+
     @property
     def source(self) -> Optional[AudioSource]:
         """Optional[:class:`AudioSource`]: The audio source being played, if playing.
@@ -557,6 +664,84 @@ class VoiceClient(VoiceProtocol):
 
         self._player.set_source(value)
 
+    def listen(
+        self,
+        sink: AudioSink,
+        *,
+        after: Optional[Callable[[Optional[Exception]], Any]] = None,
+        workers: int = 1,
+        jitter_depth: int = 3,
+    ) -> None:
+        """Starts receiving audio from the voice channel into an :class:`AudioSink`.
+
+        Received packets are decrypted, reordered and decoded in worker threads,
+        with every user's audio handed to the sink 20ms at a time. Lost frames
+        are recovered using Opus forward error correction when possible, and
+        concealed otherwise.
+
+        The finalizer, ``after`` is called once listening has stopped, either
+        through :meth:`stop_listening` or because the sink raised an error.
+
+        .. versionadded:: 2.6
+
+        Parameters
+        -----------
+        sink: :class:`AudioSink`
+            The sink to write the received audio to.
+        after: Callable[[Optional[:class:`Exception`]], Any]
+            The finalizer that is called after listening has stopped.
+            This function must have a single parameter, ``error``, that
+            denotes an optional exception that was raised while receiving.
+        workers: :class:`int`
+            The number of decoding threads to spread users across. Defaults to ``1``.
+        jitter_depth: :class:`int`
+            How many packets to buffer per user before treating a missing
+            packet as lost. Higher values tolerate more reordering at the
+            cost of latency. Defaults to ``3``.
+
+        Raises
+        -------
+        ClientException
+            Already listening or not connected.
+        TypeError
+            Sink is not a :class:`AudioSink` or after is not a callable.
+        OpusNotLoaded
+            Sink does not want Opus and opus is not loaded.
+        """
+
+        if not self.is_connected():
+            raise ClientException('Not connected to voice.')
+
+        if self.is_listening():
+            raise ClientException('Already listening.')
+
+        if not isinstance(sink, AudioSink):
+            raise TypeError(f'sink must be an AudioSink not {sink.__class__.__name__}')
+
+        if not sink.wants_opus():
+            opus._OpusStruct.get_opus_version()  # lazy loads the opus library
+
+        self._receiver = AudioReceiver(sink, self, after=after, workers=workers, jitter_depth=jitter_depth)
+        self._receiver.start()
+
+    def is_listening(self) -> bool:
+        """Indicates if we're currently receiving audio."""
+        return self._receiver is not None and self._receiver.is_listening()
+
+    def stop_listening(self) -> None:
+        """Stops receiving audio."""
+        if self._receiver:
+            self._receiver.stop()
+            self._receiver = None
+
+    @property
+    def sink(self) -> Optional[AudioSink]:
+        """Optional[:class:`AudioSink`]: The audio sink being written to, if listening.
+
+        .. versionadded:: 2.6
+        """
+        return self._receiver.sink if self._receiver else None
+
     def send_audio_packet(self, data: bytes, *, encode: bool = True) -> None:
         """Sends an audio packet composed of the data.
 
@@ -577,15 +762,34 @@ class VoiceClient(VoiceProtocol):
             Encoding the data failed.
         """
 
-        self.checked_add('sequence', 1, 65535)
+        self._send_prepared_audio_packet(self._prepare_audio_packet(data, encode=encode))
+
+    def _prepare_audio_packet(self, data: bytes, *, encode: bool) -> Union[bytes, memoryview]:
+        # Split from the actual send so the audio scheduler can encode and encrypt
+        # every player's frame for a tick before flushing them to the sockets.
+        sequence = self.sequence
+        self.sequence = 0 if sequence >= 65535 else sequence + 1
+        stats = self._playback_stats
         if encode:
+            start = time.perf_counter()
             encoded_data = self.encoder.encode(data, self.encoder.SAMPLES_PER_FRAME)
+            encoded = time.perf_counter()
+            stats.encode_time += encoded - start
         else:
             encoded_data = data
+            encoded = time.perf_counter()
         packet = self._get_voice_packet(encoded_data)
+        stats.encrypt_time += time.perf_counter() - encoded
+
+        timestamp = self.timestamp + opus.Encoder.SAMPLES_PER_FRAME
+        self.timestamp = 0 if timestamp > 4294967295 else timestamp
+        return packet
+
+    def _send_prepared_audio_packet(self, packet: Union[bytes, memoryview]) -> None:
+        stats = self._playback_stats
+        stats.packets_sent += 1
         try:
             self._connection.send_packet(packet)
         except OSError:
+            stats.dropped_packets += 1
             _log.debug('A packet has been dropped (seq: %s, timestamp: %s)', self.sequence, self.timestamp)
-
-        self.checked_add('timestamp', opus.Encoder.SAMPLES_PER_FRAME, 4294967295)
@@ -45,7 +45,7 @@ import asyncio
 import logging
 import threading
 
-from typing import TYPE_CHECKING, Optional, Dict, List, Callable, Coroutine, Any, Tuple
+from typing import TYPE_CHECKING, Optional, Dict, List, Callable, Coroutine, Any, Tuple, Union
 
 from .enums import Enum
 from .utils import MISSING, sane_wait_for
@@ -205,6 +205,8 @@ class VoiceConnectionState:
         self.voice_port: Optional[int] = None
         self.secret_key: List[int] = MISSING
         self.ssrc: int = MISSING
+        # Maps the SSRC of other users in the channel to their user ID, from speaking events
+        self.ssrc_map: Dict[int, int] = {}
         self.mode: SupportedModes = MISSING
         self.socket: socket.socket = MISSING
         self.ws: DiscordVoiceWebSocket = MISSING
@@ -453,6 +455,7 @@ class VoiceConnectionState:
             if cleanup:
                 self._socket_reader.stop()
                 self.voice_client.stop()
+                self.voice_client.stop_listening()
 
             # Flip the connected event to unlock any waiters
             self._connected.set()
@@ -535,7 +538,7 @@ class VoiceConnectionState:
     def is_connected(self) -> bool:
         return self.state is ConnectionFlowState.connected
 
-    def send_packet(self, packet: bytes) -> None:
+    def send_packet(self, packet: Union[bytes, memoryview]) -> None:
         self.socket.sendall(packet)
 
     def add_socket_listener(self, callback: SocketReaderCallback) -> None:
@@ -0,0 +1,218 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import gc
+import weakref
+from types import SimpleNamespace
+from typing import Literal, Optional, Union
+
+import discord
+import pytest
+
+from discord.ext import commands
+from discord.ext.commands.view import StringView
+
+
+class Flags(commands.FlagConverter):
+    name: str
+    count: int = 1
+    tags: tuple[str, ...] = ()
+
+
+def make_context(content, bot=None):
+    message = SimpleNamespace(content=content, attachments=[], _state=None)
+    return commands.Context(prefix='!', view=StringView(content), bot=bot, message=message)
+
+
+async def parse(command, content):
+    ctx = make_context(content)
+    await command._parse_arguments(ctx)
+    return ctx.args[1:], ctx.kwargs
+
+
+@pytest.mark.asyncio
+async def test_parse_positional_and_rest():
+    @commands.command()
+    async def cmd(ctx, a: int, b: float, c: bool, d: Optional[int] = None, *, rest: str = 'none'):
+        pass
+
+    assert await parse(cmd, '1 2.5 yes') == ([1, 2.5, True, None], {'rest': 'none'})
+    assert await parse(cmd, '1 2.5 off hello there') == ([1, 2.5, False, None], {'rest': 'hello there'})
+    assert await parse(cmd, '1 2.5 off 4 x') == ([1, 2.5, False, 4], {'rest': 'x'})
+
+    with pytest.raises(commands.BadArgument, match='Converting to "int" failed for parameter "a"'):
+        await parse(cmd, 'one 2 yes')
+    with pytest.raises(commands.BadBoolArgument):
+        await parse(cmd, '1 2 maybe')
+    with pytest.raises(commands.MissingRequiredArgument):
+        await parse(cmd, '1 2')
+
+
+@pytest.mark.asyncio
+async def test_parse_union_order_and_literal():
+    @commands.command()
+    async def first(ctx, value: Union[int, str]):
+        pass
+
+    @commands.command()
+    async def second(ctx, value: Union[str, int]):
+        pass
+
+    @commands.command()
+    async def choice(ctx, value: Literal['a', 1, 'b']):
+        pass
+
+    assert await parse(first, '5') == ([5], {})
+    # Union[int, str] == Union[str, int], make sure they aren't mixed up
+    assert await parse(second, '5') == (['5'], {})
+    assert await parse(choice, '1') == ([1], {})
+    assert await parse(choice, 'b') == (['b'], {})
+    with pytest.raises(commands.BadLiteralArgument):
+        await parse(choice, 'c')
+
+
+@pytest.mark.asyncio
+async def test_parse_greedy_and_flags():
+    @commands.command()
+    async def greedy(ctx, numbers: commands.Greedy[int], word: str, *rest: int):
+        pass
+
+    @commands.command()
+    async def flags(ctx, target: int, *, flags: Flags):
+        pass
+
+    assert await parse(greedy, '1 2 3 x 4 5') == ([[1, 2, 3], 'x', 4, 5], {})
+    args, kwargs = await parse(flags, '10 name: foo tags: a b "c d"')
+    assert args == [10]
+    assert (kwargs['flags'].name, kwargs['flags'].count, kwargs['flags'].tags) == ('foo', 1, ('a', 'b', 'c d'))
+
+
+@pytest.mark.asyncio
+async def test_parse_plan_follows_params_and_transform_overrides():
+    @commands.command()
+    async def cmd(ctx, value: int):
+        pass
+
+    assert await parse(cmd, '5') == ([5], {})
+    cmd.params = {'value': cmd.params['value'].replace(annotation=str)}
+    assert await parse(cmd, '5') == (['5'], {})
+
+    class UpperCommand(commands.Command):
+        async def transform(self, ctx, param, attachments, /):
+            return (await super().transform(ctx, param, attachments)).upper()
+
+    @commands.command(cls=UpperCommand)
+    async def upper(ctx, value: str):
+        pass
+
+    assert await parse(upper, 'abc') == (['ABC'], {})
+
+
+@pytest.mark.asyncio
+async def test_converters_compiled_once():
+    @commands.command()
+    async def cmd(ctx, a: int, b: Union[int, str], c: commands.Range[int, 1, 10], d: Optional[int] = None):
+        pass
+
+    await parse(cmd, '1 x 5')
+    plans = dict(cmd._parameter_plans)
+    assert await parse(cmd, '2 3 6 4') == ([2, 3, 6, 4], {})
+    # Plans and their conversions are reused across invocations
+    assert all(cmd._parameter_plans[name] is plan for name, plan in plans.items())
+
+    # Converter classes, e.g. from an extension that was reloaded, aren't kept alive once used
+    class Shout(commands.Converter):
+        async def convert(self, ctx, argument):
+            return argument.upper()
+
+    assert await commands.run_converters(make_context('hi'), Shout, 'hi', cmd.params['a']) == 'HI'
+    ref = weakref.ref(Shout)
+    del Shout
+    gc.collect()
+    assert ref() is None
+
+
+class FakeGuild:
+    id = 1
+    shard_id = 0
+
+    def __init__(self, members):
+        self.members = members
+        self.queries = []
+        self._state = SimpleNamespace(member_cache_flags=SimpleNamespace(joined=False))
+
+    def get_member(self, user_id):
+        return None
+
+    async def query_members(self, query=None, *, limit=5, user_ids=None, cache=True):
+        self.queries.append(user_ids)
+        return [SimpleNamespace(id=user_id) for user_id in user_ids if user_id in self.members][:limit]
+
+
+def member_context(content, guild):
+    bot = SimpleNamespace(_get_websocket=lambda shard_id: SimpleNamespace(is_ratelimited=lambda: False))
+    message = SimpleNamespace(content=content, attachments=[], mentions=[], guild=guild, _state=None)
+    return commands.Context(prefix='!', view=StringView(content), bot=bot, message=message)
+
+
+@pytest.fixture
+def member_cache():
+    commands.MemberConverter._not_found.clear()
+    yield
+    commands.MemberConverter._not_found.clear()
+
+
+@pytest.mark.asyncio
+async def test_member_converter_batches_queries(member_cache):
+    first, second, missing, role = 111111111111111111, 222222222222222222, 333333333333333333, 444444444444444444
+    guild = FakeGuild({first, second})
+    # Only mentions and bare IDs are batched, not IDs in other mentions, emojis or links
+    content = f'!cmd <@{first}> {second} <@&{role}> <:blob:{role}> https://discord.com/channels/1/{role} {missing}'
+    ctx = member_context(content, guild)
+    converter = commands.MemberConverter()
+
+    assert (await converter.convert(ctx, f'<@{first}>')).id == first
+    assert (await converter.convert(ctx, str(second))).id == second
+    with pytest.raises(commands.MemberNotFound):
+        await converter.convert(ctx, str(missing))
+    assert guild.queries == [[first, second, missing]]
+
+    # Failed lookups aren't repeated for a while, even in later invocations
+    with pytest.raises(commands.MemberNotFound):
+        await converter.convert(member_context(f'!cmd {missing}', guild), str(missing))
+    assert len(guild.queries) == 1
+
+    commands.MemberConverter._not_found.clear()
+    assert (await converter.convert(member_context(f'!cmd {first}', guild), str(first))).id == first
+    assert guild.queries[1:] == [[first]]
+
+    # The part of the message that was already parsed isn't batched
+    content = f'!cmd {missing} {first} {second}'
+    ctx = member_context(content, guild)
+    ctx.view.index = content.index(str(first))
+    assert (await converter.convert(ctx, str(second))).id == second
+    assert guild.queries[2:] == [[second, first]]
@@ -0,0 +1,395 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from discord.ext import commands
+from discord.ext.commands.view import StringView, _PrefixTrie
+
+
+def make_bot(command_prefix, **options):
+    bot = commands.Bot(command_prefix=command_prefix, intents=discord.Intents.none(), help_command=None, **options)
+    bot._connection.user = SimpleNamespace(id=0)
+
+    @bot.command()
+    async def ping(ctx):
+        pass
+
+    return bot
+
+
+def make_message(content, guild_id=None, author_id=1):
+    guild = None if guild_id is None else SimpleNamespace(id=guild_id)
+    author = SimpleNamespace(id=author_id, bot=False)
+    return SimpleNamespace(content=content, guild=guild, author=author, _state=None)
+
+
+def find_prefix(prefixes, content):
+    # What get_context did before prefixes were compiled
+    view = StringView(content)
+    return discord.utils.find(view.skip_string, prefixes)
+
+
+def test_prefix_trie_matches_first_prefix_in_order():
+    rng = random.Random(0)
+    for _ in range(500):
+        prefixes = [''.join(rng.choice('ab!') for _ in range(rng.randint(0, 3))) for _ in range(rng.randint(1, 5))]
+        trie = _PrefixTrie(prefixes)
+        for _ in range(10):
+            content = ''.join(rng.choice('ab! ') for _ in range(rng.randint(0, 5)))
+            assert trie.match(content) == find_prefix(prefixes, content), (prefixes, content)
+
+
+@pytest.mark.asyncio
+async def test_get_context_with_many_prefixes():
+    bot = make_bot([f'{i}!' for i in range(300)] + ['!', '!!'])
+
+    ctx = await bot.get_context(make_message('250!ping hello'))
+    assert ctx.valid
+    assert ctx.prefix == '250!'
+    assert ctx.view.read_rest() == ' hello'
+
+    # Order wins over length, like before
+    ctx = await bot.get_context(make_message('!!ping'))
+    assert ctx.prefix == '!'
+    assert ctx.invoked_with == '!ping'
+
+    ctx = await bot.get_context(make_message('hello there'))
+    assert ctx.prefix is None
+    assert not ctx.valid
+
+    ctx = await bot.get_context(make_message('!ping', author_id=0))
+    assert ctx.prefix is None
+
+
+@pytest.mark.asyncio
+async def test_get_context_rejects_bad_prefixes():
+    bot = make_bot(['!', 1])
+    with pytest.raises(TypeError, match='contain only strings, not int'):
+        await bot.get_context(make_message('ping'))
+
+    bot = make_bot(['!', 1], cache_prefixes=True)
+    with pytest.raises(TypeError, match='contain only strings, not int'):
+        await bot.get_context(make_message('!ping'))
+
+    bot = make_bot(lambda bot, message: 1)
+    with pytest.raises(TypeError):
+        await bot.get_context(make_message('!ping'))
+
+
+@pytest.mark.asyncio
+async def test_prefix_cache():
+    prefixes = {1: ['?'], 2: ['$']}
+    calls = []
+
+    def get_prefix(bot, message):
+        calls.append(message.guild and message.guild.id)
+        return prefixes.get(message.guild and message.guild.id, ['!'])
+
+    bot = make_bot(get_prefix, cache_prefixes=True)
+    for _ in range(3):
+        assert (await bot.get_context(make_message('?ping', guild_id=1))).valid
+        assert (await bot.get_context(make_message('$ping', guild_id=2))).valid
+        assert (await bot.get_context(make_message('!ping'))).valid
+    assert calls == [1, 2, None]
+
+    prefixes[1] = ['%']
+    assert (await bot.get_context(make_message('?ping', guild_id=1))).valid
+    bot.invalidate_prefix(SimpleNamespace(id=1))
+    assert not (await bot.get_context(make_message('?ping', guild_id=1))).valid
+    assert (await bot.get_context(make_message('%ping', guild_id=1))).valid
+    assert calls == [1, 2, None, 1]
+
+    bot.command_prefix = lambda bot, message: '>'
+    assert (await bot.get_context(make_message('>ping', guild_id=2))).valid
+
+
+@pytest.mark.asyncio
+async def test_process_commands_skips_context_for_non_commands(monkeypatch):
+    bot = make_bot('!')
+    invoked = []
+
+    async def invoke(ctx):
+        invoked.append(ctx)
+
+    monkeypatch.setattr(bot, 'invoke', invoke)
+    monkeypatch.setattr(commands.Context, '__init__', None)
+    await bot.process_commands(make_message('hello there'))
+    assert invoked == []
+
+    monkeypatch.undo()
+    monkeypatch.setattr(bot, 'invoke', invoke)
+    await bot.process_commands(make_message('!ping now'))
+    await bot.process_commands(make_message('!pong'))
+    assert [ctx.invoked_with for ctx in invoked] == ['ping', 'pong']
+    assert invoked[0].command is bot.get_command('ping')
+    assert invoked[1].command is None
+
+
+class MyContext(commands.Context):
+    pass
+
+
+class MyBot(commands.Bot):
+    async def get_context(self, origin, /, *, cls=MyContext):
+        return await super().get_context(origin, cls=cls)
+
+
+@pytest.mark.asyncio
+async def test_process_commands_uses_overridden_get_context(monkeypatch):
+    bot = MyBot(command_prefix='!', intents=discord.Intents.none())
+    bot._connection.user = SimpleNamespace(id=0)
+    invoked = []
+
+    async def invoke(ctx):
+        invoked.append(ctx)
+
+    monkeypatch.setattr(bot, 'invoke', invoke)
+    await bot.process_commands(make_message('hello there'))
+    await bot.process_commands(make_message('!help'))
+    assert [type(ctx) for ctx in invoked] == [MyContext, MyContext]
+    assert invoked[1].command is bot.help_command._command_impl
+
+
+def write_extension(path, name, *, commands=(), body=''):
+    lines = ['from discord.ext import commands', '']
+    for command in commands:
+        lines += ['@commands.command()', f'async def {command}(ctx):', '    pass', '']
+    lines += [body, '', 'async def setup(bot):']
+    lines += [f'    bot.add_command({command})' for command in commands]
+    lines += ['    pass']
+    (path / f'{name}.py').write_text('\n'.join(lines))
+
+
+@pytest.mark.asyncio
+async def test_load_extensions(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    write_extension(tmp_path, 'ext_alpha', commands=['alpha'])
+    write_extension(tmp_path, 'ext_beta', commands=['beta'])
+    write_extension(tmp_path, 'ext_broken', body='raise RuntimeError("broken")')
+    write_extension(tmp_path, 'ext_gamma', commands=['gamma'])
+    bot = make_bot('!')
+
+    profiles = await bot.load_extensions(['ext_alpha', 'ext_beta'])
+    assert [profile.name for profile in profiles] == ['ext_alpha', 'ext_beta']
+    assert all(profile.import_time >= 0 and profile.setup_time >= 0 and not profile.lazy for profile in profiles)
+    assert set(bot.extensions) == set(bot.extension_profiles) == {'ext_alpha', 'ext_beta'}
+    assert bot.get_command('alpha') is not None and bot.get_command('beta') is not None
+
+    with pytest.raises(commands.ExtensionAlreadyLoaded):
+        await bot.load_extensions(['ext_gamma', 'ext_alpha'])
+    with pytest.raises(commands.ExtensionNotFound):
+        await bot.load_extensions(['ext_gamma', 'ext_missing'])
+    assert 'ext_gamma' not in bot.extensions
+
+    # The other extensions still load when one of them fails
+    with pytest.raises(commands.ExtensionFailed):
+        await bot.load_extensions(['ext_broken', 'ext_gamma'], import_in_threads=False)
+    assert 'ext_gamma' in bot.extensions and 'ext_broken' not in bot.extensions
+
+    await bot.unload_extension('ext_alpha')
+    assert 'ext_alpha' not in bot.extension_profiles
+    assert bot.get_command('alpha') is None
+
+
+@pytest.mark.asyncio
+async def test_lazy_extension(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    write_extension(tmp_path, 'ext_lazy', commands=['lazy', 'other'])
+    bot = make_bot('!')
+    invoked = []
+
+    async def invoke(ctx):
+        invoked.append(ctx)
+
+    monkeypatch.setattr(bot, 'invoke', invoke)
+    bot.add_lazy_extension('ext_lazy', commands=['lazy', 'other'])
+    assert bot.lazy_extensions == {'ext_lazy': ('lazy', 'other')}
+
+    await bot.process_commands(make_message('!ping'))
+    await bot.process_commands(make_message('!unknown'))
+    assert 'ext_lazy' not in bot.extensions
+
+    # Concurrent invocations load the extension only once
+    messages = [make_message('!lazy'), make_message('!other')]
+    await asyncio.gather(*(bot.process_commands(message) for message in messages))
+    assert 'ext_lazy' in bot.extensions
+    assert bot.extension_profiles['ext_lazy'].lazy
+    assert not bot.lazy_extensions
+    assert [ctx.command for ctx in invoked[2:]] == [bot.get_command('lazy'), bot.get_command('other')]
+
+    ctx = await bot.get_context(make_message('!lazy'))
+    assert ctx.command is bot.get_command('lazy')
+
+    await bot.unload_extension('ext_lazy')
+    bot.add_lazy_extension('ext_lazy', commands=['lazy'])
+    await bot.unload_extension('ext_lazy')
+    assert not bot.lazy_extensions
+    ctx = await bot.get_context(make_message('!lazy'))
+    assert ctx.command is None and 'ext_lazy' not in bot.extensions
+
+
+def get_command_by_walking(bot, name):
+    # What get_command did before the command index
+    names = name.split()
+    if not names:
+        return None
+    obj = bot.all_commands.get(names[0])
+    if not isinstance(obj, commands.GroupMixin):
+        return obj
+    for name in names[1:]:
+        try:
+            obj = obj.all_commands[name]
+        except (AttributeError, KeyError):
+            return None
+    return obj
+
+
+def walk_commands_recursively(group):
+    for command in group.commands:
+        yield command
+        if isinstance(command, commands.GroupMixin):
+            yield from walk_commands_recursively(command)
+
+
+def test_command_index():
+    bot = make_bot('!', case_insensitive=True)
+
+    @bot.group(aliases=['t'])
+    async def tag(ctx):
+        pass
+
+    @tag.command(aliases=['make'])
+    async def create(ctx):
+        pass
+
+    @tag.group(case_insensitive=True)
+    async def edit(ctx):
+        pass
+
+    @edit.command()
+    async def content(ctx):
+        pass
+
+    names = [
+        'ping',
+        'PING',
+        'tag create',
+        't make',
+        'TAG Make',
+        'tag  create',
+        'tag edit content',
+        't edit CONTENT',
+        'tag missing',
+        'ping extra',
+        'tag create extra',
+        'missing create',
+        ' ',
+    ]
+    for name in names:
+        assert bot.get_command(name) is get_command_by_walking(bot, name), name
+    assert set(bot.walk_commands()) == set(walk_commands_recursively(bot))
+    assert len(list(bot.walk_commands())) == 5
+
+    # The index follows commands added to and removed from nested groups
+    @edit.command()
+    async def title(ctx):
+        pass
+
+    assert bot.get_command('t edit title') is title
+    assert title in list(bot.walk_commands())
+    edit.remove_command('title')
+    assert bot.get_command('t edit title') is None
+    assert title not in list(bot.walk_commands())
+
+    tag.remove_command('make')
+    assert bot.get_command('tag make') is None
+    assert bot.get_command('tag create') is create
+
+    bot.remove_command('tag')
+    assert bot.get_command('t edit content') is None
+    assert list(bot.walk_commands()) == [bot.get_command('ping')]
+
+
+FLAKY_EXTENSION = '''
+import asyncio
+import threading
+from discord.ext import commands
+
+imported_in = threading.current_thread()
+
+@commands.command()
+async def flaky(ctx):
+    pass
+
+async def setup(bot):
+    await asyncio.sleep(bot.load_delay)
+    if bot.load_error is not None:
+        raise bot.load_error
+    bot.add_command(flaky)
+'''
+
+
+@pytest.mark.asyncio
+async def test_lazy_extension_retried_after_failed_load(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / 'ext_flaky.py').write_text(FLAKY_EXTENSION)
+    bot = make_bot('!')
+    bot.load_delay = 10
+    bot.load_error = None
+    bot.add_lazy_extension('ext_flaky', commands=['flaky'])
+
+    # Cancelling the invocation loading the extension hands the load over to the one waiting on it
+    loading = asyncio.create_task(bot.get_context(make_message('!flaky')))
+    await asyncio.sleep(0.05)
+    waiting = asyncio.create_task(bot.get_context(make_message('!flaky')))
+    await asyncio.sleep(0.05)
+    bot.load_delay = 0
+    bot.load_error = RuntimeError('broken')
+    loading.cancel()
+    with pytest.raises(commands.ExtensionFailed):
+        await asyncio.wait_for(waiting, timeout=1)
+    assert loading.cancelled()
+    assert bot.lazy_extensions == {'ext_flaky': ('flaky',)}
+
+    with pytest.raises(commands.ExtensionFailed):
+        await bot.get_context(make_message('!flaky'))
+    assert bot.lazy_extensions == {'ext_flaky': ('flaky',)}
+    assert 'ext_flaky' not in bot.extensions
+
+    bot.load_error = None
+    ctx = await bot.get_context(make_message('!flaky'))
+    assert ctx.command is bot.get_command('flaky') is not None
+    assert not bot.lazy_extensions
+    # The module isn't imported on the event loop
+    assert bot.extensions['ext_flaky'].imported_in is not threading.current_thread()
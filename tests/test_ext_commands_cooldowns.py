@@ -0,0 +1,297 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import datetime
+import heapq
+import multiprocessing
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from discord.ext import commands
+from discord.ext.commands import cooldowns
+
+
+def key(message):
+    return message
+
+
+def test_cooldown_mapping_expires_unused_buckets():
+    mapping = commands.CooldownMapping.from_cooldown(1, 10, key)
+
+    for user in range(5):
+        assert mapping.update_rate_limit(user, current=1000.0) is None
+    assert len(mapping._cache) == 5
+
+    # User 0 keeps using it, so their bucket outlives the others
+    assert mapping.update_rate_limit(0, current=1008.0) == pytest.approx(2.0)
+    mapping.get_bucket(99, current=1015.0)
+    assert sorted(mapping._cache) == [0, 99]
+
+    mapping.get_bucket(99, current=1019.0)
+    assert 0 not in mapping._cache
+    assert mapping.update_rate_limit(0, current=1019.0) is None
+
+
+def test_cooldown_mapping_copy_keeps_expiry():
+    mapping = commands.CooldownMapping.from_cooldown(1, 10, key)
+    mapping.update_rate_limit(1, current=1000.0)
+
+    copy = mapping.copy()
+    copy.get_bucket(2, current=1011.0)
+    assert list(copy._cache) == [2]
+    assert list(mapping._cache) == [1]
+
+
+def test_dynamic_cooldown_mapping_expiry():
+    def factory(message):
+        return commands.Cooldown(1, message)
+
+    mapping = commands.DynamicCooldownMapping(factory, key)
+    mapping.update_rate_limit(5, current=1000.0)
+    mapping.update_rate_limit(50, current=1000.0)
+
+    mapping.get_bucket(5, current=1010.0)
+    assert sorted(mapping._cache) == [5, 50]
+    mapping.get_bucket(5, current=1051.0)
+    assert list(mapping._cache) == [5]
+
+
+def test_cooldown_mapping_expiry_is_bounded(monkeypatch):
+    pops = []
+
+    def heappop(heap):
+        pops.append(heap[0][2])
+        return heapq.heappop(heap)
+
+    monkeypatch.setattr(cooldowns, 'heapq', SimpleNamespace(heappush=heapq.heappush, heappop=heappop))
+    mapping = commands.CooldownMapping.from_cooldown(1, 60, key)
+
+    # Using the same bucket again doesn't add expiry entries
+    for n in range(500):
+        mapping.update_rate_limit(0, current=1000.0 + n * 0.1)
+    assert len(mapping._expiry) == 1
+    assert not pops
+
+    for user in range(1, 1001):
+        mapping.update_rate_limit(user, current=1000.0)
+    for user in range(1001, 2001):
+        mapping.update_rate_limit(user, current=1050.0)
+    assert len(mapping._expiry) == len(mapping._cache) == 2001
+
+    # Only the entries that are due are looked at, user 0's is pushed back since it was used since
+    mapping.update_rate_limit(5000, current=1061.0)
+    assert sorted(pops) == list(range(1001))
+    assert 0 in mapping._cache and 1 not in mapping._cache
+    assert len(mapping._expiry) == len(mapping._cache) == 1002
+
+    pops.clear()
+    mapping.update_rate_limit(5001, current=1062.0)
+    assert not pops
+
+
+def dispatch_latency(active: int, samples: int = 2000) -> float:
+    mapping = commands.CooldownMapping.from_cooldown(1, 60, key)
+    now = 1000.0
+    for user in range(active):
+        mapping.update_rate_limit(user, current=now)
+
+    start = time.perf_counter()
+    for user in range(active, active + samples):
+        mapping.update_rate_limit(user, current=now + 1)
+    return (time.perf_counter() - start) / samples
+
+
+@pytest.mark.skipif(not os.environ.get('DISCORD_BENCHMARKS'), reason='set DISCORD_BENCHMARKS=1 to run benchmarks')
+def test_cooldown_mapping_dispatch_benchmark():
+    latencies = {active: dispatch_latency(active) for active in (100, 10_000, 200_000)}
+
+    # A full scan per lookup made this grow linearly, it should now be flat
+    assert latencies[200_000] < latencies[100] * 10
+
+
+@pytest.fixture(params=['memory', 'shared'])
+def backend(request, tmp_path):
+    if request.param == 'memory':
+        return commands.MemoryCooldownBackend()
+    if sys.platform == 'win32':
+        pytest.skip('requires a POSIX system')
+    return commands.SharedMemoryCooldownBackend(tmp_path / 'cooldowns', slots=64)
+
+
+def test_backend_matches_local_cooldown(backend):
+    local = commands.CooldownMapping.from_cooldown(2, 10, key)
+    shared = commands.CooldownMapping.from_cooldown(2, 10, key)
+
+    for current in (1000.0, 1001.0, 1002.0, 1009.0, 1011.0, 1012.0, 1013.0, 1030.0):
+        expected = local.get_bucket(1, current)
+        bucket = shared.get_bucket(1, current, backend=backend, namespace='ping')
+        assert bucket.get_tokens(current) == expected.get_tokens(current)
+        assert bucket.update_rate_limit(current) == expected.update_rate_limit(current)
+        assert bucket.get_retry_after(current) == expected.get_retry_after(current)
+
+    bucket.reset()
+    assert bucket.get_tokens(1030.0) == 2
+
+
+def test_backend_namespaces_are_separate(backend):
+    mapping = commands.CooldownMapping.from_cooldown(1, 10, key)
+    assert mapping.get_bucket(1, backend=backend, namespace='a').update_rate_limit(1000.0) is None
+    assert mapping.get_bucket(1, backend=backend, namespace='b').update_rate_limit(1000.0) is None
+    assert mapping.get_bucket(2, backend=backend, namespace='a').update_rate_limit(1000.0) is None
+    assert mapping.get_bucket(1, backend=backend, namespace='a').update_rate_limit(1001.0) == 9.0
+
+
+def test_backend_sweep(backend):
+    backend.update_rate_limit('ping', 1, 1, 10, 1000.0, 1)
+    backend.update_rate_limit('ping', 2, 1, 10, 1005.0, 1)
+    assert backend.sweep(1012.0) == 1
+    assert backend.get_window('ping', 1) is None
+    assert backend.get_window('ping', 2) == (1005.0, 0)
+
+
+def test_backend_concurrency(backend):
+    assert backend.acquire('ping', 1, 2)
+    assert backend.acquire('ping', 1, 2)
+    assert not backend.acquire('ping', 1, 2)
+    assert backend.acquire('ping', 2, 2)
+
+    backend.release('ping', 1)
+    assert backend.acquire('ping', 1, 2)
+    # Concurrency slots never expire
+    assert backend.sweep(time.time() + 1e6) == 0
+    assert not backend.acquire('ping', 1, 2)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='requires a POSIX system')
+def test_shared_memory_backend_is_shared(tmp_path):
+    first = commands.SharedMemoryCooldownBackend(tmp_path / 'cooldowns', slots=64)
+    second = commands.SharedMemoryCooldownBackend(tmp_path / 'cooldowns', slots=1024)
+    assert second.slots == 64
+
+    assert first.update_rate_limit('ping', 1, 1, 10, 1000.0, 1) is None
+    assert second.update_rate_limit('ping', 1, 1, 10, 1001.0, 1) == 9.0
+
+    assert first.acquire('ping', 1, 1)
+    assert not second.acquire('ping', 1, 1)
+    first.release('ping', 1)
+    assert second.acquire('ping', 1, 1)
+
+    second.clear()
+    assert first.get_window('ping', 1) is None
+    first.close()
+    second.close()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='requires a POSIX system')
+def test_shared_memory_backend_rejects_other_files(tmp_path):
+    path = tmp_path / 'other'
+    path.write_bytes(b'not a cooldown file')
+    with pytest.raises(ValueError):
+        commands.SharedMemoryCooldownBackend(path)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='requires a POSIX system')
+def test_shared_memory_backend_full_group_evicts_oldest(tmp_path):
+    backend = commands.SharedMemoryCooldownBackend(tmp_path / 'cooldowns', slots=8)
+    for user in range(8):
+        backend.update_rate_limit('ping', user, 1, 10 + user, 1000.0, 1)
+
+    assert backend.update_rate_limit('ping', 8, 1, 10, 1000.0, 1) is None
+    assert backend.get_window('ping', 0) is None
+    assert backend.get_window('ping', 7) == (1000.0, 0)
+
+
+def take_tokens(path, count, results):
+    backend = commands.SharedMemoryCooldownBackend(path)
+    allowed = 0
+    for _ in range(count):
+        if backend.update_rate_limit('ping', None, 50, 60, 1000.0, 1) is None:
+            allowed += 1
+    results.put(allowed)
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='requires fork')
+def test_shared_memory_backend_across_processes(tmp_path):
+    path = tmp_path / 'cooldowns'
+    commands.SharedMemoryCooldownBackend(path, slots=64).close()
+
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    processes = [context.Process(target=take_tokens, args=(path, 40, results)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    allowed = sum(results.get(timeout=30) for _ in processes)
+    for process in processes:
+        process.join()
+
+    # 160 attempts against a rate of 50, each token is only handed out once
+    assert allowed == 50
+
+
+def make_context(bot, author_id=1):
+    created_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    message = SimpleNamespace(
+        author=SimpleNamespace(id=author_id), channel=None, guild=None, created_at=created_at, edited_at=None
+    )
+    return SimpleNamespace(bot=bot, message=message, author=message.author, channel=None, guild=None)
+
+
+def make_command():
+    @commands.command()
+    @commands.cooldown(1, 10, commands.BucketType.user)
+    @commands.max_concurrency(1, commands.BucketType.user)
+    async def ping(ctx):
+        pass
+
+    return ping
+
+
+@pytest.mark.asyncio
+async def test_commands_share_backend():
+    bot = SimpleNamespace(cooldown_backend=commands.MemoryCooldownBackend())
+    # The same command loaded by two processes of one bot
+    first, second = make_command(), make_command()
+
+    first._prepare_cooldowns(make_context(bot))
+    assert second.is_on_cooldown(make_context(bot))
+    assert second.get_cooldown_retry_after(make_context(bot)) == pytest.approx(10.0)
+    assert not second.is_on_cooldown(make_context(bot, author_id=2))
+    with pytest.raises(commands.CommandOnCooldown):
+        second._prepare_cooldowns(make_context(bot))
+
+    second.reset_cooldown(make_context(bot))
+    assert not first.is_on_cooldown(make_context(bot))
+
+    await first._max_concurrency.acquire(make_context(bot), backend=bot.cooldown_backend, namespace='ping')
+    with pytest.raises(commands.MaxConcurrencyReached):
+        await second._max_concurrency.acquire(make_context(bot), backend=bot.cooldown_backend, namespace='ping')
+    await first._max_concurrency.release(make_context(bot), backend=bot.cooldown_backend, namespace='ping')
+    await second._max_concurrency.acquire(make_context(bot), backend=bot.cooldown_backend, namespace='ping')
@@ -0,0 +1,243 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from discord.ext import commands
+from discord.ext.commands.view import StringView
+
+
+def make_bot(**options):
+    bot = commands.Bot(command_prefix='!', intents=discord.Intents.none(), help_command=None, **options)
+    bot._connection.user = SimpleNamespace(id=0)
+    return bot
+
+
+def make_context(bot):
+    guild = SimpleNamespace(id=1, me=SimpleNamespace(id=0, display_name='bot'))
+    message = SimpleNamespace(content='!help', guild=guild, author=SimpleNamespace(id=1), attachments=[], _state=None)
+    return commands.Context(prefix='!', view=StringView('!help'), bot=bot, message=message)
+
+
+class Overlap:
+    # Tracks how many checks are waiting at the same time
+    def __init__(self):
+        self.running = 0
+        self.most = 0
+
+    async def wait(self):
+        self.running += 1
+        self.most = max(self.most, self.running)
+        try:
+            for _ in range(3):
+                await asyncio.sleep(0)
+        finally:
+            self.running -= 1
+
+
+def add_commands(bot, count, calls, overlap=None):
+    overlap = overlap or Overlap()
+
+    async def check(ctx):
+        calls.append(ctx.command.name)
+        await overlap.wait()
+        # ctx.command has to be the command being checked even with other checks running
+        return int(ctx.command.name[7:]) % 2 == 0
+
+    for i in range(count):
+
+        async def callback(ctx):
+            pass
+
+        command = commands.Command(callback, name=f'command{i}')
+        command.add_check(check)
+        bot.add_command(command)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('concurrent', [False, True])
+async def test_filter_commands(concurrent):
+    bot = make_bot(concurrent_checks=concurrent)
+    calls = []
+    add_commands(bot, 20, calls)
+    help_command = commands.DefaultHelpCommand()
+    help_command.context = make_context(bot)
+
+    filtered = await help_command.filter_commands(bot.commands, sort=True)
+    assert [c.name for c in filtered] == sorted(f'command{i}' for i in range(0, 20, 2))
+    assert help_command.context.command is None
+
+    # Checks already run for this context aren't run again
+    await help_command.filter_commands(bot.commands)
+    assert len(calls) == 20
+
+    help_command.context = make_context(bot)
+    await help_command.filter_commands(bot.commands)
+    assert len(calls) == 40
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_run_together():
+    bot = make_bot(concurrent_checks=True)
+    overlap = Overlap()
+    add_commands(bot, 50, [], overlap)
+    help_command = commands.DefaultHelpCommand()
+    help_command.context = make_context(bot)
+
+    await help_command.filter_commands(bot.commands)
+    assert overlap.most == 50
+
+    bot.concurrent_checks = False
+    overlap.most = 0
+    help_command.context = make_context(bot)
+    await help_command.filter_commands(bot.commands)
+    assert overlap.most == 1
+
+
+class Author:
+    def __init__(self, permissions):
+        self.id = 1
+        self.calls = 0
+        self._permissions = permissions
+
+    @property
+    def guild_permissions(self):
+        self.calls += 1
+        return self._permissions
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('allowed', [False, True])
+async def test_builtin_checks_are_memoized(allowed):
+    bot = make_bot(concurrent_checks=True)
+    for i in range(20):
+
+        async def callback(ctx):
+            pass
+
+        command = commands.Command(callback, name=f'command{i}')
+        command.add_check(commands.has_guild_permissions(manage_messages=True).predicate)
+        bot.add_command(command)
+
+    author = Author(discord.Permissions(manage_messages=allowed))
+    help_command = commands.DefaultHelpCommand()
+    help_command.context = ctx = make_context(bot)
+    ctx.message.author = author
+
+    filtered = await help_command.filter_commands(bot.commands)
+    assert len(filtered) == (20 if allowed else 0)
+    assert author.calls == 1
+
+    command = bot.get_command('command0')
+    for _ in range(2):
+        if allowed:
+            assert await command.can_run(ctx)
+        else:
+            with pytest.raises(commands.MissingPermissions):
+                await command.can_run(ctx)
+    assert author.calls == 1
+
+    # A copy invoking for another message doesn't reuse the results
+    other = copy.copy(ctx)
+    other.message = copy.copy(ctx.message)
+    other.message.author = Author(discord.Permissions(manage_messages=not allowed))
+    if allowed:
+        with pytest.raises(commands.MissingPermissions):
+            await command.can_run(other)
+    else:
+        assert await command.can_run(other)
+    assert other.message.author.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_global_checks():
+    bot = make_bot(concurrent_checks=True)
+    ctx = make_context(bot)
+    overlap = Overlap()
+
+    def make_check(result, delay=0):
+        async def check(ctx):
+            await overlap.wait()
+            await asyncio.sleep(delay)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return check
+
+    bot.add_check(make_check(True))
+    bot.add_check(make_check(True))
+    assert await bot.can_run(ctx)
+    assert overlap.most == 2
+
+    # The first check to fail in order decides, like when they run one after another
+    bot._checks[:] = [make_check(False, 0.02), make_check(commands.CheckFailure('second'), 0.01)]
+    assert not await bot.can_run(ctx)
+    bot._checks[:] = [make_check(commands.CheckFailure('first'), 0.02), make_check(commands.CheckFailure('second'), 0.01)]
+    with pytest.raises(commands.CheckFailure, match='first'):
+        await bot.can_run(ctx)
+
+
+def test_signature_cache():
+    @commands.command()
+    async def cmd(ctx, a: int, b: str = 'x'):
+        pass
+
+    assert cmd.signature == '<a> [b=x]'
+    assert cmd.signature is cmd.signature
+
+    cmd.params = {'a': cmd.params['a']}
+    assert cmd.signature == '<a>'
+
+    # Mutating params in place is noticed too
+    cmd.params['b'] = commands.parameter(default='y').replace(name='b', kind=cmd.params['a'].kind)
+    assert cmd.signature == '<a> [b=y]'
+    del cmd.params['b']
+    assert cmd.signature == '<a>'
+
+    cmd.usage = '<custom>'
+    assert cmd.signature == '<custom>'
+
+
+def test_paginator_pages():
+    paginator = commands.Paginator(max_size=40)
+    for i in range(6):
+        paginator.add_line(f'line number {i}')
+    paginator.add_line('last', empty=True)
+
+    assert paginator.pages == [
+        '```\nline number 0\nline number 1\n```',
+        '```\nline number 2\nline number 3\n```',
+        '```\nline number 4\nline number 5\nlast\n\n```',
+    ]
+    with pytest.raises(RuntimeError):
+        paginator.add_line('x' * 33)
@@ -0,0 +1,187 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import pytest
+
+import discord
+
+
+FAKE_PROBE = '''
+import json, os, sys, time
+log = os.environ['PROBE_LOG']
+with open(log, 'a') as fp:
+    fp.write(f'start {time.monotonic()}\\n')
+time.sleep(float(os.environ.get('PROBE_DELAY', '0')))
+with open(log, 'a') as fp:
+    fp.write(f'end {time.monotonic()}\\n')
+if 'broken' in sys.argv[-1]:
+    sys.exit(1)
+print(json.dumps({'streams': [{'codec_name': 'opus', 'bit_rate': '160000'}]}))
+'''
+
+
+@pytest.fixture
+def fake_probe(tmp_path, monkeypatch):
+    if sys.platform == 'win32':
+        pytest.skip('fake probe executable is a shell script')
+
+    script = tmp_path / 'fakeprobe'
+    script.write_text(f'#!{sys.executable}\n{FAKE_PROBE}')
+    script.chmod(0o755)
+    log = tmp_path / 'probe.log'
+    log.write_text('')
+    monkeypatch.setenv('PROBE_LOG', str(log))
+    return str(script), log
+
+
+def probe_count(log) -> int:
+    return log.read_text().count('start')
+
+
+@pytest.mark.asyncio
+async def test_prober_caches_results(fake_probe):
+    executable, log = fake_probe
+    prober = discord.FFmpegProber()
+
+    # The bitrate is clamped like the synchronous probe does
+    assert await prober.probe('song.webm', executable=executable) == ('opus', 512)
+    assert await prober.probe('song.webm', executable=executable) == ('opus', 512)
+    assert probe_count(log) == 1
+    assert 'song.webm' in prober
+
+    prober.invalidate('song.webm')
+    assert await discord.FFmpegOpusAudio.probe('song.webm', executable=executable, prober=prober) == ('opus', 512)
+    assert probe_count(log) == 2
+
+
+@pytest.mark.asyncio
+async def test_prober_deduplicates_concurrent_probes(fake_probe, monkeypatch):
+    executable, log = fake_probe
+    monkeypatch.setenv('PROBE_DELAY', '0.2')
+    prober = discord.FFmpegProber()
+
+    results = await asyncio.gather(*(prober.probe('song.webm', executable=executable) for _ in range(5)))
+    assert results == [('opus', 512)] * 5
+    assert probe_count(log) == 1
+
+
+@pytest.mark.asyncio
+async def test_prober_bounds_concurrency(fake_probe, monkeypatch):
+    executable, log = fake_probe
+    monkeypatch.setenv('PROBE_DELAY', '0.2')
+    prober = discord.FFmpegProber(max_concurrency=2)
+
+    await asyncio.gather(*(prober.probe(f'song{n}.webm', executable=executable) for n in range(6)))
+    assert len(prober) == 6
+
+    lines = [line.split() for line in log.read_text().splitlines()]
+    events = sorted((float(value), 1 if kind == 'start' else -1) for kind, value in lines)
+    running = peak = 0
+    for _, change in events:
+        running += change
+        peak = max(peak, running)
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_prober_ttl_and_failures(fake_probe):
+    executable, log = fake_probe
+    prober = discord.FFmpegProber(ttl=0.05)
+
+    await prober.probe('song.webm', executable=executable)
+    await asyncio.sleep(0.1)
+    assert prober.get('song.webm') is None
+    await prober.probe('song.webm', executable=executable)
+    assert probe_count(log) == 2
+
+    # A failing native probe falls back to ffmpeg, which doesn't exist here either
+    assert await prober.probe('broken.webm', executable=executable) == (None, None)
+    assert 'broken.webm' not in prober
+
+    prober = discord.FFmpegProber(max_size=2)
+    for n in range(3):
+        prober.set(f'song{n}.webm', 'opus', 128)
+    assert len(prober) == 2
+    assert prober.get('song0.webm') is None
+
+
+@pytest.mark.asyncio
+async def test_from_probe_skips_probing_known_codec(monkeypatch):
+    created = []
+
+    def record(self, source, **kwargs):
+        created.append((source, kwargs))
+
+    async def fail(*args, **kwargs):
+        raise AssertionError('should not probe')
+
+    monkeypatch.setattr(discord.FFmpegOpusAudio, '__init__', record)
+    monkeypatch.setattr(discord.FFmpegOpusAudio, 'probe', fail)
+    await discord.FFmpegOpusAudio.from_probe('song.webm', codec='opus', bitrate=160, before_options='-nostdin')
+    assert created == [('song.webm', {'bitrate': 160, 'codec': 'opus', 'before_options': '-nostdin'})]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_skips_fallback(fake_probe, monkeypatch):
+    executable, log = fake_probe
+    monkeypatch.setenv('PROBE_DELAY', '0.5')
+    prober = discord.FFmpegProber()
+
+    task = asyncio.create_task(prober.probe('song.webm', executable=executable))
+    while probe_count(log) == 0:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Cancelling doesn't start the ffmpeg fallback probe
+    await asyncio.sleep(0.7)
+    assert probe_count(log) == 1
+    assert 'song.webm' not in prober
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_hands_over_to_waiters(fake_probe, monkeypatch):
+    executable, log = fake_probe
+    monkeypatch.setenv('PROBE_DELAY', '0.2')
+    prober = discord.FFmpegProber()
+
+    first = asyncio.create_task(prober.probe('song.webm', executable=executable))
+    while probe_count(log) == 0:
+        await asyncio.sleep(0.01)
+    second = asyncio.create_task(prober.probe('song.webm', executable=executable))
+    third = asyncio.create_task(prober.probe('song.webm', executable=executable))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    # The other callers aren't cancelled with the first one, one of them probes again for both
+    assert await second == ('opus', 512)
+    assert await third == ('opus', 512)
+    assert first.cancelled()
+    assert probe_count(log) == 2
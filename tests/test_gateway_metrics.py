@@ -0,0 +1,89 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+import json
+import zlib
+
+import discord
+import pytest
+
+from discord.gateway import DiscordWebSocket, GatewayRatelimiter
+
+
+def make_websocket(metrics: discord.GatewayMetrics) -> DiscordWebSocket:
+    ws = DiscordWebSocket(None, loop=None, metrics=metrics)  # type: ignore
+    ws.shard_id = metrics.shard_id
+    ws._discord_parsers = {'MESSAGE_CREATE': lambda data: None}
+    return ws
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    discord.utils._ActiveDecompressionContext.COMPRESSION_TYPE != 'zlib-stream',
+    reason='requires zlib-stream compression',
+)
+async def test_received_message_records_metrics():
+    metrics = discord.GatewayMetrics(0)
+    ws = make_websocket(metrics)
+
+    payload = json.dumps({'op': 0, 't': 'MESSAGE_CREATE', 's': 1, 'd': {}})
+    await ws.received_message(payload)
+
+    compressor = zlib.compressobj()
+    compressed = compressor.compress(payload.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    await ws.received_message(compressed)
+
+    assert metrics.messages_received == 2
+    assert metrics.compressed_bytes == len(compressed)
+    assert metrics.uncompressed_bytes == len(payload) * 2
+    assert metrics.events['MESSAGE_CREATE'] == 2
+    assert metrics.average_parse_time('MESSAGE_CREATE') >= 0.0
+    assert metrics.average_parse_time('GUILD_CREATE') == 0.0
+
+    snapshot = metrics.to_dict()
+    assert snapshot['events'] == {'MESSAGE_CREATE': 2}
+
+    metrics.reset()
+    assert metrics.messages_received == 0
+    assert not metrics.events
+
+
+@pytest.mark.asyncio
+async def test_ratelimiter_records_queue_depth():
+    metrics = discord.GatewayMetrics()
+    limiter = GatewayRatelimiter(count=1, per=0.05)
+    limiter.metrics = metrics
+
+    await limiter.block()
+    task = asyncio.create_task(limiter.block())
+    await asyncio.sleep(0)
+    assert metrics.send_queue_depth == 1
+
+    await task
+    assert metrics.send_queue_depth == 0
+    assert metrics.ratelimit_wait_time > 0.0
@@ -0,0 +1,416 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import discord
+import pytest
+
+from discord.state import ConnectionState
+
+
+GUILD_ID = 1 << 40
+SELF_ID = 1 << 41
+
+
+def user_payload(user_id: int):
+    return {'id': str(user_id), 'username': f'user{user_id}', 'discriminator': '0', 'avatar': None}
+
+
+def member_payload(user_id: int):
+    return {
+        'user': user_payload(user_id),
+        'roles': [str(GUILD_ID + 1)],
+        'joined_at': '2020-01-01T00:00:00+00:00',
+        'deaf': False,
+        'mute': False,
+        'flags': 0,
+    }
+
+
+def role_payload(role_id: int, position: int):
+    return {
+        'id': str(role_id),
+        'name': f'role {position}',
+        'permissions': '104324673',
+        'position': position,
+        'color': 0,
+        'hoist': False,
+        'managed': False,
+        'mentionable': False,
+    }
+
+
+def channel_payload(channel_id: int, position: int):
+    return {
+        'id': str(channel_id),
+        'guild_id': str(GUILD_ID),
+        'type': 0,
+        'name': f'channel-{position}',
+        'position': position,
+        'bitrate': 64000,
+        'user_limit': 0,
+    }
+
+
+def emoji_payload(emoji_id: int):
+    return {'id': str(emoji_id), 'name': f'emoji{emoji_id}', 'animated': False, 'available': True}
+
+
+def thread_payload(thread_id: int):
+    return {
+        'id': str(thread_id),
+        'guild_id': str(GUILD_ID),
+        'parent_id': str(GUILD_ID + 100),
+        'owner_id': str(SELF_ID),
+        'name': 'thread',
+        'type': 11,
+        'member_count': 0,
+        'message_count': 0,
+        'thread_metadata': {
+            'archived': False,
+            'auto_archive_duration': 60,
+            'archive_timestamp': '2020-01-01T00:00:00+00:00',
+            'locked': False,
+        },
+    }
+
+
+def sticker_payload(sticker_id: int):
+    return {
+        'id': str(sticker_id),
+        'name': 'sticker',
+        'description': '',
+        'tags': 'tag',
+        'type': 2,
+        'format_type': 1,
+        'available': True,
+        'guild_id': str(GUILD_ID),
+    }
+
+
+def voice_state_payload(user_id: int):
+    return {
+        'guild_id': str(GUILD_ID),
+        'channel_id': str(GUILD_ID + 101),
+        'user_id': str(user_id),
+        'session_id': 'session',
+        'deaf': False,
+        'mute': False,
+        'self_deaf': False,
+        'self_mute': False,
+        'self_video': False,
+        'suppress': False,
+        'request_to_speak_timestamp': None,
+        'member': member_payload(user_id),
+    }
+
+
+def stage_instance_payload(stage_id: int):
+    return {
+        'id': str(stage_id),
+        'guild_id': str(GUILD_ID),
+        'channel_id': str(GUILD_ID + 102),
+        'topic': 'topic',
+        'privacy_level': 2,
+        'discoverable_disabled': False,
+        'guild_scheduled_event_id': None,
+    }
+
+
+def scheduled_event_payload(event_id: int):
+    return {
+        'id': str(event_id),
+        'guild_id': str(GUILD_ID),
+        'channel_id': None,
+        'creator_id': None,
+        'name': 'event',
+        'description': None,
+        'scheduled_start_time': '2030-01-01T00:00:00+00:00',
+        'scheduled_end_time': '2030-01-02T00:00:00+00:00',
+        'privacy_level': 2,
+        'status': 1,
+        'entity_type': 3,
+        'entity_id': None,
+        'entity_metadata': {'location': 'somewhere'},
+    }
+
+
+def soundboard_sound_payload(sound_id: int):
+    return {
+        'sound_id': str(sound_id),
+        'name': 'sound',
+        'volume': 1.0,
+        'emoji_id': None,
+        'emoji_name': None,
+        'guild_id': str(GUILD_ID),
+        'available': True,
+        'user': user_payload(SELF_ID),
+    }
+
+
+def guild_payload():
+    return {
+        'id': str(GUILD_ID),
+        'name': 'Test Guild',
+        'owner_id': str(SELF_ID),
+        'member_count': 3,
+        'roles': [role_payload(GUILD_ID, 0), role_payload(GUILD_ID + 1, 1)],
+        'channels': [channel_payload(GUILD_ID + 100 + i, i) for i in range(3)],
+        'members': [member_payload(SELF_ID), member_payload(1), member_payload(2)],
+        'emojis': [emoji_payload(GUILD_ID + 200)],
+        'stickers': [],
+        'threads': [],
+    }
+
+
+def full_guild_payload():
+    payload = guild_payload()
+    payload['channels'] += [
+        {**channel_payload(GUILD_ID + 110, 10), 'type': 2},
+        {**channel_payload(GUILD_ID + 111, 11), 'type': 13},
+        {**channel_payload(GUILD_ID + 112, 12), 'type': 4},
+        {**channel_payload(GUILD_ID + 113, 13), 'type': 15},
+    ]
+    payload['threads'] = [thread_payload(GUILD_ID + 300)]
+    payload['stickers'] = [sticker_payload(GUILD_ID + 400)]
+    payload['voice_states'] = [voice_state_payload(1)]
+    payload['stage_instances'] = [stage_instance_payload(GUILD_ID + 500)]
+    payload['guild_scheduled_events'] = [scheduled_event_payload(GUILD_ID + 600)]
+    payload['soundboard_sounds'] = [soundboard_sound_payload(GUILD_ID + 700)]
+    return payload
+
+
+def make_state(**options) -> ConnectionState:
+    client = discord.Client(intents=discord.Intents.all(), chunk_guilds_at_startup=False, **options)
+    state: ConnectionState = client._connection
+    state.user = discord.ClientUser(state=state, data=user_payload(SELF_ID))  # type: ignore
+    return state
+
+
+def assert_minimal(guild: discord.Guild):
+    assert guild.cache_level is discord.GuildCacheLevel.minimal
+    assert guild.name == 'Test Guild'
+    assert guild.member_count == 3
+    assert [m.id for m in guild.members] == [SELF_ID]
+    assert guild.me is not None
+    assert not guild.channels
+    assert not guild.emojis
+    assert list(guild.roles) == [guild.default_role]
+    assert guild.default_role.id == GUILD_ID
+
+
+def test_minimal_guild_from_policy():
+    seen = []
+
+    def policy(guild_id, data):
+        seen.append(guild_id)
+        return discord.GuildCacheLevel.minimal
+
+    state = make_state(guild_cache_policy=policy)
+    guild = state._get_create_guild(guild_payload())  # type: ignore
+    assert seen == [GUILD_ID]
+    assert_minimal(guild)
+    assert not state._emojis
+    assert not state._guild_needs_chunking(guild)
+
+    # Entities arriving later aren't cached either
+    guild._add_channel(discord.TextChannel(state=state, guild=guild, data=channel_payload(GUILD_ID + 150, 9)))  # type: ignore
+    guild._add_role(discord.Role(guild=guild, state=state, data=role_payload(GUILD_ID + 2, 2)))  # type: ignore
+    assert not guild.channels
+    assert list(guild.roles) == [guild.default_role]
+
+
+def test_demote_guild():
+    state = make_state()
+    guild = state._get_create_guild(guild_payload())  # type: ignore
+    assert guild.cache_level is discord.GuildCacheLevel.full
+    assert len(guild.members) == 3 and len(guild.channels) == 3 and len(guild.roles) == 2
+    assert len(state._emojis) == 1
+
+    state._demote_guild(guild)
+    assert_minimal(guild)
+    assert not state._emojis
+
+
+@pytest.mark.asyncio
+async def test_promote_guild(monkeypatch):
+    state = make_state(guild_cache_policy=lambda guild_id, data: discord.GuildCacheLevel.minimal)
+    guild = state._get_create_guild(guild_payload())  # type: ignore
+    calls = []
+
+    def respond(name, result):
+        async def request(*args):
+            calls.append(name)
+            return result
+
+        monkeypatch.setattr(state.http, name, request)
+
+    payload = guild_payload()
+    respond('get_guild', {k: v for k, v in payload.items() if k not in ('channels', 'members', 'threads')})
+    respond('get_all_guild_channels', payload['channels'])
+    respond('get_active_threads', {'threads': [], 'members': []})
+    respond('get_scheduled_events', [])
+    respond('get_soundboard_sounds', {'items': []})
+
+    await state.set_guild_cache_level(guild, discord.GuildCacheLevel.full)
+    assert len(calls) == 5
+    assert guild.cache_level is discord.GuildCacheLevel.full
+    assert len(guild.channels) == 3 and len(guild.roles) == 2 and len(guild.emojis) == 1
+    assert [m.id for m in guild.members] == [SELF_ID]
+
+    # Already at that level, nothing to do
+    await state.set_guild_cache_level(guild, discord.GuildCacheLevel.full)
+    assert len(calls) == 5
+
+
+def test_cache_flags_channel_dependencies():
+    flags = discord.CacheFlags(text_channels=False)
+    assert not flags.channels
+    assert flags.voice_channels and flags.stage_channels and flags.categories and flags.forums
+    assert discord.ChannelType.text not in flags._channel_types
+    assert discord.ChannelType.news not in flags._channel_types
+    assert discord.ChannelType.voice in flags._channel_types
+
+    flags.text_channels = True
+    assert flags.channels
+    assert flags == discord.CacheFlags.all()
+
+    flags = discord.CacheFlags(channels=False)
+    assert not any((flags.text_channels, flags.voice_channels, flags.stage_channels, flags.categories, flags.forums))
+    assert not flags._channel_types
+    assert flags.threads and flags.roles
+    # channels is an alias of the individual channel flags, it isn't listed separately
+    assert 'channels' not in dict(flags)
+    assert dict(flags)['text_channels'] is False
+
+    assert discord.CacheFlags.none().value == 0
+    with pytest.raises(TypeError):
+        discord.CacheFlags(members=False)
+
+
+def typed_channel_payload(channel_id: int, channel_type: int):
+    return {**channel_payload(channel_id, channel_id - GUILD_ID), 'type': channel_type}
+
+
+# flag -> (parse handler, event payload, lookup of the entity from GUILD_CREATE, lookup of the entity from the event)
+ENTITIES = {
+    'text_channels': (
+        'parse_channel_create',
+        lambda: typed_channel_payload(GUILD_ID + 120, 0),
+        lambda g: g.get_channel(GUILD_ID + 100),
+        lambda g: g.get_channel(GUILD_ID + 120),
+    ),
+    'voice_channels': (
+        'parse_channel_create',
+        lambda: typed_channel_payload(GUILD_ID + 121, 2),
+        lambda g: g.get_channel(GUILD_ID + 110),
+        lambda g: g.get_channel(GUILD_ID + 121),
+    ),
+    'stage_channels': (
+        'parse_channel_create',
+        lambda: typed_channel_payload(GUILD_ID + 122, 13),
+        lambda g: g.get_channel(GUILD_ID + 111),
+        lambda g: g.get_channel(GUILD_ID + 122),
+    ),
+    'categories': (
+        'parse_channel_create',
+        lambda: typed_channel_payload(GUILD_ID + 123, 4),
+        lambda g: g.get_channel(GUILD_ID + 112),
+        lambda g: g.get_channel(GUILD_ID + 123),
+    ),
+    'forums': (
+        'parse_channel_create',
+        lambda: typed_channel_payload(GUILD_ID + 124, 15),
+        lambda g: g.get_channel(GUILD_ID + 113),
+        lambda g: g.get_channel(GUILD_ID + 124),
+    ),
+    'threads': (
+        'parse_thread_create',
+        lambda: thread_payload(GUILD_ID + 301),
+        lambda g: g.get_thread(GUILD_ID + 300),
+        lambda g: g.get_thread(GUILD_ID + 301),
+    ),
+    'roles': (
+        'parse_guild_role_create',
+        lambda: {'guild_id': str(GUILD_ID), 'role': role_payload(GUILD_ID + 2, 2)},
+        lambda g: g.get_role(GUILD_ID + 1),
+        lambda g: g.get_role(GUILD_ID + 2),
+    ),
+    'emojis': (
+        'parse_guild_emojis_update',
+        lambda: {'guild_id': str(GUILD_ID), 'emojis': [emoji_payload(GUILD_ID + 201)]},
+        lambda g: g.emojis,
+        lambda g: g.emojis,
+    ),
+    'stickers': (
+        'parse_guild_stickers_update',
+        lambda: {'guild_id': str(GUILD_ID), 'stickers': [sticker_payload(GUILD_ID + 401)]},
+        lambda g: g.stickers,
+        lambda g: g.stickers,
+    ),
+    'voice_states': (
+        'parse_voice_state_update',
+        lambda: voice_state_payload(2),
+        lambda g: g._voice_states.get(1),
+        lambda g: g._voice_states.get(2),
+    ),
+    'stage_instances': (
+        'parse_stage_instance_create',
+        lambda: stage_instance_payload(GUILD_ID + 501),
+        lambda g: g.get_stage_instance(GUILD_ID + 500),
+        lambda g: g.get_stage_instance(GUILD_ID + 501),
+    ),
+    'scheduled_events': (
+        'parse_guild_scheduled_event_create',
+        lambda: scheduled_event_payload(GUILD_ID + 601),
+        lambda g: g.get_scheduled_event(GUILD_ID + 600),
+        lambda g: g.get_scheduled_event(GUILD_ID + 601),
+    ),
+    'soundboard_sounds': (
+        'parse_guild_soundboard_sound_create',
+        lambda: soundboard_sound_payload(GUILD_ID + 701),
+        lambda g: g.get_soundboard_sound(GUILD_ID + 700),
+        lambda g: g.get_soundboard_sound(GUILD_ID + 701),
+    ),
+}
+
+
+@pytest.mark.parametrize('flag', ENTITIES)
+@pytest.mark.parametrize('enabled', [True, False])
+def test_cache_flags_parse_paths(flag, enabled):
+    state = make_state(cache_flags=discord.CacheFlags(**{flag: enabled}))
+    guild = state._get_create_guild(full_guild_payload())  # type: ignore
+    handler, payload, created, added = ENTITIES[flag]
+
+    assert bool(created(guild)) is enabled
+    getattr(state, handler)(payload())
+    assert bool(added(guild)) is enabled
+
+    # Nothing else is affected
+    for other, (_, _, other_created, _) in ENTITIES.items():
+        if other != flag:
+            assert other_created(guild), other
+    assert guild.default_role.id == GUILD_ID
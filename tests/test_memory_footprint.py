@@ -0,0 +1,167 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import discord
+import pytest
+
+from discord.state import ConnectionState
+
+
+# Per-object budgets in bytes, as measured by Client.cache_stats. These track the
+# footprint of the hottest cached models across releases: when a change pushes one
+# of them over budget it should either be slimmed down or the budget consciously
+# raised here.
+BUDGETS = {
+    'users': 600,
+    'members': 600,
+    'roles': 450,
+    'channels': 600,
+    'messages': 1300,
+}
+
+MEMBER_COUNT = 2000
+ROLE_COUNT = 50
+CHANNEL_COUNT = 100
+MESSAGE_COUNT = 500
+GUILD_ID = 1 << 40
+SELF_ID = 1 << 41
+
+
+def user_payload(user_id: int):
+    return {
+        'id': str(user_id),
+        'username': f'user{user_id}',
+        'discriminator': '0',
+        'global_name': f'User {user_id}',
+        'avatar': 'a' * 32,
+    }
+
+
+def member_payload(user_id: int):
+    return {
+        'user': user_payload(user_id),
+        'roles': [str(GUILD_ID + 1 + (user_id + i) % ROLE_COUNT) for i in range(3)],
+        'joined_at': '2020-01-01T00:00:00+00:00',
+        'deaf': False,
+        'mute': False,
+        'flags': 0,
+    }
+
+
+def role_payload(role_id: int, position: int):
+    return {
+        'id': str(role_id),
+        'name': f'role {position}',
+        'permissions': '104324673',
+        'position': position,
+        'color': 0x3498DB,
+        'hoist': False,
+        'managed': False,
+        'mentionable': False,
+    }
+
+
+def channel_payload(channel_id: int, position: int):
+    return {
+        'id': str(channel_id),
+        'type': 0,
+        'name': f'channel-{position}',
+        'position': position,
+        'topic': 'A channel for testing',
+        'permission_overwrites': [
+            {'id': str(GUILD_ID), 'type': 0, 'allow': '0', 'deny': '1024'},
+            {'id': str(GUILD_ID + 1), 'type': 0, 'allow': '1024', 'deny': '0'},
+        ],
+    }
+
+
+def guild_payload():
+    members = [member_payload(SELF_ID)] + [member_payload(i) for i in range(1, MEMBER_COUNT)]
+    return {
+        'id': str(GUILD_ID),
+        'name': 'Benchmark Guild',
+        'owner_id': str(SELF_ID),
+        'member_count': MEMBER_COUNT,
+        'roles': [role_payload(GUILD_ID, 0)] + [role_payload(GUILD_ID + i, i) for i in range(1, ROLE_COUNT + 1)],
+        'channels': [channel_payload(GUILD_ID + 1000 + i, i) for i in range(CHANNEL_COUNT)],
+        'members': members,
+        'emojis': [],
+        'stickers': [],
+        'threads': [],
+    }
+
+
+def message_payload(message_id: int, channel_id: int, author_id: int):
+    return {
+        'id': str(message_id),
+        'channel_id': str(channel_id),
+        'guild_id': str(GUILD_ID),
+        'author': user_payload(author_id),
+        'member': {k: v for k, v in member_payload(author_id).items() if k != 'user'},
+        'content': 'Hello world, this is a benchmark message',
+        'timestamp': '2020-01-01T00:00:00+00:00',
+        'edited_timestamp': None,
+        'tts': False,
+        'mention_everyone': False,
+        'mentions': [],
+        'mention_roles': [],
+        'attachments': [],
+        'embeds': [],
+        'pinned': False,
+        'type': 0,
+    }
+
+
+@pytest.fixture(scope='module')
+def client() -> discord.Client:
+    client = discord.Client(intents=discord.Intents.all(), chunk_guilds_at_startup=False)
+    state: ConnectionState = client._connection
+    state.user = discord.ClientUser(state=state, data=user_payload(SELF_ID))  # type: ignore
+    state._add_guild_from_data(guild_payload())  # type: ignore
+
+    for i in range(MESSAGE_COUNT):
+        channel_id = GUILD_ID + 1000 + i % CHANNEL_COUNT
+        state.parse_message_create(message_payload(GUILD_ID + 10_000 + i, channel_id, 1 + i % (MEMBER_COUNT - 1)))  # type: ignore
+    return client
+
+
+def test_cache_stats_counts(client: discord.Client):
+    stats = client.cache_stats(estimate_size=False)
+    assert stats.guilds.count == 1
+    assert stats.members.count == MEMBER_COUNT
+    assert stats.roles.count == ROLE_COUNT + 1
+    assert stats.channels.count == CHANNEL_COUNT
+    assert stats.messages.count == MESSAGE_COUNT
+    assert stats.total_size == 0
+
+
+@pytest.mark.parametrize(('category', 'budget'), BUDGETS.items())
+def test_per_object_footprint(client: discord.Client, category: str, budget: int):
+    stats = client.cache_stats()
+    usage = getattr(stats, category)
+    assert usage.count > 0
+    assert 0 < usage.average_size <= budget, f'{category} use {usage.average_size:.0f} bytes each'
@@ -0,0 +1,385 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import asyncio
+import io
+import struct
+import threading
+from typing import List
+
+import pytest
+
+import discord
+from discord.oggparse import MappedOggStream, OggError, OggStream
+
+
+OPUS_HEAD = b'OpusHead' + bytes([1, 2]) + struct.pack('<HIhB', 312, 48000, 0, 0)
+OPUS_TAGS = b'OpusTags' + struct.pack('<I', 0) + struct.pack('<I', 0)
+
+
+def audio_packets(count: int, size: int = 60) -> List[bytes]:
+    # 0xF8 is the TOC byte of a single 20ms CELT fullband frame
+    return [(b'\xf8' + n.to_bytes(3, 'big')) * (size // 4) for n in range(count)]
+
+
+def ogg_page(segments: List[int], body: bytes, *, granule: int, pagenum: int, flag: int = 0) -> bytes:
+    header = b'OggS' + struct.pack('<BBQIIIB', 0, flag, granule, 1234, pagenum, 0, len(segments))
+    return header + bytes(segments) + body
+
+
+def build_ogg(packets: List[bytes], *, max_segments: int = 255, per_page: int = 4) -> bytes:
+    """Builds an Ogg Opus stream, splitting packets across pages when they don't fit."""
+    pages = [
+        ogg_page([len(OPUS_HEAD)], OPUS_HEAD, granule=0, pagenum=0, flag=0x02),
+        ogg_page([len(OPUS_TAGS)], OPUS_TAGS, granule=0, pagenum=1),
+    ]
+    segments: List[int] = []
+    body = b''
+    # Whether the current page starts with the rest of a packet from the previous page
+    continued = False
+    completed = 0
+    granule = 0
+
+    def flush(*, final: bool = False, mid_packet: bool = False) -> None:
+        nonlocal segments, body, continued, completed
+        flag = (0x01 if continued else 0) | (0x04 if final else 0)
+        page_granule = granule if completed else 0xFFFFFFFFFFFFFFFF
+        pages.append(ogg_page(segments, body, granule=page_granule, pagenum=len(pages), flag=flag))
+        segments, body, completed = [], b'', 0
+        continued = mid_packet
+
+    for packet in packets:
+        lacing = [255] * (len(packet) // 255) + [len(packet) % 255]
+        offset = 0
+        for lace in lacing:
+            if len(segments) == max_segments:
+                flush(mid_packet=offset > 0)
+            segments.append(lace)
+            body += packet[offset : offset + lace]
+            offset += lace
+        granule += 960
+        completed += 1
+        if completed == per_page:
+            flush()
+
+    if segments:
+        flush(final=True)
+    return b''.join(pages)
+
+
+def read_all(source: discord.AudioSource) -> List[bytes]:
+    return [bytes(packet) for packet in iter(source.read, b'')]
+
+
+@pytest.fixture(params=['memory', 'mmap'])
+def clip_cache(request, tmp_path):
+    directory = str(tmp_path) if request.param == 'mmap' else None
+    return discord.OpusClipCache(max_size=1000, directory=directory)
+
+
+def test_clip_cache_replays_without_reencoding(clip_cache):
+    packets = audio_packets(10)
+    clip = clip_cache.add_ogg('ding', io.BytesIO(build_ogg(packets)))
+
+    assert clip.frame_count == 10
+    assert clip.duration == pytest.approx(0.2)
+    assert clip.size == 600
+    assert clip.is_memory_mapped() == (clip_cache.directory is not None)
+
+    # Every source is an independent reader over the same stored packets
+    first, second = clip.source(), clip.source()
+    assert first.is_opus()
+    assert read_all(first) == packets
+    assert read_all(second) == packets
+    assert [bytes(p) for p in clip.packets()] == packets
+
+
+def test_clip_cache_lru_eviction(clip_cache, tmp_path):
+    clip_cache.add('a', audio_packets(5, 100))
+    clip_cache.add('b', audio_packets(3, 100))
+    assert clip_cache.get('a') is not None
+
+    # 'b' is now least recently used, so it goes first
+    clip_cache.add('c', audio_packets(4, 100))
+    assert 'b' not in clip_cache
+    assert [clip.key for clip in clip_cache.clips] == ['a', 'c']
+    assert clip_cache.size == 900
+
+    oversized = clip_cache.add('huge', audio_packets(20, 100))
+    assert 'huge' not in clip_cache
+    assert len(read_all(oversized.source())) == 20
+
+    playing = clip_cache.get('a').source()
+    clip_cache.clear()
+    assert len(clip_cache) == 0 and clip_cache.size == 0
+    # Sources created before eviction keep working
+    assert len(read_all(playing)) == 5
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_clip_cache_replace_and_remove(clip_cache):
+    clip_cache.add('a', audio_packets(2))
+    clip_cache.add('a', audio_packets(3))
+    assert clip_cache.size == 180
+    assert clip_cache.remove('a').frame_count == 3
+    assert clip_cache.remove('a') is None
+    assert clip_cache.size == 0
+
+
+def test_clip_cache_load_returns_cached_clip(clip_cache):
+    clip = clip_cache.add('ding.mp3', audio_packets(2))
+
+    async def load():
+        return await clip_cache.load('ding.mp3'), await clip_cache.source('ding.mp3')
+
+    loaded, source = asyncio.run(load())
+    assert loaded is clip
+    assert source.clip is clip
+
+
+def test_clip_cache_load_survives_cancelled_caller(clip_cache, monkeypatch):
+    packets = audio_packets(3)
+    released = threading.Event()
+    encoded = []
+
+    def encode(source, **options):
+        encoded.append(source)
+        released.wait(5)
+        return packets
+
+    monkeypatch.setattr(clip_cache, '_encode', encode)
+
+    async def load():
+        first = asyncio.create_task(clip_cache.load('ding.mp3'))
+        second = asyncio.create_task(clip_cache.load('ding.mp3'))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        released.set()
+        return first, await second
+
+    # Cancelling the caller that started the encode doesn't cancel it for the other one
+    first, clip = asyncio.run(load())
+    assert first.cancelled()
+    assert [bytes(p) for p in clip.packets()] == packets
+    assert clip_cache.get('ding.mp3') is clip
+    assert encoded == ['ding.mp3']
+
+
+@pytest.mark.parametrize('max_segments', [255, 3, 1])
+@pytest.mark.parametrize('size', [60, 600])
+def test_mapped_ogg_stream_matches_ogg_stream(max_segments, size):
+    data = build_ogg(audio_packets(30, size), max_segments=max_segments)
+    expected = list(OggStream(io.BytesIO(data)).iter_packets())
+
+    stream = MappedOggStream(data)
+    packets = list(stream.iter_packets())
+
+    assert [bytes(packet) for packet in packets] == expected
+    assert expected[0] == OPUS_HEAD and expected[1] == OPUS_TAGS
+    if size < 255 and max_segments == 255:
+        # Nothing spans pages, so nothing is copied
+        assert all(isinstance(packet, memoryview) for packet in packets)
+
+
+def test_mapped_ogg_stream_from_file(tmp_path):
+    path = tmp_path / 'music.opus'
+    path.write_bytes(build_ogg(audio_packets(50)))
+
+    with MappedOggStream(str(path)) as stream:
+        assert stream.duration == pytest.approx(1.0)
+        assert len([packet for packet in stream.iter_packets()]) == 52
+
+    empty = tmp_path / 'empty.opus'
+    empty.write_bytes(b'')
+    assert list(MappedOggStream(empty).iter_packets()) == []
+
+
+@pytest.mark.parametrize('max_segments', [255, 1])
+@pytest.mark.parametrize('frame', [0, 1, 3, 4, 17, 29])
+def test_mapped_ogg_stream_seek(max_segments, frame):
+    packets = audio_packets(30, 600)
+    stream = MappedOggStream(build_ogg(packets, max_segments=max_segments))
+
+    # Start anywhere inside the requested frame
+    result = [bytes(packet) for packet in stream.iter_packets(start=frame * 960 + 100)]
+    assert result == packets[frame:]
+
+
+def test_mapped_ogg_stream_seek_index():
+    stream = MappedOggStream(build_ogg(audio_packets(12), per_page=4))
+    assert [granule for granule, _ in stream.index] == [0, 0, 3840, 7680, 11520]
+    assert stream.seek_offset(10**9) == len(build_ogg(audio_packets(12), per_page=4))
+    assert list(stream.iter_packets(start=11520)) == []
+
+
+def test_mapped_ogg_stream_bad_data():
+    with pytest.raises(OggError):
+        list(MappedOggStream(b'OggX' + bytes(40)).iter_packets())
+    with pytest.raises(OggError):
+        list(MappedOggStream(build_ogg(audio_packets(3))[:-10]).iter_packets())
+
+
+def test_mapped_ogg_stream_large_file():
+    data = build_ogg(audio_packets(20000, 160), per_page=50)
+
+    copied = [bytes(packet) for packet in OggStream(io.BytesIO(data)).iter_packets()]
+    mapped = [bytes(packet) for packet in MappedOggStream(data).iter_packets()]
+    assert len(copied) == 20002
+    assert copied == mapped
+
+
+def test_ogg_opus_audio_seek(tmp_path):
+    packets = audio_packets(200)
+    path = tmp_path / 'song.opus'
+    path.write_bytes(build_ogg(packets))
+    source = discord.OggOpusAudio(path)
+
+    assert source.is_opus()
+    # The headers are never played and the pre-skip isn't part of the duration
+    assert bytes(source.read()) == packets[0]
+    assert source.position == pytest.approx(0.02)
+    assert source.duration == pytest.approx((200 * 960 - 312) / 48000)
+
+    source.seek(2.0)
+    assert source.position == 2.0
+    assert bytes(source.read()) == packets[100]
+    assert source.position == pytest.approx(2.02)
+
+    source.seek(0)
+    assert read_all(source) == packets
+
+    source.seek(10.0)
+    assert source.read() == b''
+    with pytest.raises(ValueError):
+        source.seek(-1)
+    source.cleanup()
+
+
+def test_ogg_opus_audio_start():
+    packets = audio_packets(50)
+    source = discord.OggOpusAudio(build_ogg(packets, max_segments=1), start=0.5)
+    assert source.position == pytest.approx(0.5)
+    assert read_all(source) == packets[25:]
+
+
+def test_opus_clip_audio_seek(clip_cache):
+    packets = audio_packets(10)
+    source = clip_cache.add('ding', packets).source()
+
+    source.seek(0.1)
+    assert source.position == pytest.approx(0.1)
+    assert source.duration == pytest.approx(0.2)
+    assert read_all(source) == packets[5:]
+
+    source.seek(5.0)
+    assert source.read() == b''
+
+
+class FakeFFmpegProcess:
+    """Stands in for ffmpeg, writing numbered PCM frames from the position given with -ss."""
+
+    def __init__(self, args: List[str], frames: int) -> None:
+        self.args = args
+        self.pid = 1
+        self.returncode = None
+        start = round(float(args[args.index('-ss') + 1]) * 50) if '-ss' in args else 0
+        frame_size = discord.opus.Encoder.FRAME_SIZE
+        self.stdout = io.BytesIO(b''.join(n.to_bytes(4, 'big') * (frame_size // 4) for n in range(start, frames)))
+        self.stdin = io.BytesIO()
+        self.stderr = None
+
+    def kill(self) -> None:
+        self.returncode = -9
+
+    def poll(self):
+        return self.returncode
+
+
+def frame_number(frame: bytes) -> int:
+    return int.from_bytes(frame[:4], 'big')
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch):
+    spawned: List[FakeFFmpegProcess] = []
+
+    def spawn(self, args, **kwargs):
+        process = FakeFFmpegProcess(args, 5000)
+        spawned.append(process)
+        return process
+
+    monkeypatch.setattr(discord.FFmpegAudio, '_spawn_process', spawn)
+    return spawned
+
+
+def test_ffmpeg_audio_seek(fake_ffmpeg):
+    source = discord.FFmpegPCMAudio('song.mp3', before_options='-nostdin')
+    assert frame_number(source.read()) == 0
+    assert source.duration is None
+
+    # Short forward seeks read through the running process
+    source.seek(1.0)
+    assert source.position == 1.0
+    assert frame_number(source.read()) == 50
+    assert len(fake_ffmpeg) == 1
+
+    # Anything else restarts ffmpeg with input seeking
+    source.seek(60.0)
+    assert frame_number(source.read()) == 3000
+    assert source.position == pytest.approx(60.02)
+    assert fake_ffmpeg[0].returncode is not None
+    args = fake_ffmpeg[1].args
+    assert args[1:6] == ['-nostdin', '-ss', '60.000', '-i', 'song.mp3']
+
+    source.seek(10.0)
+    assert frame_number(source.read()) == 500
+    assert len(fake_ffmpeg) == 3
+    source.cleanup()
+
+
+def test_ffmpeg_audio_piped_seek(fake_ffmpeg):
+    source = discord.FFmpegPCMAudio(io.BytesIO(b''), pipe=True)
+    with pytest.raises(discord.ClientException):
+        source.seek(1.0)
+    source.cleanup()
+
+
+def test_player_seek_through_volume_transformer(fake_ffmpeg):
+    source = discord.PCMVolumeTransformer(discord.FFmpegPCMAudio('song.mp3'))
+    player = discord.player.AudioPlayer(source, None)  # type: ignore # never started
+
+    player.seek(30.0)
+    assert player.position == 30.0
+    assert frame_number(source.original.read()) == 1500
+
+    player = discord.player.AudioPlayer(discord.PCMAudio(io.BytesIO()), None)  # type: ignore
+    assert player.position == 0.0
+    assert player.duration is None
+    with pytest.raises(TypeError):
+        player.seek(1.0)
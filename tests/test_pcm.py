@@ -0,0 +1,202 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import array
+import sys
+
+import pytest
+
+import discord
+from discord import pcm
+
+
+BACKENDS = [False]
+if pcm.HAS_NUMPY:
+    BACKENDS.append(True)
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda numpy: 'numpy' if numpy else 'array', autouse=True)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(pcm, 'HAS_NUMPY', request.param)
+
+
+def encode(*samples: int) -> bytes:
+    data = array.array('h', samples)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data.tobytes()
+
+
+def decode(data: bytes) -> list:
+    samples = array.array('h', data)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples.tolist()
+
+
+def test_scale():
+    data = encode(1000, -1000, 30000, -30000)
+    assert decode(pcm.scale(data, 0.5)) == [500, -500, 15000, -15000]
+    assert decode(pcm.scale(data, 2.0)) == [2000, -2000, 32767, -32768]
+    assert decode(pcm.scale(data, 0.0)) == [0, 0, 0, 0]
+    assert pcm.scale(data, 1.0) == data
+
+
+def test_ramp():
+    # Two stereo frames, each channel pair shares its gain
+    data = encode(1000, 1000, 1000, 1000)
+    assert decode(pcm.ramp(data, 0.0, 1.0)) == [0, 0, 500, 500]
+    assert decode(pcm.ramp(data, 1.0, 1.0)) == [1000, 1000, 1000, 1000]
+
+
+def test_mix():
+    a = encode(1000, -1000, 30000, -30000)
+    b = encode(500, 500)
+    assert decode(pcm.mix([a, b])) == [1500, -500, 30000, -30000]
+    assert decode(pcm.mix([a, a])) == [2000, -2000, 32767, -32768]
+    assert decode(pcm.mix([a, b], [0.5, 2.0])) == [1500, 500, 15000, -15000]
+    assert pcm.mix([]) == b''
+
+    with pytest.raises(ValueError):
+        pcm.mix([a, b], [1.0])
+
+
+def test_crossfade():
+    outgoing = encode(1000, 1000, 1000, 1000)
+    incoming = encode(-1000, -1000, -1000, -1000)
+    assert decode(pcm.crossfade(outgoing, incoming, 0.0, 1.0)) == [1000, 1000, 0, 0]
+    assert decode(pcm.crossfade(outgoing, incoming, 1.0, 1.0)) == [-1000, -1000, -1000, -1000]
+
+
+def test_rms():
+    assert pcm.rms(b'') == 0.0
+    assert pcm.rms(encode(0, 0)) == 0.0
+    assert pcm.rms(encode(-32768, -32768)) == pytest.approx(1.0)
+    assert pcm.rms(encode(16384, -16384)) == pytest.approx(0.5)
+
+
+def test_resample():
+    # 24KHz mono doubles in length and is duplicated into both channels
+    assert decode(pcm.resample(encode(0, 100), 24000, channels=1)) == [0, 0, 50, 50, 100, 100, 100, 100]
+    assert len(pcm.resample(bytes(441 * 4), 44100)) == 480 * 4
+    assert pcm.resample(encode(1, 2), 48000) == encode(1, 2)
+
+    with pytest.raises(ValueError):
+        pcm.resample(b'', 0)
+    with pytest.raises(ValueError):
+        pcm.resample(b'', 48000, channels=3)
+
+
+class ConstantSource(discord.AudioSource):
+    def __init__(self, value: int, frames: int):
+        self.frame = encode(*([value] * (discord.opus.Encoder.FRAME_SIZE // 2)))
+        self.remaining = frames
+        self.cleaned_up = False
+
+    def read(self) -> bytes:
+        if self.remaining <= 0:
+            return b''
+        self.remaining -= 1
+        return self.frame
+
+    def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+def first_sample(data: bytes) -> int:
+    return decode(data[:2])[0]
+
+
+def last_sample(data: bytes) -> int:
+    return decode(data[-2:])[0]
+
+
+def test_volume_transformer():
+    source = discord.PCMVolumeTransformer(ConstantSource(1000, 1), volume=0.25)
+    assert set(decode(source.read())) == {250}
+
+
+def test_mixed_audio_source_overlay():
+    music = ConstantSource(1000, 10)
+    effect = ConstantSource(200, 2)
+    mixer = discord.MixedAudioSource(music)
+
+    assert set(decode(mixer.read())) == {1000}
+
+    mixer.add_source(effect, volume=0.5)
+    assert set(decode(mixer.read())) == {1100}
+    assert set(decode(mixer.read())) == {1100}
+
+    # The effect is exhausted and dropped from the mix
+    assert set(decode(mixer.read())) == {1000}
+    assert effect.cleaned_up
+    assert mixer.sources == [music]
+
+
+def test_mixed_audio_source_ducking():
+    music = ConstantSource(1000, 100)
+    announcement = ConstantSource(0, 20)
+    mixer = discord.MixedAudioSource(music, duck_volume=0.5)
+    mixer.add_source(announcement, duck=True)
+
+    # The music ramps down over DUCK_FRAMES frames rather than jumping
+    first = mixer.read()
+    assert first_sample(first) == 1000
+    assert 900 < last_sample(first) < 1000
+
+    for _ in range(mixer.DUCK_FRAMES):
+        data = mixer.read()
+    assert set(decode(data)) == {500}
+
+
+def test_mixed_audio_source_crossfade_and_end():
+    old = ConstantSource(1000, 100)
+    new = ConstantSource(-1000, 3)
+    mixer = discord.MixedAudioSource(old)
+    mixer.crossfade(new, 0.04)
+
+    data = mixer.read()
+    assert first_sample(data) == 1000
+    data = mixer.read()
+    assert last_sample(data) < 0
+
+    # The outgoing source is removed once it has faded out
+    assert old.cleaned_up
+    assert mixer.sources == [new]
+
+    assert mixer.read()
+    assert mixer.read() == b''
+    assert new.cleaned_up
+
+
+def test_mixed_audio_source_keep_alive():
+    mixer = discord.MixedAudioSource(keep_alive=True)
+    assert mixer.read() == bytes(discord.opus.Encoder.FRAME_SIZE)
+
+    with pytest.raises(ValueError):
+        mixer.remove_source(ConstantSource(0, 1))
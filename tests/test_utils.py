@@ -334,3 +334,18 @@ def test_is_inside_class():
 )
 def test_format_dt(dt: datetime.datetime, style: typing.Optional[utils.TimestampStyle], formatted: str):
     assert utils.format_dt(dt, style=style) == formatted
+
+
+def test_intern_str_is_bounded(monkeypatch):
+    monkeypatch.setattr(utils, '_interned_strs', {})
+    monkeypatch.setattr(utils, '_INTERN_LIMIT', 2)
+
+    first = utils._intern_str(''.join(['mod', 'erator']))
+    assert utils._intern_str(''.join(['mod', 'erator'])) is first
+    assert utils._intern_str(None) is None
+
+    utils._intern_str('admin')
+    # Once full, new strings are returned as they are instead of being kept forever
+    name = ''.join(['mem', 'ber'])
+    assert utils._intern_str(name) is name
+    assert len(utils._interned_strs) == 2
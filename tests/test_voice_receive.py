@@ -0,0 +1,232 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import random
+import socket
+import struct
+import threading
+import types
+
+import pytest
+
+nacl_bindings = pytest.importorskip('nacl.bindings')
+
+import discord
+from discord.gateway import DiscordVoiceWebSocket
+from discord.sinks import decrypt_rtp_packet
+from discord.voice_state import SocketReader
+
+
+SECRET_KEY = list(range(32))
+SENDER_SSRC = 1111
+SENDER_USER_ID = 42
+
+
+class LoopbackConnection:
+    # A stand-in for the voice UDP connection, packets are exchanged over real loopback sockets
+    def __init__(self, mode):
+        self.mode = mode
+        self.secret_key = SECRET_KEY
+        self.ssrc = SENDER_SSRC
+        self.timeout = 30.0
+        self.ssrc_map = {}
+        self.peer = None
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(('127.0.0.1', 0))
+        self.socket.setblocking(False)
+        self._socket_reader = SocketReader(self, start_paused=False)
+        self._socket_reader.start()
+
+    def is_connected(self):
+        return True
+
+    def add_socket_listener(self, callback):
+        self._socket_reader.register(callback)
+
+    def remove_socket_listener(self, callback):
+        self._socket_reader.unregister(callback)
+
+    def send_packet(self, packet):
+        self.socket.sendto(packet, self.peer)
+
+    def close(self):
+        self._socket_reader.stop()
+        self.socket.close()
+
+
+class LoopbackVoiceClient(discord.VoiceClient):
+    def create_connection_state(self):
+        return LoopbackConnection(self.mode_for_test)
+
+
+class CollectingSink(discord.AudioSink):
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.frames = []
+        self.done = threading.Event()
+        self.cleaned_up = False
+
+    def write(self, data):
+        self.frames.append(data)
+        if len(self.frames) >= self.expected:
+            self.done.set()
+
+    def wants_opus(self):
+        return True
+
+    def cleanup(self):
+        self.cleaned_up = True
+
+
+def make_voice_client(mode: str) -> LoopbackVoiceClient:
+    LoopbackVoiceClient.mode_for_test = mode
+    state = types.SimpleNamespace(loop=None, audio_scheduler=None, get_user=lambda user_id: None)
+    client = types.SimpleNamespace(_connection=state, loop=None)
+    channel = types.SimpleNamespace(guild=types.SimpleNamespace(get_member=lambda user_id: None))
+    return LoopbackVoiceClient(client, channel)  # type: ignore
+
+
+@pytest.fixture
+def voice_pair(request):
+    mode = getattr(request, 'param', 'aead_xchacha20_poly1305_rtpsize')
+    sender = make_voice_client(mode)
+    receiver = make_voice_client(mode)
+    sender._connection.peer = receiver._connection.socket.getsockname()
+    receiver._connection.ssrc_map[SENDER_SSRC] = SENDER_USER_ID
+    yield sender, receiver
+    receiver.stop_listening()
+    sender._connection.close()
+    receiver._connection.close()
+
+
+def frame(n: int) -> bytes:
+    return bytes([n]) * 40
+
+
+@pytest.mark.parametrize('voice_pair', discord.VoiceClient.supported_modes, indirect=True)
+def test_receive_in_order(voice_pair):
+    sender, receiver = voice_pair
+    sink = CollectingSink(10)
+    errors = []
+    finished = threading.Event()
+
+    def after(error):
+        errors.append(error)
+        finished.set()
+
+    receiver.listen(sink, after=after)
+    assert receiver.is_listening()
+    assert receiver.sink is sink
+
+    for n in range(10):
+        sender.send_audio_packet(frame(n), encode=False)
+
+    assert sink.done.wait(5)
+    receiver.stop_listening()
+    assert finished.wait(5)
+
+    assert errors == [None]
+    assert sink.cleaned_up
+    assert [data.opus for data in sink.frames] == [frame(n) for n in range(10)]
+    assert [data.sequence for data in sink.frames] == list(range(1, 11))
+    assert all(data.user == discord.Object(id=SENDER_USER_ID) for data in sink.frames)
+    assert not receiver.is_listening()
+
+
+def test_receive_reorders_and_reports_loss(voice_pair):
+    sender, receiver = voice_pair
+    sink = CollectingSink(12)
+    receiver.listen(sink)
+
+    packets = [bytes(sender._prepare_audio_packet(frame(n), encode=False)) for n in range(12)]
+    lost = packets.pop(5)
+    shuffled = packets[:]
+    # Keep the reordering within the jitter buffer's window
+    for start in range(0, len(shuffled), 3):
+        chunk = shuffled[start : start + 3]
+        random.shuffle(chunk)
+        shuffled[start : start + 3] = chunk
+
+    for packet in shuffled:
+        sender._connection.send_packet(packet)
+
+    assert sink.done.wait(5)
+    assert lost not in shuffled
+    assert [data.sequence for data in sink.frames] == list(range(1, 13))
+    assert [data.is_lost() for data in sink.frames] == [n == 5 for n in range(12)]
+    assert [data.opus for data in sink.frames if not data.is_lost()] == [frame(n) for n in range(12) if n != 5]
+
+
+def test_receive_sink_error_stops_listening(voice_pair):
+    sender, receiver = voice_pair
+    finished = threading.Event()
+    errors = []
+
+    class BrokenSink(CollectingSink):
+        def write(self, data):
+            raise RuntimeError('broken')
+
+    def after(error):
+        errors.append(error)
+        finished.set()
+
+    receiver.listen(BrokenSink(1), after=after)
+    for n in range(4):
+        sender.send_audio_packet(frame(n), encode=False)
+
+    assert finished.wait(5)
+    assert isinstance(errors[0], RuntimeError)
+    assert not receiver._receiver.is_listening()
+
+
+def test_decrypt_rtpsize_with_header_extension():
+    key = bytes(SECRET_KEY)
+    extension_body = b'\x10\xff\x00\x00'
+    payload = frame(7)
+    header = struct.pack('>BBHII', 0x90, 0x78, 3, 960, SENDER_SSRC) + struct.pack('>HH', 0xBEDE, 1)
+    nonce = struct.pack('>I', 9)
+    ciphertext = nacl_bindings.crypto_aead_xchacha20poly1305_ietf_encrypt(
+        extension_body + payload, header, nonce + bytes(20), key
+    )
+
+    packet = decrypt_rtp_packet('aead_xchacha20_poly1305_rtpsize', key, header + ciphertext + nonce)
+
+    assert (packet.sequence, packet.timestamp, packet.ssrc) == (3, 960, SENDER_SSRC)
+    assert packet.opus == payload
+
+
+@pytest.mark.asyncio
+async def test_speaking_event_maps_ssrc():
+    ws = DiscordVoiceWebSocket(None, loop=None)  # type: ignore
+    ws._connection = types.SimpleNamespace(ssrc_map={})
+
+    await ws.received_message({'op': ws.SPEAKING, 'd': {'user_id': '42', 'ssrc': 1111, 'speaking': 1}})
+    assert ws._connection.ssrc_map == {1111: 42}
+
+    await ws.received_message({'op': ws.CLIENT_DISCONNECT, 'd': {'user_id': '42'}})
+    assert ws._connection.ssrc_map == {}
@@ -0,0 +1,470 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+import struct
+import threading
+import time
+import types
+
+import pytest
+
+nacl_secret = pytest.importorskip('nacl.secret')
+
+import discord
+
+
+SSRC = 0x1234
+SECRET_KEY = list(range(32))
+OPUS_FRAME = bytes(range(160))
+# Deliberately conservative so it holds on slow CI machines, a single core
+# usually manages well over ten times this.
+MIN_PACKETS_PER_SECOND = 5000
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.speaking = []
+
+    async def speak(self, state):
+        self.speaking.append(state)
+
+
+class FakeConnection:
+    def __init__(self, mode):
+        self.mode = mode
+        self.secret_key = SECRET_KEY
+        self.ssrc = SSRC
+        self.timeout = 30.0
+        self.ws = FakeWebSocket()
+        self.packets = []
+
+    def is_connected(self):
+        return True
+
+    def send_packet(self, packet):
+        self.packets.append(bytes(packet))
+
+
+class BenchVoiceClient(discord.VoiceClient):
+    def create_connection_state(self):
+        return FakeConnection(self.mode_for_test)
+
+
+class FiniteOpusSource(discord.AudioSource):
+    def __init__(self, frames: int):
+        self.remaining = frames
+        self.cleaned_up = False
+
+    def read(self) -> bytes:
+        if self.remaining <= 0:
+            return b''
+        self.remaining -= 1
+        return OPUS_FRAME
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+def make_voice_client(mode: str, *, loop=None, scheduler=None) -> BenchVoiceClient:
+    BenchVoiceClient.mode_for_test = mode
+    state = types.SimpleNamespace(loop=loop, audio_scheduler=scheduler)
+    client = types.SimpleNamespace(_connection=state, loop=loop)
+    return BenchVoiceClient(client, None)  # type: ignore
+
+
+def decrypt(mode: str, packet: bytes) -> bytes:
+    key = bytes(SECRET_KEY)
+    header = packet[:12]
+    if mode == 'aead_xchacha20_poly1305_rtpsize':
+        box = nacl_secret.Aead(key)
+        return box.decrypt(packet[12:-4], header, packet[-4:] + bytes(20))
+
+    box = nacl_secret.SecretBox(key)
+    if mode == 'xsalsa20_poly1305':
+        return box.decrypt(packet[12:], header + bytes(12))
+    if mode == 'xsalsa20_poly1305_suffix':
+        return box.decrypt(packet[12:-24], packet[-24:])
+    return box.decrypt(packet[12:-4], packet[-4:] + bytes(20))
+
+
+@pytest.mark.parametrize('mode', discord.VoiceClient.supported_modes)
+def test_voice_packet_roundtrip(mode):
+    vc = make_voice_client(mode)
+
+    for sequence in range(3):
+        vc.send_audio_packet(OPUS_FRAME, encode=False)
+        packet = vc._connection.packets[-1]
+
+        assert packet[:2] == b'\x80\x78'
+        assert struct.unpack_from('>HII', packet, 2) == (sequence + 1, sequence * 960, SSRC)
+        assert decrypt(mode, packet) == OPUS_FRAME
+
+
+def test_voice_packet_counters_wrap():
+    vc = make_voice_client('aead_xchacha20_poly1305_rtpsize')
+    vc.sequence = 65535
+    vc.timestamp = 4294967295 - 959
+    vc._incr_nonce = 4294967295
+
+    vc.send_audio_packet(OPUS_FRAME, encode=False)
+    packet = vc._connection.packets[-1]
+
+    assert struct.unpack_from('>HI', packet, 2) == (0, 4294967295 - 959)
+    assert packet[-4:] == b'\xff\xff\xff\xff'
+    assert (vc.sequence, vc.timestamp, vc._incr_nonce) == (0, 0, 0)
+
+
+def test_voice_cipher_rebuilt_on_key_change():
+    vc = make_voice_client('aead_xchacha20_poly1305_rtpsize')
+    vc.send_audio_packet(OPUS_FRAME, encode=False)
+
+    vc._connection.secret_key = new_key = list(range(32, 64))
+    vc.send_audio_packet(OPUS_FRAME, encode=False)
+    packet = vc._connection.packets[-1]
+
+    box = nacl_secret.Aead(bytes(new_key))
+    assert box.decrypt(packet[12:-4], packet[:12], packet[-4:] + bytes(20)) == OPUS_FRAME
+
+
+@pytest.mark.parametrize('mode', ['aead_xchacha20_poly1305_rtpsize', 'xsalsa20_poly1305_lite'])
+def test_voice_send_packets_per_second(mode):
+    vc = make_voice_client(mode)
+    vc._connection.send_packet = lambda packet: None
+
+    count = 20000
+    start = time.perf_counter()
+    for _ in range(count):
+        vc.send_audio_packet(OPUS_FRAME, encode=False)
+    elapsed = time.perf_counter() - start
+
+    packets_per_second = count / elapsed
+    assert packets_per_second > MIN_PACKETS_PER_SECOND
+
+
+@pytest.mark.asyncio
+async def test_audio_scheduler_drives_many_players():
+    loop = asyncio.get_running_loop()
+    scheduler = discord.AudioScheduler(workers=2)
+    frames = 10
+    players = 20
+    done = asyncio.Event()
+    results = []
+
+    def after(error):
+        results.append(error)
+        if len(results) == players:
+            loop.call_soon_threadsafe(done.set)
+
+    clients = [make_voice_client('xsalsa20_poly1305_lite', loop=loop, scheduler=scheduler) for _ in range(players)]
+    sources = [FiniteOpusSource(frames) for _ in range(players)]
+    threads_before = threading.active_count()
+    for vc, source in zip(clients, sources):
+        vc.play(source, after=after)
+
+    # Only the scheduler's own workers are started, not a thread per player
+    assert threading.active_count() - threads_before <= 2
+    assert scheduler.player_count == players
+
+    await asyncio.wait_for(done.wait(), timeout=5)
+    scheduler.close()
+
+    assert results == [None] * players
+    assert all(source.cleaned_up for source in sources)
+    for vc in clients:
+        # Every frame of the source plus the trailing silence frames
+        assert len(vc._connection.packets) == frames + 5
+        assert vc._connection.ws.speaking[0] is discord.SpeakingState.voice
+    assert scheduler.player_count == 0
+
+
+@pytest.mark.asyncio
+async def test_audio_scheduler_serializes_players_of_a_client():
+    loop = asyncio.get_running_loop()
+    scheduler = discord.AudioScheduler(workers=2)
+    vc = make_voice_client('xsalsa20_poly1305_lite', loop=loop, scheduler=scheduler)
+    senders = []
+
+    def send_packet(packet):
+        senders.append(threading.current_thread().name)
+        vc._connection.packets.append(bytes(packet))
+
+    vc._connection.send_packet = send_packet
+    # Keep the other worker less loaded than the one the client started on
+    busy = [make_voice_client('xsalsa20_poly1305_lite', loop=loop, scheduler=scheduler) for _ in range(3)]
+    for other in busy:
+        other.play(FiniteOpusSource(500))
+
+    for frames in (3, 4):
+        future = loop.create_future()
+        vc.play(FiniteOpusSource(frames), after=lambda error: loop.call_soon_threadsafe(future.set_result, error))
+        assert await asyncio.wait_for(future, timeout=5) is None
+    scheduler.close()
+
+    # The trailing silence is sent by the worker too, never from the finalizer threads
+    assert len(set(senders)) == 1 and senders[0].startswith('audio-scheduler:')
+    assert len(vc._connection.packets) == 3 + 5 + 4 + 5
+    sequences = [struct.unpack_from('>H', packet, 2)[0] for packet in vc._connection.packets]
+    assert sequences == list(range(sequences[0], sequences[0] + len(sequences)))
+
+
+@pytest.mark.asyncio
+async def test_audio_scheduler_reports_source_errors():
+    loop = asyncio.get_running_loop()
+    scheduler = discord.AudioScheduler()
+    future = loop.create_future()
+
+    class BrokenSource(FiniteOpusSource):
+        def read(self) -> bytes:
+            raise RuntimeError('broken')
+
+    vc = make_voice_client('xsalsa20_poly1305_lite', loop=loop, scheduler=scheduler)
+    vc.play(BrokenSource(1), after=lambda error: loop.call_soon_threadsafe(future.set_result, error))
+
+    error = await asyncio.wait_for(future, timeout=5)
+    scheduler.close()
+
+    assert isinstance(error, RuntimeError)
+    assert not vc.is_playing()
+
+
+def test_audio_scheduler_closed():
+    scheduler = discord.AudioScheduler()
+    scheduler.close()
+
+    vc = make_voice_client('xsalsa20_poly1305_lite', scheduler=scheduler)
+    with pytest.raises(discord.ClientException):
+        vc.play(FiniteOpusSource(1))
+
+
+class NumberedOpusSource(discord.AudioSource):
+    def __init__(self, frames: int):
+        self.frames = [n.to_bytes(2, 'big') * 10 for n in range(frames)]
+        self.position = 0
+        self.cleaned_up = threading.Event()
+
+    def read(self) -> bytes:
+        if self.position >= len(self.frames):
+            return b''
+        self.position += 1
+        return self.frames[self.position - 1]
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        self.cleaned_up.set()
+
+
+def drain(subscriber, limit=500):
+    frames = []
+    for _ in range(limit):
+        data = subscriber.read()
+        if not data:
+            break
+        if data != discord.opus.OPUS_SILENCE:
+            frames.append(data)
+        time.sleep(0.002)
+    return frames
+
+
+def test_broadcast_fans_out_shared_frames():
+    source = NumberedOpusSource(10)
+    broadcast = discord.BroadcastAudio(source)
+    first = broadcast.subscribe()
+    second = broadcast.subscribe()
+
+    assert broadcast.subscriber_count == 2
+    assert first.is_opus()
+
+    first_frames = drain(first)
+    second_frames = drain(second)
+
+    assert first_frames == source.frames
+    # Subscribers share the very same frame objects instead of copies
+    assert all(a is b for a, b in zip(first_frames, second_frames))
+    assert source.cleaned_up.wait(1)
+    assert broadcast.is_done()
+
+    with pytest.raises(discord.ClientException):
+        broadcast.subscribe()
+
+
+def test_broadcast_late_subscriber_joins_live_edge():
+    source = NumberedOpusSource(20)
+    broadcast = discord.BroadcastAudio(source, buffer=8)
+    early = broadcast.subscribe()
+
+    time.sleep(broadcast.DELAY * 10)
+    late = broadcast.subscribe()
+    late_frames = drain(late)
+
+    assert late_frames[0] != source.frames[0]
+    assert late_frames == source.frames[source.frames.index(late_frames[0]) :]
+
+    # The early subscriber never read, so it fell out of the buffer and skipped ahead
+    early_frames = drain(early)
+    assert early_frames == source.frames[-8:]
+
+
+def test_broadcast_close_when_idle():
+    source = NumberedOpusSource(1000)
+    broadcast = discord.BroadcastAudio(source, close_when_idle=True)
+    subscriber = broadcast.subscribe()
+    subscriber.read()
+
+    subscriber.cleanup()
+    subscriber.cleanup()
+
+    assert broadcast.subscriber_count == 0
+    assert source.cleaned_up.wait(1)
+    assert broadcast.is_done()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.now += delay
+
+
+class ScriptedOpusSource(FiniteOpusSource):
+    def __init__(self, frames: int, clock: FakeClock, read_times=None, blocked_at=None):
+        super().__init__(frames)
+        self.frames = frames
+        self.clock = clock
+        self.read_times = read_times or {}
+        self.blocked_at = blocked_at
+        self.released = threading.Event()
+        self.readers = set()
+
+    def read(self) -> bytes:
+        index = self.frames - self.remaining
+        self.readers.add(threading.current_thread())
+        if index == self.blocked_at:
+            self.released.wait()
+        self.clock.now += self.read_times.get(index, 0.0)
+        return super().read()
+
+
+@pytest.mark.asyncio
+async def test_audio_player_clock_and_stats(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(discord.player, 'time', clock)
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    frames = 25
+
+    vc = make_voice_client('xsalsa20_poly1305_lite', loop=loop)
+    # Reads shorter than a frame are absorbed by the clock, the long one is too late to catch up with
+    source = ScriptedOpusSource(frames, clock, read_times={5: 0.015, 10: 0.015, 15: 0.2})
+    vc.play(source, after=lambda error: loop.call_soon_threadsafe(future.set_result, error))
+    assert await asyncio.wait_for(future, timeout=5) is None
+
+    stats = vc.playback_stats
+    assert stats.frames_played == frames
+    assert stats.packets_sent == frames + 5
+    assert stats.dropped_packets == 0
+    assert stats.resyncs == 1
+    assert stats.underruns == 0
+    assert stats.max_lateness == pytest.approx(0.18)
+    histogram = stats.lateness_histogram()
+    assert histogram[0.001] == frames - 1
+    assert histogram[float('inf')] == 1
+    assert stats.encode_time == 0
+    assert stats.encrypt_time > 0
+    assert stats.to_dict()['frames_played'] == frames
+
+
+@pytest.mark.asyncio
+async def test_audio_player_lookahead(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(discord.player, 'time', clock)
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    frames = 10
+
+    vc = make_voice_client('xsalsa20_poly1305_lite', loop=loop)
+    source = ScriptedOpusSource(frames, clock, blocked_at=3)
+    vc.play(source, after=lambda error: loop.call_soon_threadsafe(future.set_result, error), lookahead=2)
+    player = vc._player
+
+    # The frames read before the blocked read are still sent while it blocks
+    stats = vc.playback_stats
+    for _ in range(500):
+        if stats.frames_played == 3:
+            break
+        await asyncio.sleep(0.01)
+    assert stats.frames_played == 3
+    assert not future.done()
+
+    source.released.set()
+    assert await asyncio.wait_for(future, timeout=5) is None
+    assert stats.frames_played == frames
+    assert stats.underruns >= 1
+    assert len(vc._connection.packets) == frames + 5
+    assert player not in source.readers
+
+    # The reader is done before the source is cleaned up
+    await loop.run_in_executor(None, player.join)
+    assert source.cleaned_up
+    assert not player._reader.is_alive()
+
+
+def test_playback_stats_dropped_packets():
+    vc = make_voice_client('xsalsa20_poly1305_lite')
+
+    def fail(packet):
+        raise OSError('network is unreachable')
+
+    vc._connection.send_packet = fail
+    for _ in range(3):
+        vc.send_audio_packet(OPUS_FRAME, encode=False)
+
+    stats = vc.playback_stats
+    assert stats.packets_sent == 3
+    assert stats.dropped_packets == 3
+
+    stats._record_lateness(0.0005)
+    stats._record_lateness(0.03)
+    stats._record_lateness(1.0)
+    histogram = stats.lateness_histogram()
+    assert histogram[0.001] == 1
+    assert histogram[0.05] == 1
+    assert histogram[float('inf')] == 1
+    assert stats.max_lateness == 1.0
+
+    stats.reset()
+    assert stats.packets_sent == 0
+    assert stats.frames_played == 0